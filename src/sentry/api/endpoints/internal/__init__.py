@@ -5,7 +5,7 @@ from .mail import InternalMailEndpoint
 from .packages import InternalPackagesEndpoint
 from .queue_tasks import InternalQueueTasksEndpoint
 from .quotas import InternalQuotasEndpoint
-from .rpc import InternalRpcServiceEndpoint
+from .rpc import InternalRpcBatchEndpoint, InternalRpcServiceEndpoint
 from .stats import InternalStatsEndpoint
 from .warnings import InternalWarningsEndpoint
 
@@ -18,6 +18,7 @@ __all__ = (
     "InternalQueueTasksEndpoint",
     "InternalQuotasEndpoint",
     "InternalStatsEndpoint",
+    "InternalRpcBatchEndpoint",
     "InternalRpcServiceEndpoint",
     "InternalWarningsEndpoint",
 )
@@ -1,5 +1,13 @@
+from typing import Any
+
 import pydantic
-from rest_framework.exceptions import NotFound, ParseError, PermissionDenied, ValidationError
+from rest_framework.exceptions import (
+    APIException,
+    NotFound,
+    ParseError,
+    PermissionDenied,
+    ValidationError,
+)
 from rest_framework.request import Request
 from rest_framework.response import Response
 from sentry_sdk import Scope, capture_exception
@@ -43,34 +51,75 @@ class InternalRpcServiceEndpoint(Endpoint):
         if not isinstance(arguments, dict):
             raise ParseError
 
-        auth_context = AuthenticationContext()
-        if auth_context_json := arguments.get("auth_context"):
-            try:
-                # Note -- generally, this is NOT set, but only in cases where an RPC needs to invoke code
-                # that depends on the `env.request.user` object.  In that case, the authentication context
-                # includes an authenticated user that will be injected into the global request context
-                # for compatibility.  Notably, this authentication context is *trusted* as the request comes
-                # from within the privileged RPC channel.
-                auth_context = AuthenticationContext.parse_obj(auth_context_json)
-            except pydantic.ValidationError as e:
-                capture_exception()
-                raise ParseError from e
+        result = _dispatch(request, service_name, method_name, arguments)
+        return Response(data=result)
 
+
+def _dispatch(request: Request, service_name: str, method_name: str, arguments: dict) -> Any:
+    auth_context = AuthenticationContext()
+    if auth_context_json := arguments.get("auth_context"):
         try:
-            with auth_context.applied_to_request(request):
-                result = dispatch_to_local_service(service_name, method_name, arguments)
-        except RpcResolutionException as e:
-            capture_exception()
-            raise NotFound from e
-        except SerializableFunctionValueException as e:
+            # Note -- generally, this is NOT set, but only in cases where an RPC needs to invoke code
+            # that depends on the `env.request.user` object.  In that case, the authentication context
+            # includes an authenticated user that will be injected into the global request context
+            # for compatibility.  Notably, this authentication context is *trusted* as the request comes
+            # from within the privileged RPC channel.
+            auth_context = AuthenticationContext.parse_obj(auth_context_json)
+        except pydantic.ValidationError as e:
             capture_exception()
             raise ParseError from e
-        except Exception as e:
-            # Produce more detailed log
-            if in_test_environment():
-                raise Exception(
-                    f"Problem processing rpc service endpoint {service_name}/{method_name}"
-                ) from e
-            capture_exception()
-            raise ValidationError from e
-        return Response(data=result)
+
+    try:
+        with auth_context.applied_to_request(request):
+            return dispatch_to_local_service(service_name, method_name, arguments)
+    except RpcResolutionException as e:
+        capture_exception()
+        raise NotFound from e
+    except SerializableFunctionValueException as e:
+        capture_exception()
+        raise ParseError from e
+    except Exception as e:
+        # Produce more detailed log
+        if in_test_environment():
+            raise Exception(
+                f"Problem processing rpc service endpoint {service_name}/{method_name}"
+            ) from e
+        capture_exception()
+        raise ValidationError from e
+
+
+@all_silo_endpoint
+class InternalRpcBatchEndpoint(InternalRpcServiceEndpoint):
+    """
+    Handles the calls of an `RpcBatch`, one after the other.
+
+    A call that fails does not fail the batch, its error is returned in place
+    of its result instead.
+    """
+
+    def post(self, request: Request) -> Response:
+        if not self._is_authorized(request):
+            raise PermissionDenied
+
+        try:
+            calls = request.data["calls"]
+        except KeyError as e:
+            raise ParseError from e
+        if not isinstance(calls, list) or not all(
+            isinstance(call, dict)
+            and isinstance(call.get("service"), str)
+            and isinstance(call.get("method"), str)
+            and isinstance(call.get("args"), dict)
+            for call in calls
+        ):
+            raise ParseError
+
+        results: list[dict[str, Any]] = []
+        for call in calls:
+            service_name, method_name = call["service"], call["method"]
+            Scope.get_isolation_scope().set_tag("rpc_method", f"{service_name}.{method_name}")
+            try:
+                results.append(_dispatch(request, service_name, method_name, call["args"]))
+            except APIException as e:
+                results.append({"error": f"{e.detail} ({e.status_code} status)"})
+        return Response(data={"meta": {}, "results": results})
@@ -7,6 +7,7 @@ from sentry.api.base import control_silo_endpoint
 from sentry.api.paginator import OffsetPaginator
 from sentry.api.serializers import serialize
 from sentry.constants import ObjectStatus
+from sentry.hybridcloud.rpc.service import rpc_batch
 from sentry.integrations.models.organization_integration import OrganizationIntegration
 from sentry.organizations.services.organization import organization_service
 from sentry.users.api.bases.user import UserEndpoint
@@ -34,13 +35,19 @@ class UserOrganizationIntegrationsEndpoint(UserEndpoint):
             if request.user.id is not None
             else ()
         )
+        # Look up the organizations with one request per region, instead of one per organization.
+        with rpc_batch() as batch:
+            org_contexts = {
+                o.id: batch.call(
+                    organization_service.get_organization_by_id, id=o.id, user_id=request.user.id
+                )
+                for o in organizations
+            }
         organization_ids = []
-        for o in organizations:
-            org_context = organization_service.get_organization_by_id(
-                id=o.id, user_id=request.user.id
-            )
+        for organization_id, result in org_contexts.items():
+            org_context = result.result()
             if org_context and org_context.member and "org:read" in org_context.member.scopes:
-                organization_ids.append(o.id)
+                organization_ids.append(organization_id)
         queryset = OrganizationIntegration.objects.filter(
             organization_id__in=organization_ids,
             status=ObjectStatus.ACTIVE,
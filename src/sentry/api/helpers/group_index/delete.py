@@ -13,6 +13,7 @@ from rest_framework.response import Response
 from sentry import audit_log, eventstream, features
 from sentry.api.base import audit_logger
 from sentry.deletions.tasks.groups import delete_groups as delete_groups_task
+from sentry.grouping.ingest.grouphash_cache import invalidate_grouphash_cache
 from sentry.issues.grouptype import GroupCategory
 from sentry.models.group import Group, GroupStatus
 from sentry.models.grouphash import GroupHash
@@ -77,6 +78,7 @@ def delete_group_list(
     # Removing GroupHash rows prevents new events from associating to the groups
     # we just deleted.
     GroupHash.objects.filter(project_id=project.id, group__id__in=group_ids).delete()
+    invalidate_grouphash_cache([project.id])
 
     # We remove `GroupInbox` rows here so that they don't end up influencing queries for
     # `Group` instances that are pending deletion
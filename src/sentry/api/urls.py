@@ -457,6 +457,7 @@ from .endpoints.internal import (
     InternalPackagesEndpoint,
     InternalQueueTasksEndpoint,
     InternalQuotasEndpoint,
+    InternalRpcBatchEndpoint,
     InternalRpcServiceEndpoint,
     InternalStatsEndpoint,
     InternalWarningsEndpoint,
@@ -3106,6 +3107,11 @@ INTERNAL_URLS = [
         InternalIntegrationProxyEndpoint.as_view(),
         name="sentry-api-0-internal-integration-proxy",
     ),
+    re_path(
+        r"^rpc/batch/$",
+        InternalRpcBatchEndpoint.as_view(),
+        name="sentry-api-0-rpc-batch",
+    ),
     re_path(
         r"^rpc/(?P<service_name>\w+)/(?P<method_name>\w+)/$",
         InternalRpcServiceEndpoint.as_view(),
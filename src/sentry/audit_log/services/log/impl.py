@@ -45,6 +45,10 @@ class DatabaseBackedLogService(LogService):
             if not self._should_skip_invalid_event(event):
                 raise
 
+    def record_audit_logs(self, *, events: list[AuditLogEvent]) -> None:
+        for event in events:
+            self.record_audit_log(event=event)
+
     def record_user_ip(self, *, event: UserIpEvent) -> None:
         UserIP.objects.create_or_update(
             user_id=event.user_id,
@@ -117,6 +121,10 @@ class OutboxBackedLogService(LogService):
         )
         outbox.save()
 
+    def record_audit_logs(self, *, events: list[AuditLogEvent]) -> None:
+        for event in events:
+            self.record_audit_log(event=event)
+
     def record_user_ip(self, *, event: UserIpEvent) -> None:
         outbox = RegionOutbox(
             shard_scope=OutboxScope.USER_IP_SCOPE,
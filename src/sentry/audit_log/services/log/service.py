@@ -25,6 +25,11 @@ class LogService(RpcService):
     def record_audit_log(self, *, event: AuditLogEvent) -> None:
         pass
 
+    @rpc_method
+    @abc.abstractmethod
+    def record_audit_logs(self, *, events: list[AuditLogEvent]) -> None:
+        pass
+
     @rpc_method
     @abc.abstractmethod
     def record_user_ip(self, *, event: UserIpEvent) -> None:
@@ -1744,6 +1744,12 @@ SENTRY_EVENT_PROCESSING_STORE = (
 )
 SENTRY_EVENT_PROCESSING_STORE_OPTIONS: dict[str, str] = {}
 
+# Ingest consumer deduplication backend
+SENTRY_INGEST_DEDUPLICATION_STORE = (
+    "sentry.ingest.deduplication.cache.DjangoCacheEventDeduplicationStore"
+)
+SENTRY_INGEST_DEDUPLICATION_STORE_OPTIONS: dict[str, Any] = {}
+
 # Transactions processing backend
 # If these are set, transactions will be written to a different processing store
 # than errors. If these are set to none, Events(errors) and transactions will
@@ -3299,6 +3305,9 @@ ORGANIZATION_VITALS_OVERVIEW_PROJECT_LIMIT = 300
 # Default string indexer cache options
 SENTRY_STRING_INDEXER_CACHE_OPTIONS = {
     "cache_name": "default",
+    # Size of the per-process LRU in front of the shared cache, 0 disables it.
+    "local_cache_max_size": 0,
+    "local_cache_max_bytes": None,
 }
 SENTRY_POSTGRES_INDEXER_RETRY_COUNT = 2
 
@@ -203,6 +203,12 @@ _METRICS_INDEXER_OPTIONS = [
         default=1,
         type=int,
     ),
+    click.Option(
+        ["shared_string_table_slots", "--shared-string-table-slots"],
+        default=0,
+        type=int,
+        help="Number of slots of the string table shared between processes, 0 disables it.",
+    ),
 ]
 
 _METRICS_LAST_SEEN_UPDATER_OPTIONS = [
@@ -13,6 +13,7 @@ from django.utils.functional import cached_property
 
 from sentry import nodestore
 from sentry.db.models.utils import Creator
+from sentry.options.rollout import in_random_rollout
 from sentry.utils import json
 from sentry.utils.strings import decompress
 
@@ -133,10 +134,37 @@ class NodeData(MutableMapping[str, Any]):
             See documentation of nodestore.
         """
 
+        subkeys = self._get_subkeys_to_write(subkeys)
+        if subkeys is None:
+            return
+
+        if in_random_rollout("nodestore.compressor.rollout"):
+            self._write_deduplicated({self.id: subkeys})
+        else:
+            nodestore.backend.set_subkeys(self.id, subkeys)
+
+    @staticmethod
+    def _write_deduplicated(items: dict[str, dict[str | None, Any]]) -> None:
+        """
+        Write nodes with their repeating interfaces pulled out into shared blobs, see
+        `sentry.eventstore.compressor`. Blobs are written before the nodes referencing them.
+        """
+        # The eventstore package imports the event models, which import this module.
+        from sentry.eventstore import compressor
+
+        items, blobs = compressor.deduplicate_nodes(items, lambda data: data.get("project"))
+        if blobs:
+            nodestore.backend.set_subkeys_multi(
+                blobs, ttl=compressor.get_blob_ttl(nodestore.backend.default_ttl)
+            )
+            compressor.mark_blobs_written(list(blobs))
+        nodestore.backend.set_subkeys_multi(items)
+
+    def _get_subkeys_to_write(self, subkeys):
         # We never loaded any data for reading or writing, so there
         # is nothing to save.
         if self._node_data is None:
-            return
+            return None
 
         # We can't put our wrappers into the nodestore, so we need to
         # ensure that the data is converted into a plain old dict
@@ -146,8 +174,7 @@ class NodeData(MutableMapping[str, Any]):
 
         subkeys = subkeys or {}
         subkeys[None] = to_write
-
-        nodestore.backend.set_subkeys(self.id, subkeys)
+        return subkeys
 
 
 class NodeField(GzippedDictField):
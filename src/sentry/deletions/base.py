@@ -3,14 +3,18 @@ from __future__ import annotations
 import logging
 import re
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from django.db import connections
+
+from sentry import options
 from sentry.constants import ObjectStatus
 from sentry.db.models.base import Model
 from sentry.users.services.user.model import RpcUser
 from sentry.users.services.user.service import user_service
 from sentry.utils import metrics
-from sentry.utils.query import bulk_delete_objects
+from sentry.utils.query import bulk_delete_objects_after
 
 _leaf_re = re.compile(r"^(UserReport|Event|Group)(.+)")
 
@@ -19,6 +23,46 @@ if TYPE_CHECKING:
     from sentry.deletions.manager import DeletionTaskManager
 
 
+def _run_relation(task: BaseDeletionTask[Any]) -> None:
+    # If we want smaller tasks then this also has to return when has_more is true.
+    # This could significant increase the number of tasks we spawn. Get better estimates
+    # by collecting metrics.
+    has_more = True
+    while has_more:
+        has_more = task.chunk()
+        if has_more:
+            metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+
+
+def _run_relation_in_thread(task: BaseDeletionTask[Any]) -> None:
+    try:
+        _run_relation(task)
+    finally:
+        # Every thread opens its own connections, don't leave them behind.
+        connections.close_all()
+
+
+def _plan_children(
+    children: Sequence[tuple[BaseRelation, BaseDeletionTask[Any]]],
+) -> list[list[BaseDeletionTask[Any]]]:
+    """
+    Split child deletion tasks into stages that run one after the other.
+
+    Consecutive relations declared with `parallel=True` share a stage. Every
+    other relation gets a stage of its own, which keeps the order of
+    relations that depend on one another.
+    """
+    stages: list[list[BaseDeletionTask[Any]]] = []
+    previous_parallel = False
+    for relation, task in children:
+        if relation.parallel and previous_parallel:
+            stages[-1].append(task)
+        else:
+            stages.append([task])
+        previous_parallel = relation.parallel
+    return stages
+
+
 def _delete_children(
     manager: DeletionTaskManager,
     relations: Sequence[BaseRelation],
@@ -26,29 +70,49 @@ def _delete_children(
     actor_id: int | None = None,
 ) -> bool:
     # Ideally this runs through the deletion manager
-    for relation in relations:
-        task = manager.get(
-            transaction_id=transaction_id,
-            actor_id=actor_id,
-            task=relation.task,
-            **relation.params,
+    children = [
+        (
+            relation,
+            manager.get(
+                transaction_id=transaction_id,
+                actor_id=actor_id,
+                task=relation.task,
+                **relation.params,
+            ),
         )
+        for relation in relations
+    ]
+
+    concurrency = options.get("deletions.child-relations.concurrency")
+    # Threads use connections of their own, so they can't take part in a
+    # transaction of the caller.
+    if concurrency <= 1 or any(conn.in_atomic_block for conn in connections.all()):
+        for _, task in children:
+            _run_relation(task)
+        return False
 
-        # If we want smaller tasks then this also has to return when has_more is true.
-        # This could significant increase the number of tasks we spawn. Get better estimates
-        # by collecting metrics.
-        has_more = True
-        while has_more:
-            has_more = task.chunk()
-            if has_more:
-                metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for stage in _plan_children(children):
+            if len(stage) == 1:
+                _run_relation(stage[0])
+            else:
+                for future in [executor.submit(_run_relation_in_thread, task) for task in stage]:
+                    future.result()
     return False
 
 
 class BaseRelation:
-    def __init__(self, params: Mapping[str, Any], task: type[BaseDeletionTask[Any]] | None) -> None:
+    def __init__(
+        self,
+        params: Mapping[str, Any],
+        task: type[BaseDeletionTask[Any]] | None,
+        parallel: bool = False,
+    ) -> None:
         self.task = task
         self.params = params
+        # Consecutive relations marked as parallel may be deleted concurrently, so
+        # they must not reference each other.
+        self.parallel = parallel
 
     def __repr__(self) -> str:
         class_type = type(self)
@@ -62,13 +126,14 @@ class ModelRelation(BaseRelation):
         query: Mapping[str, Any],
         task: type[BaseDeletionTask[Any]] | None = None,
         partition_key: str | None = None,
+        parallel: bool = False,
     ) -> None:
         params = {"model": model, "query": query}
 
         if partition_key:
             params["partition_key"] = partition_key
 
-        super().__init__(params=params, task=task)
+        super().__init__(params=params, task=task, parallel=parallel)
 
 
 ModelT = TypeVar("ModelT", bound=Model)
@@ -280,22 +345,26 @@ class BulkModelDeletionTask(ModelDeletionTask[ModelT]):
         super().__init__(manager, model, query, **kwargs)
 
         self.partition_key = partition_key
+        # Largest id deleted so far, the next chunk starts after it.
+        self.last_id: int | None = None
 
     def chunk(self) -> bool:
         return self._delete_instance_bulk()
 
     def _delete_instance_bulk(self) -> bool:
+        model_name = self.model.__name__
         try:
-            return bulk_delete_objects(
-                model=self.model,
-                limit=self.chunk_size,
-                transaction_id=self.transaction_id,
-                partition_key=self.partition_key,
-                **self.query,
-            )
+            with metrics.timer("deletions.bulk.duration", tags={"model": model_name}):
+                deleted, last_id = bulk_delete_objects_after(
+                    model=self.model,
+                    after_id=self.last_id,
+                    limit=self.chunk_size,
+                    partition_key=self.partition_key,
+                    **self.query,
+                )
+            metrics.incr("deletions.bulk.rows", amount=deleted, tags={"model": model_name})
         finally:
             # Don't log Group and Event child object deletions.
-            model_name = self.model.__name__
             if not _leaf_re.search(model_name):
                 self.logger.info(
                     "object.delete.bulk_executed",
@@ -308,3 +377,12 @@ class BulkModelDeletionTask(ModelDeletionTask[ModelT]):
                         **self.query,
                     ),
                 )
+
+        if deleted == self.chunk_size:
+            self.last_id = last_id
+            return True
+
+        # The end of the table was reached. Rows that were added behind the
+        # cursor in the meantime are picked up by a final pass from the start.
+        self.last_id = None
+        return deleted > 0
@@ -10,6 +10,7 @@ from snuba_sdk import DeleteQuery, Request
 
 from sentry import eventstore, eventstream, features, models, nodestore
 from sentry.eventstore.models import Event
+from sentry.grouping.ingest.grouphash_cache import invalidate_grouphash_cache
 from sentry.issues.grouptype import GroupCategory
 from sentry.models.group import Group, GroupStatus
 from sentry.models.rulefirehistory import RuleFireHistory
@@ -280,6 +281,7 @@ class GroupDeletionTask(ModelDeletionTask[Group]):
                     )
 
         self.delete_children(child_relations)
+        invalidate_grouphash_cache({group.project_id for group in instance_list})
 
     def delete_instance(self, instance: Group) -> None:
         from sentry import similarity
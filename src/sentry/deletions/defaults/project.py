@@ -51,7 +51,7 @@ class ProjectDeletionTask(ModelDeletionTask[Project]):
             ModelRelation(ProjectKey, {"project_id": instance.id})
         ]
 
-        # in bulk
+        # in bulk, these don't reference each other so they may be deleted concurrently
         for m1 in (
             Activity,
             AlertRuleProjects,
@@ -69,12 +69,7 @@ class ProjectDeletionTask(ModelDeletionTask[Project]):
             ReleaseThreshold,
             ProjectTeam,
             PromptsActivity,
-            # order matters, ProjectCodeOwners to be deleted before RepositoryProjectPathConfig
-            ProjectCodeOwners,
             ReplayRecordingSegment,
-            RepositoryProjectPathConfig,
-            ServiceHookProject,
-            ServiceHook,
             UserReport,
             ProjectTransactionThreshold,
             # NOTE: Removing the project relation from `ProjectArtifactBundle` may
@@ -84,6 +79,18 @@ class ProjectDeletionTask(ModelDeletionTask[Project]):
             ProguardArtifactRelease,
             DiscoverSavedQueryProject,
             IncidentProject,
+        ):
+            relations.append(
+                ModelRelation(m1, {"project_id": instance.id}, BulkModelDeletionTask, parallel=True)
+            )
+
+        # in bulk, one after the other
+        for m1 in (
+            # order matters, ProjectCodeOwners to be deleted before RepositoryProjectPathConfig
+            ProjectCodeOwners,
+            RepositoryProjectPathConfig,
+            ServiceHookProject,
+            ServiceHook,
         ):
             relations.append(ModelRelation(m1, {"project_id": instance.id}, BulkModelDeletionTask))
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from sentry.digests.types import Record
@@ -66,7 +66,16 @@ class Backend(Service):
     be transitioned to "waiting" instead.)
     """
 
-    __all__ = ("add", "delete", "digest", "enabled", "maintenance", "schedule", "validate")
+    __all__ = (
+        "add",
+        "delete",
+        "digest",
+        "digest_many",
+        "enabled",
+        "maintenance",
+        "schedule",
+        "validate",
+    )
 
     def __init__(self, **options: Any) -> None:
         # The ``minimum_delay`` option defines the default minimum amount of
@@ -176,6 +185,28 @@ class Backend(Service):
         """
         raise NotImplementedError
 
+    def digest_many(
+        self,
+        keys: Sequence[str],
+        minimum_delays: Mapping[str, int] | None = None,
+        timestamp: float | None = None,
+    ) -> Any:
+        """
+        Extract records from several timelines for processing at once.
+
+        This behaves like ``digest``, except that the target of the ``as``
+        clause is a mapping of timeline key to the records of its digest.
+        Timelines that are not in the ready state (or that are being digested
+        elsewhere) are left out of the mapping instead of raising
+        ``InvalidState``. ``minimum_delays`` maps timeline keys to their
+        minimum delay, the backend default is used for missing keys.
+
+        All timelines in the mapping are closed together when the context
+        manager successfully exits, or left as they are if an exception is
+        raised.
+        """
+        raise NotImplementedError
+
     def schedule(self, deadline: float, timestamp: float | None = None) -> Iterable[ScheduleEntry]:
         """
         Identify timelines that are ready for processing.
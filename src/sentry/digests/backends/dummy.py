@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
@@ -27,6 +27,15 @@ class DummyBackend(Backend):
     def digest(self, key: str, minimum_delay: int | None = None) -> Any:
         yield []
 
+    @contextmanager
+    def digest_many(
+        self,
+        keys: Sequence[str],
+        minimum_delays: Mapping[str, int] | None = None,
+        timestamp: float | None = None,
+    ) -> Any:
+        yield {}
+
     def schedule(
         self, deadline: float, timestamp: float | None = None
     ) -> Iterable["ScheduleEntry"]:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Generator, Iterable
-from contextlib import contextmanager
+from collections import defaultdict
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from contextlib import ExitStack, contextmanager
 from typing import Any
 
 from rb.clients import LocalClient
@@ -11,6 +12,8 @@ from redis.exceptions import ResponseError
 
 from sentry.digests.backends.base import Backend, InvalidState, ScheduleEntry
 from sentry.digests.types import Record
+from sentry.utils import metrics
+from sentry.utils.locking import UnableToAcquireLock
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -97,6 +100,9 @@ class RedisBackend(Backend):
     def _get_connection(self, key: str) -> LocalClient:
         return self.cluster.get_local_client_for_key(f"{self.namespace}:t:{key}")
 
+    def _get_host(self, key: str) -> int:
+        return self.cluster.get_router().get_host_for_key(f"{self.namespace}:t:{key}")
+
     def _get_timeline_lock(self, key: str, duration: int) -> Lock:
         lock_key = f"{self.namespace}:t:{key}"
         return self.locks.get(
@@ -219,34 +225,117 @@ class RedisBackend(Backend):
                 else:
                     raise
 
-            records = [
-                Record(key.decode(), self.codec.decode(value), float(timestamp))
-                for key, value, timestamp in response
-                if value is not None
-            ]
-
-            # If the record value is `None`, this means the record data was
-            # missing (it was presumably evicted by Redis) so we don't need to
-            # return it here.
-            filtered_records = [record for record in records if record.value is not None]
-            if len(records) != len(filtered_records):
-                logger.warning(
-                    "Filtered out missing records when fetching digest",
-                    extra={
-                        "key": key,
-                        "record_count": len(records),
-                        "filtered_record_count": len(filtered_records),
-                    },
-                )
-            yield filtered_records
+            yield self._decode_records(key, response)
 
             script(
                 [key],
                 ["DIGEST_CLOSE", self.namespace, self.ttl, timestamp, key, minimum_delay]
-                + [record.key for record in records],
+                + [record_key.decode() for record_key, value, _ in response if value is not None],
                 connection,
             )
 
+    def _decode_records(
+        self, key: str, response: Iterable[tuple[bytes, bytes, bytes]]
+    ) -> list[Record]:
+        records = [
+            Record(record_key.decode(), self.codec.decode(value), float(timestamp))
+            for record_key, value, timestamp in response
+            if value is not None
+        ]
+
+        # If the record value is `None`, this means the record data was
+        # missing (it was presumably evicted by Redis) so we don't need to
+        # return it here.
+        filtered_records = [record for record in records if record.value is not None]
+        if len(records) != len(filtered_records):
+            logger.warning(
+                "Filtered out missing records when fetching digest",
+                extra={
+                    "key": key,
+                    "record_count": len(records),
+                    "filtered_record_count": len(filtered_records),
+                },
+            )
+        return filtered_records
+
+    @contextmanager
+    def digest_many(
+        self,
+        keys: Sequence[str],
+        minimum_delays: Mapping[str, int] | None = None,
+        timestamp: float | None = None,
+    ) -> Generator[dict[str, list[Record]]]:
+        if minimum_delays is None:
+            minimum_delays = {}
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        keys_by_host: dict[int, list[str]] = defaultdict(list)
+        for key in keys:
+            keys_by_host[self._get_host(key)].append(key)
+
+        with ExitStack() as stack:
+            # Timelines that are being digested elsewhere are skipped, the
+            # same as timelines that are no longer in the ready state.
+            locked: dict[int, list[str]] = defaultdict(list)
+            for host, host_keys in keys_by_host.items():
+                for key in host_keys:
+                    try:
+                        stack.enter_context(self._get_timeline_lock(key, duration=30).acquire())
+                    except UnableToAcquireLock:
+                        logger.info("Skipped digest of locked timeline", extra={"key": key})
+                        continue
+                    locked[host].append(key)
+
+            # One script invocation per host opens all of its timelines.
+            digests: dict[str, list[Record]] = {}
+            record_keys: dict[str, list[str]] = {}
+            for host, host_keys in locked.items():
+                response = script(
+                    host_keys,
+                    [
+                        "DIGEST_OPEN_MANY",
+                        self.namespace,
+                        self.ttl,
+                        timestamp,
+                        self.capacity if self.capacity else -1,
+                    ]
+                    + host_keys,
+                    self.cluster.get_local_client(host),
+                )
+                for key, entry in zip(host_keys, response):
+                    if not entry:
+                        continue
+                    _, timeline = entry
+                    record_keys[key] = [
+                        record_key.decode()
+                        for record_key, value, _ in timeline
+                        if value is not None
+                    ]
+                    digests[key] = self._decode_records(key, timeline)
+
+            metrics.distribution("digests.digest_many.size", len(digests))
+            yield digests
+
+            for host, host_keys in locked.items():
+                arguments: list[Any] = []
+                for key in host_keys:
+                    if key not in record_keys:
+                        continue
+                    arguments += [
+                        key,
+                        minimum_delays.get(key, self.minimum_delay),
+                        len(record_keys[key]),
+                        *record_keys[key],
+                    ]
+                if arguments:
+                    script(
+                        host_keys,
+                        ["DIGEST_CLOSE_MANY", self.namespace, self.ttl, timestamp] + arguments,
+                        self.cluster.get_local_client(host),
+                    )
+
     def delete(self, key: str, timestamp: float | None = None) -> None:
         if timestamp is None:
             timestamp = time.time()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import NamedTuple, TypeAlias
 
 from sentry import tsdb
@@ -25,11 +25,9 @@ class DigestInfo(NamedTuple):
     user_counts: dict[int, int]
 
 
-def split_key(
-    key: str,
-) -> tuple[Project, ActionTargetType, str | None, FallthroughChoiceType | None]:
+def _parse_key(key: str) -> tuple[int, ActionTargetType, str | None, FallthroughChoiceType | None]:
     key_parts = key.split(":", 5)
-    project_id = key_parts[2]
+    project_id = int(key_parts[2])
     # XXX: We transitioned to new style keys (len == 5) a while ago on
     # sentry.io. But self-hosted users might transition at any time, so we need
     # to keep this transition code around for a while, maybe indefinitely.
@@ -48,9 +46,37 @@ def split_key(
         target_type = ActionTargetType.ISSUE_OWNERS
         target_identifier = None
         fallthrough_choice = None
+    return project_id, target_type, target_identifier, fallthrough_choice
+
+
+def split_key(
+    key: str,
+) -> tuple[Project, ActionTargetType, str | None, FallthroughChoiceType | None]:
+    project_id, target_type, target_identifier, fallthrough_choice = _parse_key(key)
     return Project.objects.get(pk=project_id), target_type, target_identifier, fallthrough_choice
 
 
+def split_keys(
+    keys: Iterable[str],
+) -> dict[str, tuple[Project, ActionTargetType, str | None, FallthroughChoiceType | None]]:
+    """
+    Split several timeline keys, loading all of their projects with a single
+    query. Keys of projects which don't exist (anymore) are left out.
+    """
+    parsed = {key: _parse_key(key) for key in keys}
+    projects = {
+        project.id: project
+        for project in Project.objects.filter(
+            id__in={project_id for project_id, _, _, _ in parsed.values()}
+        )
+    }
+    return {
+        key: (projects[project_id], target_type, target_identifier, fallthrough_choice)
+        for key, (project_id, target_type, target_identifier, fallthrough_choice) in parsed.items()
+        if project_id in projects
+    }
+
+
 def unsplit_key(
     project: Project,
     target_type: ActionTargetType,
@@ -150,10 +176,9 @@ def _build_digest_impl(
     return _sort_digest(grouped, event_counts=event_counts, user_counts=user_counts)
 
 
-def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
-    if not records:
-        return DigestInfo({}, {}, {})
-
+def _get_counts(
+    project: Project, records: Sequence[Record], group_ids: list[int]
+) -> tuple[dict[int, int], dict[int, int]]:
     # This reads a little strange, but remember that records are returned in
     # reverse chronological order, and we query the database in chronological
     # order.
@@ -161,15 +186,6 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
     start = records[-1].datetime
     end = records[0].datetime
 
-    groups = Group.objects.in_bulk(record.value.event.group_id for record in records)
-    group_ids = list(groups)
-    rules = Rule.objects.in_bulk(rule_id for record in records for rule_id in record.value.rules)
-
-    for group_id, g in groups.items():
-        assert g.project_id == project.id, "Group must belong to Project"
-    for rule_id, rule in rules.items():
-        assert rule.project_id == project.id, "Rule must belong to Project"
-
     tenant_ids = {"organization_id": project.organization_id}
     event_counts = tsdb.backend.get_sums(
         TSDBModel.group,
@@ -185,7 +201,69 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
         end,
         tenant_ids=tenant_ids,
     )
+    return event_counts, user_counts
+
+
+def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
+    if not records:
+        return DigestInfo({}, {}, {})
+
+    groups = Group.objects.in_bulk(record.value.event.group_id for record in records)
+    group_ids = list(groups)
+    rules = Rule.objects.in_bulk(rule_id for record in records for rule_id in record.value.rules)
+
+    for group_id, g in groups.items():
+        assert g.project_id == project.id, "Group must belong to Project"
+    for rule_id, rule in rules.items():
+        assert rule.project_id == project.id, "Rule must belong to Project"
+
+    event_counts, user_counts = _get_counts(project, records, group_ids)
 
     digest = _build_digest_impl(records, groups, rules, event_counts, user_counts)
 
     return DigestInfo(digest, event_counts, user_counts)
+
+
+def build_digests(digests: Mapping[str, tuple[Project, Sequence[Record]]]) -> dict[str, DigestInfo]:
+    """
+    Build the digests of several timelines, keyed by timeline key.
+
+    The groups and rules of all digests are loaded together, and the events
+    are bound to their (already loaded) project.
+    """
+    records = [record for _, project_records in digests.values() for record in project_records]
+    groups = Group.objects.in_bulk({record.value.event.group_id for record in records})
+    rules = Rule.objects.in_bulk({rule_id for record in records for rule_id in record.value.rules})
+
+    results = {}
+    for key, (project, project_records) in digests.items():
+        if not project_records:
+            results[key] = DigestInfo({}, {}, {})
+            continue
+
+        # Records can only reference groups and rules of their own project,
+        # anything else is left unbound as if it didn't exist.
+        project_groups = {}
+        project_rules = {}
+        for record in project_records:
+            if record.value.event.project_id == project.id:
+                record.value.event.project = project
+            group = groups.get(record.value.event.group_id)
+            if group is not None and group.project_id == project.id:
+                project_groups[group.id] = group
+            for rule_id in record.value.rules:
+                rule = rules.get(rule_id)
+                if rule is not None and rule.project_id == project.id:
+                    project_rules[rule.id] = rule
+
+        # Without any groups the digest is empty, and there is nothing to count.
+        if project_groups:
+            event_counts, user_counts = _get_counts(project, project_records, list(project_groups))
+        else:
+            event_counts, user_counts = {}, {}
+        digest = _build_digest_impl(
+            project_records, project_groups, project_rules, event_counts, user_counts
+        )
+        results[key] = DigestInfo(digest, event_counts, user_counts)
+
+    return results
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ipaddress
 import logging
+import time
 import uuid
 from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
@@ -100,6 +101,7 @@ from sentry.models.releaseenvironment import ReleaseEnvironment
 from sentry.models.releaseprojectenvironment import ReleaseProjectEnvironment
 from sentry.models.releases.release_project import ReleaseProject
 from sentry.net.http import connection_from_url
+from sentry.options.rollout import in_random_rollout
 from sentry.plugins.base import plugins
 from sentry.quotas.base import index_data_category
 from sentry.receivers.features import record_event_processed
@@ -130,6 +132,7 @@ from sentry.utils.circuit_breaker import (
 from sentry.utils.dates import to_datetime
 from sentry.utils.event import has_event_minified_stack_trace, has_stacktrace, is_handled
 from sentry.utils.eventuser import EventUser
+from sentry.utils.lru import LRUCache
 from sentry.utils.metrics import MutableTags
 from sentry.utils.outcomes import Outcome, track_outcome
 from sentry.utils.performance_issues.performance_detection import detect_performance_problems
@@ -1809,6 +1812,9 @@ def _process_existing_aggregate(
         # cast to an int, as we don't want to pickle enums into task args.
         updated_group_values["data"]["metadata"]["initial_priority"] = int(initial_priority)
 
+    if in_random_rollout("store.hot-group-cache.rollout"):
+        updated_group_values = _get_group_values_to_buffer(group.id, updated_group_values)
+
     # We pass `times_seen` separately from all of the other columns so that `buffer_inr` knows to
     # increment rather than overwrite the existing value
     buffer_incr(Group, {"times_seen": 1}, {"id": group.id}, updated_group_values)
@@ -1816,6 +1822,59 @@ def _process_existing_aggregate(
     return bool(is_regression)
 
 
+# Groups receiving lots of events get updated with the same values over and over again, so the
+# values a process buffered for a group are remembered for a while, and unchanged ones aren't
+# buffered again. `last_seen` is only buffered again once it moves to another bucket, so a group's
+# `last_seen` lags behind by at most one bucket. Entries expire `HOT_GROUP_CACHE_TTL` seconds after
+# they were created, at which point all values are buffered again, which bounds how long a value
+# written by another process (or by a merge, an unmerge, ...) can go without being overwritten.
+HOT_GROUP_CACHE_TTL = 60
+HOT_GROUP_CACHE_MAX_SIZE = 5000
+HOT_GROUP_LAST_SEEN_BUCKET = 10
+
+_hot_groups: LRUCache[int, tuple[float, dict[str, Any]]] = LRUCache(HOT_GROUP_CACHE_MAX_SIZE)
+
+
+def _get_group_values_to_buffer(group_id: int, group_values: dict[str, Any]) -> dict[str, Any]:
+    """
+    Filter out the values which were buffered for the group by this process already, see
+    `HOT_GROUP_CACHE_TTL`.
+    """
+    now = time.monotonic()
+    comparable_values = {
+        **group_values,
+        "last_seen": int(group_values["last_seen"].timestamp()) // HOT_GROUP_LAST_SEEN_BUCKET,
+    }
+
+    entry = _hot_groups.get(group_id)
+    if entry is None:
+        metrics.incr("event_manager.hot_group_cache.miss", sample_rate=1.0)
+        _hot_groups.set(
+            group_id, (now + HOT_GROUP_CACHE_TTL, comparable_values), HOT_GROUP_CACHE_TTL
+        )
+        return group_values
+
+    metrics.incr("event_manager.hot_group_cache.hit", sample_rate=1.0)
+    expires_at, buffered_values = entry
+    values_to_buffer = {
+        key: group_values[key]
+        for key, value in comparable_values.items()
+        if key not in buffered_values or buffered_values[key] != value
+    }
+    metrics.incr(
+        "event_manager.hot_group_cache.skipped_values",
+        amount=len(group_values) - len(values_to_buffer),
+        sample_rate=1.0,
+    )
+
+    if values_to_buffer:
+        # Keep the original expiry, so the entry can't be kept alive by a changing value
+        _hot_groups.set(
+            group_id, (expires_at, {**buffered_values, **comparable_values}), expires_at - now
+        )
+    return values_to_buffer
+
+
 severity_connection_pool = connection_from_url(
     settings.SEER_SEVERITY_URL,
     retries=settings.SEER_SEVERITY_RETRIES,
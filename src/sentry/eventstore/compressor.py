@@ -3,18 +3,50 @@ Eventstore compressor is responsible for pulling out repeating data across
 events such that they can be stored only once. For example SDK modules list, or
 debug_meta.
 
-This is not used in production yet, we are still collecting metrics there.
+Interfaces are split into a part which is likely shared by many events (the
+"blob") and a part which is stored inline with the event. Blobs are addressed
+by a checksum of their contents, so events with the same blob reference the
+same node. Whether events are stored this way is controlled by the
+`nodestore.compressor.rollout` option.
+
+Blobs outlive the events referencing them: a process rewrites a blob when it
+is used at least `BLOB_REWRITE_INTERVAL` after the process last wrote it, and
+blobs are kept that much longer than events. Blobs aren't deleted along with
+events, as other events of the project may still reference them. They expire
+at most `BLOB_REWRITE_INTERVAL` after the last event referencing them. Blobs
+only hold descriptions of the host and of the SDK, and no fields that may
+identify a user.
 """
 
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Callable, Mapping
+from datetime import timedelta
 from typing import Any
 
 import orjson
 
+from sentry.utils import metrics
+from sentry.utils.lru import LRUCache
+
 _INTERFACES = {}
 
+PATCHSETS_KEY = "__nodestore_patchsets"
+
+# Blobs are stored as nodes under their checksum with this prefix
+BLOB_ID_PREFIX = "b:"
+
+# Interfaces whose blob would be smaller than this are left inline when events are saved, as
+# fetching them would cost more than storing them with every event.
+MIN_BLOB_SIZE = 256
+
+# Blobs are rewritten when they are used by an event at least this long after this process last
+# wrote them, which refreshes their TTL in nodestore.
+BLOB_REWRITE_INTERVAL = 60 * 60
+
+_written_blobs: LRUCache[str, bool] = LRUCache(10_000)
+
 
 def _deduplicate_interface(*keys):
     def inner(f):
@@ -34,11 +66,14 @@ class DebugMeta:
     def encode(data):
         dedup: dict[str, list[str | Any]] = {}
 
-        if data:
-            for image in data.get("images") or []:
-                image = image or {}
+        if data and data.get("images"):
+            images = []
+            for image in data["images"]:
+                image = dict(image or {})
                 for name in DebugMeta._DEDUP_FIELDS:
                     dedup.setdefault(name, []).append(image.pop(name, None))
+                images.append(image)
+            data = {**data, "images": images}
 
         return dedup, data
 
@@ -54,7 +89,86 @@ class DebugMeta:
         return data
 
 
-def deduplicate(data):
+@_deduplicate_interface("modules", "sdk")
+class WholeInterface:
+    """
+    Interfaces which are the same for every event of a release, like the modules an app was
+    built with, are stored as a blob as a whole.
+    """
+
+    @staticmethod
+    def encode(data):
+        return data, None
+
+    @staticmethod
+    def decode(dedup, data):
+        return dedup
+
+
+@_deduplicate_interface("contexts")
+class Contexts:
+    # The fields of a context which describe the host the event was captured on. The remaining
+    # fields describe its state at the time of the event (like free memory) or may identify a
+    # user (like the device name), and are stored inline.
+    _DEDUP_FIELDS = {
+        "os": ("name", "version", "build", "kernel_version", "raw_description", "rooted"),
+        "device": (
+            "family",
+            "model",
+            "model_id",
+            "arch",
+            "manufacturer",
+            "brand",
+            "simulator",
+            "memory_size",
+            "storage_size",
+            "screen_resolution",
+            "screen_density",
+            "screen_dpi",
+            "processor_count",
+            "processor_frequency",
+            "cpu_description",
+        ),
+        "runtime": ("name", "version", "build", "raw_description"),
+    }
+
+    @staticmethod
+    def encode(data):
+        dedup: dict[str, dict[str, Any]] = {}
+
+        if isinstance(data, Mapping):
+            data = dict(data)
+            for alias, fields in Contexts._DEDUP_FIELDS.items():
+                context = data.get(alias)
+                if not isinstance(context, Mapping):
+                    continue
+                context = dict(context)
+                dedup[alias] = {name: context.pop(name) for name in fields if name in context}
+                data[alias] = context
+
+        return dedup, data
+
+    @staticmethod
+    def decode(dedup, data):
+        if data:
+            for alias, fields in dedup.items():
+                context = data.get(alias)
+                if isinstance(context, dict):
+                    context.update(fields)
+
+        return data
+
+
+def deduplicate(data, namespace=None, min_size=0):
+    """
+    Pull the shared parts of the interfaces of an event out into blobs.
+
+    Returns the remaining event, which references the blobs, along with the blobs by checksum.
+    The event passed in is left untouched. Checksums are scoped to `namespace` if given, so that
+    blobs aren't shared across namespaces. Interfaces whose blob would be smaller than `min_size`
+    bytes are left as they are.
+    """
+    data = dict(data)
     patchsets = []
     extra_keys = {}
 
@@ -62,31 +176,99 @@ def deduplicate(data):
         if key not in data:
             continue
 
-        to_deduplicate, to_inline = interface.encode(data.pop(key))
+        to_deduplicate, to_inline = interface.encode(data[key])
         to_deduplicate_serialized = orjson.dumps(to_deduplicate)
+        if len(to_deduplicate_serialized) < min_size:
+            continue
+
+        if namespace is not None:
+            to_deduplicate_serialized = f"{namespace}:".encode() + to_deduplicate_serialized
         checksum = hashlib.md5(to_deduplicate_serialized).hexdigest()
+        del data[key]
         extra_keys[checksum] = to_deduplicate
         patchsets.append([key, checksum, to_inline])
 
     if patchsets:
-        data["__nodestore_patchsets"] = patchsets
+        data[PATCHSETS_KEY] = patchsets
 
     return data, extra_keys
 
 
+def get_checksums(data) -> list[str]:
+    """The checksums of the blobs referenced by an event."""
+    if not isinstance(data, dict):
+        return []
+    return [checksum for _, checksum, _ in data.get(PATCHSETS_KEY) or ()]
+
+
 def assemble(data, get_extra_keys):
-    if not data.get("__nodestore_patchsets"):
+    if not data.get(PATCHSETS_KEY):
         return data
 
     checksums = []
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
+    for key, checksum, inlined in data[PATCHSETS_KEY]:
         checksums.append(checksum)
 
     deduplicated_interfaces = get_extra_keys(checksums)
 
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
-        deduplicated = deduplicated_interfaces[checksum]
+    for key, checksum, inlined in data[PATCHSETS_KEY]:
+        deduplicated = deduplicated_interfaces.get(checksum)
+        if deduplicated is None:
+            # The blob expired before the event referencing it. Keep whatever was stored inline.
+            metrics.incr("nodestore.compressor.missing_blob", tags={"interface": key})
+            if inlined is not None:
+                data[key] = inlined
+            continue
         data[key] = _INTERFACES[key].decode(deduplicated, inlined)
 
-    del data["__nodestore_patchsets"]
+    del data[PATCHSETS_KEY]
     return data
+
+
+def get_blob_id(checksum: str) -> str:
+    return f"{BLOB_ID_PREFIX}{checksum}"
+
+
+def deduplicate_nodes(
+    items: dict[str, dict[str | None, Any]], get_namespace: Callable[[Any], Any]
+) -> tuple[dict[str, dict[str | None, Any]], dict[str, dict[str | None, Any]]]:
+    """
+    Deduplicate the main values of nodes about to be written to nodestore, see `deduplicate`.
+
+    Returns the nodes to write along with the blobs they reference which have to be written
+    first. Blobs this process wrote recently are left out.
+    """
+    blobs: dict[str, dict[str | None, Any]] = {}
+    for subkeys in items.values():
+        data = subkeys[None]
+        subkeys[None], extra_keys = deduplicate(
+            data, namespace=get_namespace(data), min_size=MIN_BLOB_SIZE
+        )
+        for checksum, blob in extra_keys.items():
+            blob_id = get_blob_id(checksum)
+            if not _written_blobs.get(blob_id):
+                blobs[blob_id] = {None: blob}
+        metrics.incr(
+            "nodestore.compressor.deduplicated_interfaces", len(extra_keys), sample_rate=1.0
+        )
+
+    return items, blobs
+
+
+def get_blob_ttl(default_ttl: timedelta | None) -> timedelta | None:
+    """
+    The TTL of blobs in a nodestore which keeps nodes for `default_ttl`. A blob may be written up to
+    `BLOB_REWRITE_INTERVAL` before the last event referencing it, so it is kept that much longer.
+    """
+    if default_ttl is None:
+        return None
+    return default_ttl + timedelta(seconds=BLOB_REWRITE_INTERVAL)
+
+
+def mark_blobs_written(blob_ids: list[str]) -> None:
+    for blob_id in blob_ids:
+        _written_blobs.set(blob_id, True, ttl=BLOB_REWRITE_INTERVAL)
+
+
+def clear_written_blobs() -> None:
+    _written_blobs.clear()
@@ -1,8 +1,8 @@
-from sentry.utils.codecs import BytesCodec, JSONCodec
 from sentry.utils.kvstore.bigtable import BigtableKVStorage
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 
 from .base import EventProcessingStore
+from .codec import EventProcessingStoreCodec
 
 
 class BigtableEventProcessingStore(EventProcessingStore):
@@ -17,6 +17,6 @@ class BigtableEventProcessingStore(EventProcessingStore):
         super().__init__(
             KVStorageCodecWrapper(
                 BigtableKVStorage(**options),
-                JSONCodec() | BytesCodec(),  # maintains functional parity with cache backend
+                EventProcessingStoreCodec(),
             )
         )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any
+
+import msgpack
+import zstandard
+
+from sentry import options
+from sentry.utils import json
+from sentry.utils.codecs import Codec
+
+# Every encoding except JSON prefixes the payload with a format byte. None of them can be the
+# first byte of a JSON document, so payloads written before the format byte was introduced are
+# still read as JSON.
+FORMAT_MSGPACK = 0x01
+FORMAT_MSGPACK_ZSTD = 0x02
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+ENCODING_MSGPACK_ZSTD = "msgpack+zstd"
+ENCODINGS = (ENCODING_JSON, ENCODING_MSGPACK, ENCODING_MSGPACK_ZSTD)
+
+# Smaller payloads are stored uncompressed even with `msgpack+zstd`, as compression barely helps
+# them.
+ZSTD_MIN_SIZE = 1024
+ZSTD_LEVEL = 3
+
+_local = threading.local()
+
+
+def _get_compressor() -> zstandard.ZstdCompressor:
+    # Compression contexts are expensive to create but can't be shared between threads.
+    compressor = getattr(_local, "compressor", None)
+    if compressor is None:
+        compressor = _local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor
+
+
+def _get_decompressor() -> zstandard.ZstdDecompressor:
+    decompressor = getattr(_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _pack(value: Any) -> bytes:
+    # Types msgpack can't represent are converted the same way as when encoding JSON.
+    return msgpack.packb(value, use_bin_type=True, default=json.better_default_encoder)
+
+
+def _is_json_compatible(value: Any) -> bool:
+    """
+    Whether msgpack decodes the value to the same data as JSON does. JSON turns dictionary keys
+    into strings, bytes into text and non-finite floats into null, while msgpack keeps them as
+    they are.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key in item:
+                if not isinstance(key, str):
+                    return False
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, (bytes, bytearray, memoryview)):
+            return False
+        elif isinstance(item, float) and not math.isfinite(item):
+            return False
+    return True
+
+
+def _unpack(value: bytes) -> Any:
+    return msgpack.unpackb(value, raw=False, strict_map_key=False)
+
+
+class EventProcessingStoreCodec(Codec[Any, bytes]):
+    """
+    Encodes events stored in the processing store.
+
+    Events are written in the encoding configured with the `eventstore.processing.encoding` option,
+    unless an encoding is passed to the constructor. Events in any encoding can be read
+    regardless, so the encoding can be switched while events are in flight.
+
+    Events are decoded to the same data regardless of their encoding. Unlike JSON, msgpack keeps
+    non-string dictionary keys, binary strings and non-finite floats as they are, so events
+    containing any of them are written as JSON instead. So are events msgpack can't encode at all
+    (like integers over 64 bits).
+    """
+
+    def __init__(self, encoding: str | None = None):
+        if encoding is not None and encoding not in ENCODINGS:
+            raise ValueError(f"Unknown processing store encoding: {encoding}")
+        self.encoding = encoding
+
+    def encode(self, value: Any) -> bytes:
+        encoding = self.encoding or options.get("eventstore.processing.encoding")
+        if encoding in (ENCODING_MSGPACK, ENCODING_MSGPACK_ZSTD) and _is_json_compatible(value):
+            try:
+                packed = _pack(value)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            else:
+                if encoding == ENCODING_MSGPACK_ZSTD and len(packed) >= ZSTD_MIN_SIZE:
+                    return bytes((FORMAT_MSGPACK_ZSTD,)) + _get_compressor().compress(packed)
+                return bytes((FORMAT_MSGPACK,)) + packed
+
+        return json.dumps(value).encode("utf-8")
+
+    def decode(self, value: bytes) -> Any:
+        if not value:
+            raise ValueError("Empty processing store payload")
+
+        value_format = value[0]
+        if value_format == FORMAT_MSGPACK:
+            return _unpack(memoryview(value)[1:])
+        if value_format == FORMAT_MSGPACK_ZSTD:
+            return _unpack(_get_decompressor().decompress(memoryview(value)[1:]))
+        return json.loads(value.decode("utf-8"))
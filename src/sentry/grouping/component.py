@@ -150,6 +150,20 @@ class BaseGroupingComponent[ValuesType: str | int | BaseGroupingComponent[Any]](
         copy.values = list(self.values)
         return copy
 
+    def deep_copy(self) -> Self:
+        """Creates a copy of the whole component tree, which can be updated independently."""
+        copy = object.__new__(self.__class__)
+        copy.__dict__.update(self.__dict__)
+        # The description is derived from the tree and has to be recomputed once it's updated
+        copy.__dict__.pop("description", None)
+        copy.values = [
+            value.deep_copy() if isinstance(value, BaseGroupingComponent) else value
+            for value in self.values
+        ]
+        if isinstance(copy.__dict__.get("frame_counts"), Counter):
+            copy.__dict__["frame_counts"] = Counter(copy.__dict__["frame_counts"])
+        return copy
+
     def iter_values(self) -> Generator[str | int]:
         """
         Recursively walks the component tree, gathering literal values from contributing
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+from sentry.grouping.component import StacktraceGroupingComponent
+from sentry.utils import metrics
+from sentry.utils.lru import LRUCache
+
+if TYPE_CHECKING:
+    from sentry.eventstore.models import Event
+    from sentry.grouping.strategies.base import GroupingContext
+    from sentry.interfaces.stacktrace import Stacktrace
+
+# The frame fields read by the frame strategy, the recursion check and the enhancer's matchers.
+# Anything else in a frame (variables, pre/post context, addresses, ...) doesn't affect grouping.
+_FRAME_FIELDS = (
+    "abs_path",
+    "filename",
+    "module",
+    "function",
+    "raw_function",
+    "symbol",
+    "package",
+    "platform",
+    "context_line",
+    "in_app",
+    "lineno",
+    "colno",
+)
+
+MAX_SIZE = 10_000
+# Stacktrace components are weighed by their number of frames, at roughly a kilobyte per frame
+MAX_BYTES = 64 * 1024 * 1024
+_FRAME_SIZE = 1024
+
+
+def _sizeof(key: Hashable, component: StacktraceGroupingComponent) -> int:
+    return (len(component.values) + 1) * _FRAME_SIZE
+
+
+_stacktrace_components: LRUCache[Hashable, StacktraceGroupingComponent] = LRUCache(
+    MAX_SIZE, max_bytes=MAX_BYTES, sizeof=_sizeof
+)
+
+
+def _frame_key(frame_data: dict[str, Any]) -> tuple[Any, ...]:
+    data = frame_data.get("data") or {}
+    return (
+        *(frame_data.get(field) for field in _FRAME_FIELDS),
+        data.get("category"),
+        data.get("orig_in_app"),
+        data.get("sourcemap") is not None,
+    )
+
+
+def get_stacktrace_cache_key(
+    stacktrace: Stacktrace, event: Event, context: GroupingContext
+) -> Hashable:
+    """
+    Build the key under which the stacktrace component of the given stacktrace is cached.
+
+    The key covers everything the component is derived from: the grouping config (which determines
+    the strategies and their options), the enhancements, the variant, the event's platform, the
+    exception the stacktrace belongs to and the grouping-relevant fields of each frame.
+    """
+    exception_data = context["exception_data"] or {}
+    mechanism = exception_data.get("mechanism") or {}
+    return (
+        context.config.id,
+        context.config.enhancements_key,
+        context["variant"],
+        event.platform,
+        exception_data.get("type"),
+        exception_data.get("value"),
+        mechanism.get("type"),
+        tuple(_frame_key(frame.get_raw_data()) for frame in stacktrace.frames),
+    )
+
+
+def get_cached_stacktrace_component(key: Hashable) -> StacktraceGroupingComponent | None:
+    """
+    Look up a cached stacktrace component. The component returned is a copy, which the caller is
+    free to update.
+    """
+    component = _stacktrace_components.get(key)
+    if component is None:
+        metrics.incr("grouping.component_cache.miss", sample_rate=1.0)
+        return None
+    metrics.incr("grouping.component_cache.hit", sample_rate=1.0)
+    return component.deep_copy()
+
+
+def cache_stacktrace_component(key: Hashable, component: StacktraceGroupingComponent) -> None:
+    """Cache a copy of a stacktrace component, so updates to the original don't leak into it."""
+    _stacktrace_components.set(key, component.deep_copy())
+
+
+def clear_stacktrace_component_cache() -> None:
+    _stacktrace_components.clear()
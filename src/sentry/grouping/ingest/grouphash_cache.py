@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Sequence
+
+from django.core.cache import cache
+from django.db import router, transaction
+
+from sentry import options
+from sentry.models.grouphash import GroupHash
+from sentry.utils import metrics
+
+# The cached records of a project are tagged with the project's current generation, and only
+# records tagged with the current generation are served. Invalidating a project replaces its
+# generation, which invalidates all of its records at once.
+GENERATION_TIMEOUT = 24 * 60 * 60
+
+_FIELDS = ("id", "project_id", "hash", "group_id", "group_tombstone_id", "state")
+
+
+def _generation_key(project_id: int) -> str:
+    return f"grouphash-cache-generation:{project_id}"
+
+
+def _record_key(project_id: int, hash_value: str) -> str:
+    return f"grouphash-cache:{project_id}:{hash_value}"
+
+
+def get_cached_grouphashes(
+    project_id: int, hashes: Sequence[str]
+) -> tuple[dict[str, GroupHash], str | None]:
+    """
+    Look up the cached `GroupHash` records of the given hashes.
+
+    Returns the records found, by hash, along with the project's current generation. The
+    generation has to be passed to `cache_grouphashes` when caching records read from the database
+    after this lookup.
+
+    Records are returned without their metadata.
+    """
+    generation_key = _generation_key(project_id)
+    record_keys = {_record_key(project_id, hash_value): hash_value for hash_value in hashes}
+    values = cache.get_many([generation_key, *record_keys])
+
+    generation = values.get(generation_key)
+    found: dict[str, GroupHash] = {}
+    if generation is not None:
+        db = router.db_for_read(GroupHash)
+        for key, hash_value in record_keys.items():
+            value = values.get(key)
+            if value is None or value[0] != generation:
+                continue
+            grouphash_id, group_id, group_tombstone_id, state = value[1:]
+            found[hash_value] = GroupHash.from_db(
+                db,
+                _FIELDS,
+                (grouphash_id, project_id, hash_value, group_id, group_tombstone_id, state),
+            )
+
+    metrics.incr("grouping.grouphash_cache.hit", len(found), sample_rate=1.0)
+    metrics.incr("grouping.grouphash_cache.miss", len(record_keys) - len(found), sample_rate=1.0)
+    return found, generation
+
+
+def cache_grouphashes(
+    project_id: int, generation: str | None, grouphashes: Iterable[GroupHash]
+) -> None:
+    """
+    Cache the given `GroupHash` records, read after a lookup which returned `generation`. Nothing
+    is cached if the project was invalidated in the meantime.
+
+    Only records of hashes which are assigned to a group or a tombstone are cached. Unassigned
+    hashes are about to be assigned when their group is created.
+    """
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(_generation_key(project_id), generation, GENERATION_TIMEOUT):
+            return
+
+    records = {
+        _record_key(project_id, grouphash.hash): (
+            generation,
+            grouphash.id,
+            grouphash.group_id,
+            grouphash.group_tombstone_id,
+            grouphash.state,
+        )
+        for grouphash in grouphashes
+        if grouphash.group_id is not None or grouphash.group_tombstone_id is not None
+    }
+    if records:
+        cache.set_many(records, options.get("grouping.grouphash_cache.timeout"))
+
+
+def invalidate_grouphash_cache(project_ids: Iterable[int]) -> None:
+    """
+    Invalidate the cached `GroupHash` records of the given projects.
+
+    This has to be called whenever existing hashes are moved to another group, deleted,
+    tombstoned or untombstoned. If called in a transaction, the records are invalidated once it
+    commits.
+    """
+    generations = {_generation_key(project_id): uuid.uuid4().hex for project_id in set(project_ids)}
+    if generations:
+        transaction.on_commit(
+            lambda: cache.set_many(generations, GENERATION_TIMEOUT),
+            using=router.db_for_write(GroupHash),
+        )
@@ -6,6 +6,7 @@ from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 import sentry_sdk
+from django.db import IntegrityError, router, transaction
 
 from sentry.exceptions import HashDiscarded
 from sentry.grouping.api import (
@@ -19,6 +20,7 @@ from sentry.grouping.api import (
     load_grouping_config,
 )
 from sentry.grouping.ingest.config import is_in_transition
+from sentry.grouping.ingest.grouphash_cache import cache_grouphashes, get_cached_grouphashes
 from sentry.grouping.ingest.grouphash_metadata import (
     create_or_update_grouphash_metadata_if_needed,
     record_grouphash_metadata_metrics,
@@ -209,6 +211,39 @@ def find_grouphash_with_group(
     return None
 
 
+def _create_grouphashes(
+    project: Project, hashes: Sequence[str]
+) -> tuple[dict[str, GroupHash], set[str]]:
+    """
+    Insert `GroupHash` records for the given hashes, which had none when last checked.
+
+    Returns the records by hash, along with the hashes whose records were created by this call
+    (rather than by another event racing this one).
+    """
+    if not hashes:
+        return {}, set()
+
+    try:
+        with transaction.atomic(router.db_for_write(GroupHash)):
+            grouphashes = GroupHash.objects.bulk_create(
+                [GroupHash(project=project, hash=hash_value) for hash_value in hashes]
+            )
+        return {grouphash.hash: grouphash for grouphash in grouphashes}, set(hashes)
+    except IntegrityError:
+        # Another event created some of the records in the meantime, fall back to creating them
+        # one by one
+        pass
+
+    grouphashes_by_hash: dict[str, GroupHash] = {}
+    created_hashes: set[str] = set()
+    for hash_value in hashes:
+        grouphash, created = GroupHash.objects.get_or_create(project=project, hash=hash_value)
+        grouphashes_by_hash[hash_value] = grouphash
+        if created:
+            created_hashes.add(hash_value)
+    return grouphashes_by_hash, created_hashes
+
+
 def get_or_create_grouphashes(
     event: Event,
     project: Project,
@@ -217,23 +252,51 @@ def get_or_create_grouphashes(
     grouping_config: str,
 ) -> list[GroupHash]:
     is_secondary = grouping_config == project.get_option("sentry:secondary_grouping_config")
+    hashes = list(dict.fromkeys(hashes))
     grouphashes: list[GroupHash] = []
 
+    # Records of hashes assigned to a group or tombstone are served from the cache when possible,
+    # which leaves only new and unassigned hashes to be looked up in the database
+    use_cache = in_random_rollout("grouping.grouphash_cache.rollout")
+    cached: dict[str, GroupHash] = {}
+    generation = None
+    if use_cache:
+        cached, generation = get_cached_grouphashes(project.id, hashes)
+
+    existing: dict[str, GroupHash] = {}
+    if missing_hashes := [hash_value for hash_value in hashes if hash_value not in cached]:
+        existing = {
+            grouphash.hash: grouphash
+            for grouphash in GroupHash.objects.filter(
+                project=project, hash__in=missing_hashes
+            ).select_related("_metadata")
+        }
+        if use_cache:
+            cache_grouphashes(project.id, generation, existing.values())
+
     if is_secondary:
         # The only utility of secondary hashes is to link new primary hashes to an existing group
         # via an existing grouphash. Secondary hashes which are new are therefore of no value, so
         # filter them out before creating grouphash records.
-        existing_hashes = set(
-            GroupHash.objects.filter(project=project, hash__in=hashes).values_list(
-                "hash", flat=True
-            )
-        )
-        hashes = filter(lambda hash_value: hash_value in existing_hashes, hashes)
+        hashes = [
+            hash_value for hash_value in hashes if hash_value in cached or hash_value in existing
+        ]
+
+    new, created_hashes = _create_grouphashes(
+        project,
+        [
+            hash_value
+            for hash_value in hashes
+            if hash_value not in cached and hash_value not in existing
+        ],
+    )
 
     for hash_value in hashes:
-        grouphash, created = GroupHash.objects.get_or_create(project=project, hash=hash_value)
+        grouphash = cached.get(hash_value) or existing.get(hash_value) or new[hash_value]
+        created = hash_value in created_hashes
 
-        if should_handle_grouphash_metadata(project, created):
+        handle_metadata = should_handle_grouphash_metadata(project, created)
+        if handle_metadata:
             try:
                 # We don't expect this to throw any errors, but collecting this metadata
                 # shouldn't ever derail ingestion, so better to be safe
@@ -249,7 +312,11 @@ def get_or_create_grouphashes(
                     "grouphash_metadata.exception", extra={"event_id": event_id, "error": repr(exc)}
                 )
 
-        if grouphash.metadata:
+        if hash_value in cached and not handle_metadata:
+            # Cached records don't come with their metadata, and looking it up just for the
+            # metrics below would defeat the purpose of the cache
+            pass
+        elif grouphash.metadata:
             record_grouphash_metadata_metrics(grouphash.metadata, event.platform)
         else:
             # Collect a temporary metric to get a sense of how often we would be adding metadata to an
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Callable, Iterator, Sequence
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Generic, Protocol, Self, TypeVar, overload
 
 from sentry import projectoptions
@@ -15,6 +16,7 @@ from sentry.grouping.enhancer import Enhancements
 from sentry.interfaces.base import Interface
 from sentry.interfaces.exception import SingleException
 from sentry.interfaces.stacktrace import Frame, Stacktrace
+from sentry.utils.hashlib import md5_text
 
 if TYPE_CHECKING:
     from sentry.eventstore.models import Event
@@ -308,10 +310,16 @@ class StrategyConfiguration:
         else:
             enhancements_instance = Enhancements.loads(enhancements)
         self.enhancements = enhancements_instance
+        self._enhancements_string = enhancements or ""
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.id!r}>"
 
+    @cached_property
+    def enhancements_key(self) -> str:
+        """A digest of the enhancements, for caching results which depend on them."""
+        return md5_text(self._enhancements_string).hexdigest()
+
     def iter_strategies(self) -> Iterator[Strategy[Any]]:
         """Iterates over all strategies by highest score to lowest."""
         return iter(sorted(self.strategies.values(), key=lambda x: x.score and -x.score or 0))
@@ -21,6 +21,11 @@ from sentry.grouping.component import (
     StacktraceGroupingComponent,
     ThreadsGroupingComponent,
 )
+from sentry.grouping.component_cache import (
+    cache_stacktrace_component,
+    get_cached_stacktrace_component,
+    get_stacktrace_cache_key,
+)
 from sentry.grouping.strategies.base import (
     GroupingContext,
     ReturnedVariants,
@@ -34,6 +39,7 @@ from sentry.interfaces.exception import Exception as ChainedException
 from sentry.interfaces.exception import Mechanism, SingleException
 from sentry.interfaces.stacktrace import Frame, Stacktrace
 from sentry.interfaces.threads import Threads
+from sentry.options.rollout import in_random_rollout
 from sentry.stacktraces.platform import get_behavior_family_for_platform
 
 if TYPE_CHECKING:
@@ -428,6 +434,25 @@ def _single_stacktrace_variant(
 ) -> ReturnedVariants:
     variant_name = context["variant"]
 
+    # The same stacktraces come in over and over again, so their components are memoized
+    if not in_random_rollout("grouping.component_cache.rollout"):
+        return _build_single_stacktrace_variant(stacktrace, event, context, meta)
+
+    cache_key = get_stacktrace_cache_key(stacktrace, event, context)
+    stacktrace_component = get_cached_stacktrace_component(cache_key)
+    if stacktrace_component is None:
+        variants = _build_single_stacktrace_variant(stacktrace, event, context, meta)
+        cache_stacktrace_component(cache_key, variants[variant_name])
+        return variants
+
+    return {variant_name: stacktrace_component}
+
+
+def _build_single_stacktrace_variant(
+    stacktrace: Stacktrace, event: Event, context: GroupingContext, meta: dict[str, Any]
+) -> ReturnedVariants:
+    variant_name = context["variant"]
+
     frames = stacktrace.frames
 
     frame_components = []
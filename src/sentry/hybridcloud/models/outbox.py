@@ -12,6 +12,7 @@ from django import db
 from django.db import OperationalError, connections, models, router, transaction
 from django.db.models import Count, Max, Min
 from django.db.transaction import Atomic
+from django.dispatch import Signal
 from django.utils import timezone
 from sentry_sdk.tracing import Span
 
@@ -32,7 +33,12 @@ from sentry.db.postgres.transactions import (
     in_test_assert_no_transaction,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
-from sentry.hybridcloud.outbox.signals import process_control_outbox, process_region_outbox
+from sentry.hybridcloud.outbox.signals import (
+    process_control_outbox,
+    process_control_outbox_batch,
+    process_region_outbox,
+    process_region_outbox_batch,
+)
 from sentry.hybridcloud.rpc import REGION_NAME_LENGTH
 from sentry.silo.base import SiloMode
 from sentry.silo.safety import unguarded_write
@@ -60,6 +66,7 @@ def _ensure_not_null(k: str, v: Any) -> Any:
 class OutboxBase(Model):
     sharding_columns: Iterable[str]
     coalesced_columns: Iterable[str]
+    batch_signal: Signal
 
     def should_skip_shard(self) -> bool:
         if self.shard_scope == OutboxScope.ORGANIZATION_SCOPE:
@@ -287,7 +294,98 @@ class OutboxBase(Model):
         span.set_tag("outbox_category", OutboxCategory(message.category).name)
         span.set_tag("outbox_scope", OutboxScope(message.shard_scope).name)
 
+    def has_batch_handler(self) -> bool:
+        return self.batch_signal.has_listeners(OutboxCategory(self.category))
+
+    def select_batch_messages(self) -> list[Self]:
+        """
+        Select the messages to deliver to the batch handler, when this is the
+        first message of its shard.
+
+        These are the coalesced messages of every object in the run of
+        messages of this category at the head of the shard. The run ends at
+        the first message of another category, so messages of different
+        categories are still delivered in order.
+        """
+        batch_size = options.get("hybridcloud.outbox.batch_size")
+        object_identifiers: list[int] = []
+        for category, object_identifier in (
+            self.selected_messages_in_shard()
+            .order_by("id")
+            .values_list("category", "object_identifier")[:batch_size]
+        ):
+            if category != self.category:
+                break
+            if object_identifier not in object_identifiers:
+                object_identifiers.append(object_identifier)
+
+        latest_ids = (
+            self.objects.filter(
+                **self.key_from(self.sharding_columns),
+                category=self.category,
+                object_identifier__in=object_identifiers,
+            )
+            .order_by()
+            .values("object_identifier")
+            .annotate(latest_id=Max("id"))
+            .values_list("latest_id", flat=True)
+        )
+        return list(self.objects.filter(id__in=list(latest_ids)).order_by("id"))
+
+    def process_batch(self, is_synchronous_flush: bool) -> bool:
+        messages = self.select_batch_messages()
+        if not messages:
+            return False
+
+        tags: dict[str, int | str] = {
+            "category": OutboxCategory(self.category).name,
+            "synchronous": int(is_synchronous_flush),
+        }
+        metrics.distribution("outbox.batch_size", len(messages), tags=tags)
+        with (
+            metrics.timer("outbox.send_batch_signal.duration", tags=tags),
+            sentry_sdk.start_span(op="outbox.process_batch") as span,
+        ):
+            self._set_span_data_for_coalesced_message(span=span, message=messages[0])
+            span.set_data("outbox_batch_size", len(messages))
+            try:
+                self.send_batch_signal(messages)
+            except Exception as e:
+                raise OutboxFlushError(
+                    f"Could not flush batch of shard category={self.category} ({OutboxCategory(self.category).name})",
+                    messages[0],
+                ) from e
+
+        # Every message of the batched objects up to the latest one was
+        # delivered, anything added since has a larger id and is kept.
+        latest_id = messages[-1].id
+        delivered = self.objects.filter(
+            **self.key_from(self.sharding_columns),
+            category=self.category,
+            object_identifier__in=[message.object_identifier for message in messages],
+            id__lte=latest_id,
+        )
+        deleted_count = 0
+        while True:
+            delete_ids = list(delivered.values_list("id", flat=True)[:100])
+            if not delete_ids:
+                break
+            self.objects.filter(id__in=delete_ids).delete()
+            deleted_count += len(delete_ids)
+
+        metrics.incr("outbox.processed", deleted_count, tags=tags)
+        metrics.timing(
+            "outbox.processing_lag",
+            datetime.datetime.now(tz=datetime.UTC).timestamp()
+            - min(message.scheduled_from for message in messages).timestamp(),
+            tags=tags,
+        )
+        return True
+
     def process(self, is_synchronous_flush: bool) -> bool:
+        if self.has_batch_handler() and not self.should_skip_shard():
+            return self.process_batch(is_synchronous_flush=is_synchronous_flush)
+
         with self.process_coalesced(is_synchronous_flush=is_synchronous_flush) as coalesced:
             if coalesced is not None and not self.should_skip_shard():
                 with (
@@ -316,6 +414,10 @@ class OutboxBase(Model):
     def send_signal(self) -> None:
         pass
 
+    @abc.abstractmethod
+    def send_batch_signal(self, messages: list[Self]) -> None:
+        pass
+
     def drain_shard(
         self, flush_all: bool = False, _test_processing_barrier: threading.Barrier | None = None
     ) -> None:
@@ -396,6 +498,10 @@ class RegionOutboxBase(OutboxBase):
             shard_scope=self.shard_scope,
         )
 
+    def send_batch_signal(self, messages: list[Self]) -> None:
+        process_region_outbox_batch.send(sender=OutboxCategory(self.category), messages=messages)
+
+    batch_signal = process_region_outbox_batch
     sharding_columns = ("shard_scope", "shard_identifier")
     coalesced_columns = ("shard_scope", "shard_identifier", "category", "object_identifier")
 
@@ -443,6 +549,8 @@ class ControlOutboxBase(OutboxBase):
 
     region_name = models.CharField(max_length=REGION_NAME_LENGTH)
 
+    batch_signal = process_control_outbox_batch
+
     def send_signal(self) -> None:
         process_control_outbox.send(
             sender=OutboxCategory(self.category),
@@ -455,6 +563,9 @@ class ControlOutboxBase(OutboxBase):
             scheduled_for=self.scheduled_for,
         )
 
+    def send_batch_signal(self, messages: list[Self]) -> None:
+        process_control_outbox_batch.send(sender=OutboxCategory(self.category), messages=messages)
+
     class Meta:
         abstract = True
 
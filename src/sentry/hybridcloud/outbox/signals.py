@@ -2,3 +2,8 @@ from django.dispatch import Signal
 
 process_region_outbox = Signal()  # ["payload", "object_identifier"]
 process_control_outbox = Signal()  # ["payload", "region_name", "object_identifier"]
+
+# Receivers of these signals handle the coalesced messages of many objects of a
+# category at once, in place of the per message receivers.
+process_region_outbox_batch = Signal()  # ["messages"]
+process_control_outbox_batch = Signal()  # ["messages"]
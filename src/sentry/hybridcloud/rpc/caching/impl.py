@@ -1,9 +1,13 @@
+import contextlib
+import threading
 from collections.abc import Generator, Mapping
 from typing import TypeVar
 
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.signals import request_finished
 
+from sentry import app
 from sentry.hybridcloud.models.cacheversion import (
     CacheVersionBase,
     ControlCacheVersion,
@@ -11,12 +15,104 @@ from sentry.hybridcloud.models.cacheversion import (
 )
 from sentry.hybridcloud.rpc.caching.service import ControlCachingService, RegionCachingService
 from sentry.silo.base import SiloMode
+from sentry.utils import metrics
+from sentry.utils.lru import LRUCache
 
 _V = TypeVar("_V")
 
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
+# Reads go through three layers, from the closest to the furthest:
+#
+# - A scope (request or task) local memo of unversioned keys. The same record
+#   is commonly resolved many times while serving a single request, the memo
+#   answers all but the first without any I/O.
+# - A process local LRU of versioned keys. Versions are still read from the
+#   database on every lookup, so an entry can never be served after its key
+#   was cleared, but the shared cache round trip is skipped.
+# - The shared (django) cache.
+LOCAL_CACHE_SIZE = 10000
+# Upper bound on how long an entry is kept in the process local LRU, entries
+# never outlive their timeout in the shared cache either.
+LOCAL_CACHE_TTL = 300
+
+
+_local_cache: LRUCache[str, str] = LRUCache(LOCAL_CACHE_SIZE)
+
+
+class _ScopeState(threading.local):
+    # Number of active `silo_cache_scope` blocks.
+    depth: int = 0
+    items: dict[str, str] | None = None
+
+
+_scope = _ScopeState()
+
+
+def _scope_items() -> dict[str, str] | None:
+    if _scope.depth == 0 and app.env.request is None:
+        return None
+    if _scope.items is None:
+        _scope.items = {}
+    return _scope.items
+
+
+def clear_scope(**kwargs: object) -> None:
+    _scope.items = None
+
+
+request_finished.connect(clear_scope)
+
+
+@contextlib.contextmanager
+def silo_cache_scope() -> Generator[None]:
+    """
+    Memoize silo cached records for the duration of the block (for example
+    a task), as is done for the duration of every request.
+    """
+    _scope.depth += 1
+    try:
+        yield
+    finally:
+        _scope.depth -= 1
+        if _scope.depth == 0:
+            clear_scope()
+
+
+_flights: dict[str, threading.Lock] = {}
+_flights_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _single_flight(key: str, version: int) -> Generator[str | None]:
+    """
+    Serialize the resolution of a cache miss among the threads of the process.
+
+    The first caller yields None and is expected to resolve (and cache) the
+    value. Callers that had to wait for it yield the value it cached, or None
+    if it did not cache anything.
+    """
+    versioned_key = _versioned_key(key, version)
+    with _flights_lock:
+        lock = _flights.get(versioned_key)
+        if lock is None:
+            lock = _flights[versioned_key] = threading.Lock()
+        waited = lock.locked()
+
+    if waited:
+        metrics.incr("hybridcloud.caching.single_flight.waited")
+    with lock:
+        try:
+            if waited:
+                yield _local_cache.get_many([versioned_key]).get(versioned_key)
+            else:
+                yield None
+        finally:
+            with _flights_lock:
+                if _flights.get(versioned_key) is lock:
+                    del _flights[versioned_key]
+
 
 def _consume_generator(g: Generator[None, None, _V]) -> _V:
     while True:
@@ -31,8 +127,15 @@ def _set_cache(
 ) -> Generator[None, None, bool]:
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-    result = cache.add(_versioned_key(key, version), value, timeout=timeout)
+    versioned_key = _versioned_key(key, version)
+    result = cache.add(versioned_key, value, timeout=timeout)
     yield
+    if result and value is not None:
+        local_timeout = LOCAL_CACHE_TTL if timeout in (None, DEFAULT_TIMEOUT) else timeout
+        _local_cache.set(versioned_key, value, ttl=min(local_timeout, LOCAL_CACHE_TTL))
+        scope_items = _scope_items()
+        if scope_items is not None:
+            scope_items[key] = value
     return result
 
 
@@ -50,21 +153,44 @@ def _version_model(mode: SiloMode) -> type[CacheVersionBase]:
 
 def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     version = _version_model(mode).incr_version(key)
+    # The process local cache is keyed by version and needs no invalidation.
+    if _scope.items is not None:
+        _scope.items.pop(key, None)
     yield
     return version
 
 
 def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
+    result: dict[str, str | int] = {}
+    scope_items = _scope_items()
+    if scope_items is not None:
+        result.update((key, scope_items[key]) for key in keys if key in scope_items)
+        if result:
+            metrics.incr("hybridcloud.caching.local", len(result), tags={"layer": "scope"})
+            keys = [key for key in keys if key not in result]
+            if not keys:
+                return result
+
     versions = {cv.key: cv.version for cv in _version_model(mode).objects.filter(key__in=keys)}
     yield
 
     versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
-    existing = cache.get_many(versioned_keys)
-    yield
-    result: dict[str, str | int] = {}
+    existing: dict[str, str] = _local_cache.get_many(versioned_keys)
+    if existing:
+        metrics.incr("hybridcloud.caching.local", len(existing), tags={"layer": "process"})
+    missing = [versioned_key for versioned_key in versioned_keys if versioned_key not in existing]
+    if missing:
+        shared = cache.get_many(missing)
+        for versioned_key, value in shared.items():
+            if isinstance(value, str):
+                _local_cache.set(versioned_key, value, ttl=LOCAL_CACHE_TTL)
+        existing.update(shared)
+        yield
     for k, versioned_key in zip(keys, versioned_keys):
         if versioned_key in existing:
             result[k] = existing[versioned_key]
+            if scope_items is not None and isinstance(result[k], str):
+                scope_items[k] = existing[versioned_key]
             continue
         result[k] = versions.get(k, 0)
     return result
@@ -81,7 +81,7 @@ class SiloCacheBackedCallable(Generic[_R]):
     def resolve_from(
         self, i: int, values: Mapping[str, int | str]
     ) -> Generator[None, None, _R | None]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _set_cache, _single_flight
 
         key = self.key_from(i)
         value = values[key]
@@ -95,11 +95,20 @@ class SiloCacheBackedCallable(Generic[_R]):
         else:
             version = value
 
-        metrics.incr("hybridcloud.caching.one.rpc", tags={"base_key": self.base_key})
-        r = self.cb(i)
-        if r is not None:
-            _consume_generator(_set_cache(key, r.json(), version, self.timeout))
-        return r
+        # Concurrent misses for the same record wait for the first one to
+        # resolve it instead of all calling the wrapped function.
+        with _single_flight(key, version) as resolved:
+            if resolved is not None:
+                try:
+                    return self.type_(**json.loads(resolved))
+                except (pydantic.ValidationError, JSONDecodeError, TypeError):
+                    pass
+
+            metrics.incr("hybridcloud.caching.one.rpc", tags={"base_key": self.base_key})
+            r = self.cb(i)
+            if r is not None:
+                _consume_generator(_set_cache(key, r.json(), version, self.timeout))
+            return r
 
     def get_one(self, object_id: int) -> _R | None:
         from .impl import _consume_generator, _get_cache
@@ -153,7 +162,7 @@ class SiloCacheBackedListCallable(Generic[_R]):
     def resolve_from(
         self, object_id: int, values: Mapping[str, int | str]
     ) -> Generator[None, None, list[_R]]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _set_cache, _single_flight
 
         key = self.key_from(object_id)
         value = values[key]
@@ -167,12 +176,19 @@ class SiloCacheBackedListCallable(Generic[_R]):
         else:
             version = value
 
-        metrics.incr("hybridcloud.caching.list.rpc", tags={"base_key": self.base_key})
-        result = self.cb(object_id)
-        if result is not None:
-            cache_value = json.dumps([item.json() for item in result])
-            _consume_generator(_set_cache(key, cache_value, version, self.timeout))
-        return result
+        with _single_flight(key, version) as resolved:
+            if resolved is not None:
+                try:
+                    return [self.type_(**item) for item in json.loads(resolved)]
+                except (pydantic.ValidationError, JSONDecodeError, TypeError):
+                    pass
+
+            metrics.incr("hybridcloud.caching.list.rpc", tags={"base_key": self.base_key})
+            result = self.cb(object_id)
+            if result is not None:
+                cache_value = json.dumps([item.json() for item in result])
+                _consume_generator(_set_cache(key, cache_value, version, self.timeout))
+            return result
 
     def get_results(self, object_id: int) -> list[_R]:
         from .impl import _consume_generator, _get_cache
@@ -19,7 +19,7 @@ from collections.abc import (
 )
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, NoReturn, Self, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, NoReturn, Self, TypeVar, cast
 
 import django.urls
 import pydantic
@@ -46,6 +46,7 @@ _T = TypeVar("_T")
 _IS_RPC_METHOD_ATTR = "__is_rpc_method"
 _REGION_RESOLUTION_ATTR = "__region_resolution"
 _REGION_RESOLUTION_OPTIONAL_RETURN_ATTR = "__region_resolution_optional_return"
+_IS_REMOTE_METHOD_ATTR = "__is_remote_rpc_method"
 
 
 class RpcException(Exception):
@@ -219,6 +220,8 @@ class RpcService(abc.ABC):
     local_mode: SiloMode
 
     _signatures: Mapping[str, RpcMethodSignature]
+    # Set on remote implementations, whether calls are sent through the test client.
+    _use_test_client: bool = False
 
     def __init_subclass__(cls) -> None:
         if cls._has_rpc_methods():
@@ -319,6 +322,34 @@ class RpcService(abc.ABC):
 
         return impl
 
+    @classmethod
+    def _create_remote_call(
+        cls, method_name: str, arguments: ArgumentDict
+    ) -> _RemoteSiloCall | None:
+        """Resolve the destination of a call to another silo and serialize its arguments.
+
+        Returns None if the call should not be made, because the region of a
+        regional method could not be resolved and the method returns None instead.
+        """
+        signature = cls._signatures[method_name]
+        if signature is None:
+            raise RpcServiceSetupException(
+                cls.key,
+                method_name,
+                f"Signature was not initialized for {cls.__name__}.{method_name}",
+            )
+
+        if cls.local_mode == SiloMode.REGION:
+            result = signature.resolve_to_region(arguments)
+            if result.is_early_halt:
+                return None
+            region = result.region
+        else:
+            region = None
+
+        serial_arguments = signature.serialize_arguments(arguments)
+        return _RemoteSiloCall(region, cls.key, method_name, serial_arguments)
+
     @classmethod
     def _create_remote_implementation(cls, use_test_client: bool | None = None) -> RpcService:
         """Create a service object that makes remote calls to another silo.
@@ -332,35 +363,26 @@ class RpcService(abc.ABC):
             use_test_client = in_test_environment()
 
         def create_remote_method(method_name: str) -> Callable[..., Any]:
-            signature = cls._signatures[method_name]
-
             def remote_method(service_obj: RpcService, **kwargs: Any) -> Any:
-                if signature is None:
-                    raise RpcServiceSetupException(
-                        cls.key,
-                        method_name,
-                        f"Signature was not initialized for {cls.__name__}.{method_name}",
-                    )
-
-                if cls.local_mode == SiloMode.REGION:
-                    result = signature.resolve_to_region(kwargs)
-                    if result.is_early_halt:
-                        return None
-                    region = result.region
-                else:
-                    region = None
-
-                serial_arguments = signature.serialize_arguments(kwargs)
+                call = cls._create_remote_call(method_name, kwargs)
+                if call is None:
+                    return None
                 return dispatch_remote_call(
-                    region, cls.key, method_name, serial_arguments, use_test_client=use_test_client
+                    call.region,
+                    cls.key,
+                    method_name,
+                    call.serial_arguments,
+                    use_test_client=use_test_client,
                 )
 
+            setattr(remote_method, _IS_REMOTE_METHOD_ATTR, True)
             return remote_method
 
-        overrides = {
+        overrides: dict[str, Any] = {
             service_method.__name__: create_remote_method(service_method.__name__)
             for service_method in cls._get_abstract_rpc_methods()
         }
+        overrides["_use_test_client"] = use_test_client
         remote_service_class = type(f"{cls.__name__}__RemoteDelegate", (cls,), overrides)
         return cast(RpcService, remote_service_class())
 
@@ -476,6 +498,123 @@ def dispatch_remote_call(
     return remote_silo_call.dispatch(use_test_client)
 
 
+class RpcBatchResult(Generic[_T]):
+    """The result of a call made through an `RpcBatch`, available once the batch was sent."""
+
+    def __init__(self, service_name: str, method_name: str) -> None:
+        self.service_name = service_name
+        self.method_name = method_name
+        self._done = False
+        self._value: _T | None = None
+        self._exception: Exception | None = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> _T:
+        if not self._done:
+            raise RpcException(
+                self.service_name, self.method_name, "Result read before the batch was sent"
+            )
+        if self._exception is not None:
+            raise self._exception
+        return cast(_T, self._value)
+
+    def _set_result(self, value: _T) -> None:
+        self._value = value
+        self._done = True
+
+    def _set_exception(self, exception: Exception) -> None:
+        self._exception = exception
+        self._done = True
+
+
+class RpcBatch:
+    """
+    Collects calls to RPC methods, and sends the calls bound for the same silo
+    in a single request instead of one request per call.
+
+    Calls are made through `call` and their results become available once the
+    batch is sent, which `rpc_batch` does when its block exits:
+
+        with rpc_batch() as batch:
+            results = [batch.call(user_service.get_user, user_id=i) for i in user_ids]
+        users = [result.result() for result in results]
+
+    Methods that run in the current silo are called right away, as are all
+    methods unless the `hybridcloud.rpc.batch-calls` option is enabled. The
+    server handles the calls of a batch one after the other, in the order they
+    were made.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Region | None, list[tuple[_RemoteSiloCall, RpcBatchResult[Any]]]] = {}
+        self._use_test_client = False
+        self._enabled = options.get("hybridcloud.rpc.batch-calls")
+
+    def __len__(self) -> int:
+        return sum(len(calls) for calls in self._pending.values())
+
+    def call(self, method: Callable[..., _T], **kwargs: Any) -> RpcBatchResult[_T]:
+        """Call a method of an RPC service, for example `user_service.get_user`."""
+        service_obj = getattr(method, "__self__", None)
+        if not isinstance(service_obj, RpcService):
+            raise TypeError("Only methods of RPC services can be called in a batch")
+        result: RpcBatchResult[_T] = RpcBatchResult(service_obj.key, method.__name__)
+
+        if not self._enabled or not getattr(method, _IS_REMOTE_METHOD_ATTR, False):
+            try:
+                result._set_result(method(**kwargs))
+            except Exception as e:
+                result._set_exception(e)
+            return result
+
+        try:
+            call = service_obj._create_remote_call(method.__name__, kwargs)
+            if call is not None:
+                call._check_disabled()
+        except Exception as e:
+            result._set_exception(e)
+            return result
+        if call is None:
+            result._set_result(cast(_T, None))
+            return result
+
+        self._use_test_client = self._use_test_client or service_obj._use_test_client
+        self._pending.setdefault(call.region, []).append((call, result))
+        return result
+
+    def send(self) -> None:
+        """Send the calls made so far, and set their results."""
+        pending, self._pending = self._pending, {}
+        batch_size = max(options.get("hybridcloud.rpc.batch_size"), 1)
+        for region, calls in pending.items():
+            for i in range(0, len(calls), batch_size):
+                chunk = calls[i : i + batch_size]
+                batch_call = _RemoteSiloBatchCall(
+                    region, "rpc", "batch", {}, tuple(call for call, _ in chunk)
+                )
+                try:
+                    outcomes = batch_call.dispatch_batch(self._use_test_client)
+                except Exception as e:
+                    for _, result in chunk:
+                        result._set_exception(e)
+                    continue
+                for (_, result), outcome in zip(chunk, outcomes):
+                    if isinstance(outcome, Exception):
+                        result._set_exception(outcome)
+                    else:
+                        result._set_result(outcome)
+
+
+@contextmanager
+def rpc_batch() -> Generator[RpcBatch]:
+    """Collect RPC calls made through the yielded batch, and send them when the block exits."""
+    batch = RpcBatch()
+    yield batch
+    batch.send()
+
+
 @dataclass(frozen=True)
 class _RemoteSiloCall:
     region: Region | None
@@ -554,12 +693,14 @@ class _RemoteSiloCall:
 
         return settings.RPC_TIMEOUT
 
-    def _send_to_remote_silo(self, use_test_client: bool) -> Any:
-        request_body = {
+    def _request_body(self) -> dict[str, Any]:
+        return {
             "meta": {},  # reserved for future use
             "args": self.serial_arguments,
         }
-        data = json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
+
+    def _send_to_remote_silo(self, use_test_client: bool) -> Any:
+        data = json.dumps(self._request_body()).encode(_RPC_CONTENT_CHARSET)
         signature = generate_request_signature(self.path, data)
         headers = {
             "Content-Type": f"application/json; charset={_RPC_CONTENT_CHARSET}",
@@ -692,6 +833,57 @@ class _RemoteSiloCall:
                 raise RpcDisabledException(f"RPC {service_method} disabled")
 
 
+@dataclass(frozen=True)
+class _RemoteSiloBatchCall(_RemoteSiloCall):
+    """Sends several calls to the same silo in a single request."""
+
+    calls: tuple[_RemoteSiloCall, ...] = ()
+
+    @property
+    def path(self) -> str:
+        return django.urls.reverse("sentry-api-0-rpc-batch")
+
+    def _request_body(self) -> dict[str, Any]:
+        return {
+            "meta": {},  # reserved for future use
+            "calls": [
+                {
+                    "service": call.service_name,
+                    "method": call.method_name,
+                    "args": call.serial_arguments,
+                }
+                for call in self.calls
+            ],
+        }
+
+    def get_method_retry_count(self) -> int:
+        return min(call.get_method_retry_count() for call in self.calls)
+
+    def get_method_timeout(self) -> float:
+        return max(call.get_method_timeout() for call in self.calls)
+
+    def dispatch_batch(self, use_test_client: bool = False) -> list[Any]:
+        """Send the calls, and return the result or the exception of each call in order."""
+        metrics.distribution(
+            "hybrid_cloud.dispatch_rpc.batch_size", len(self.calls), tags=self._metrics_tags()
+        )
+        serial_response = self._send_to_remote_silo(use_test_client)
+        results = serial_response["results"]
+        if len(results) != len(self.calls):
+            raise RpcResponseException(
+                self.service_name, self.method_name, "Batch response does not match its calls"
+            )
+
+        outcomes: list[Any] = []
+        for call, result in zip(self.calls, results):
+            if "error" in result:
+                outcomes.append(call._remote_exception(result["error"]))
+                continue
+            service, _ = _look_up_service_method(call.service_name, call.method_name)
+            outcomes.append(service.deserialize_rpc_response(call.method_name, result["value"]))
+        return outcomes
+
+
 class RpcDisabledException(Exception):
     """Indicates that an RPC method has been disabled and a request has not been made."""
 
@@ -14,6 +14,7 @@ from arroyo.processing.strategies import (
 )
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
+from sentry.ingest import deduplication
 from sentry.ingest.types import ConsumerType
 from sentry.processing.backpressure.arroyo import HealthChecker, create_backpressure_step
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
@@ -101,10 +102,15 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         final_step = CommitOffsets(commit)
 
         if not self.is_attachment_topic:
+            # Partitions are only deduplicated with bloom filters if all of their messages are
+            # processed in this process, and their filters start over whenever they are assigned.
+            if mp is None:
+                deduplication.reset_partitions()
             event_function = partial(
                 process_simple_event_message,
                 consumer_type=self.consumer_type,
                 reprocess_only_stuck_events=self.reprocess_only_stuck_events,
+                deduplicate_per_partition=mp is None,
             )
             next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
             return create_backpressure_step(health_checker=self.health_checker, next_step=next_step)
@@ -203,11 +209,14 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
 
         final_step = CommitOffsets(commit)
 
+        if mp is None:
+            deduplication.reset_partitions()
         event_function = partial(
             process_simple_event_message,
             consumer_type=self.consumer_type,
             reprocess_only_stuck_events=self.reprocess_only_stuck_events,
             no_celery_mode=self.no_celery_mode,
+            deduplicate_per_partition=mp is None,
         )
         next_step = maybe_multiprocess_step(mp, event_function, final_step, self._pool)
         return create_backpressure_step(health_checker=self.health_checker, next_step=next_step)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Collection
+from functools import cached_property
+from typing import Any
+
+import orjson
+
+# A JSON string, including its quotes
+_STRING_RE = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+# The characters which matter when skipping over an object or array
+_STRUCTURE_RE = re.compile(rb'["{}\[\]]')
+# A number, `true`, `false` or `null`
+_SCALAR_RE = re.compile(rb"[^\s,}\]]+")
+_WHITESPACE_RE = re.compile(rb"\s*")
+
+# Scanning gives up past this point, fields are only worth scanning for near the start of a payload
+MAX_SCAN_BYTES = 64 * 1024
+
+
+class _ScanError(Exception):
+    pass
+
+
+def _skip_whitespace(payload: bytes, pos: int) -> int:
+    match = _WHITESPACE_RE.match(payload, pos)
+    assert match is not None  # `\s*` always matches
+    return match.end()
+
+
+def _skip_string(payload: bytes, pos: int) -> int:
+    match = _STRING_RE.match(payload, pos)
+    if match is None:
+        raise _ScanError("invalid string")
+    return match.end()
+
+
+def _skip_value(payload: bytes, pos: int, limit: int) -> int:
+    """
+    Returns the position right after the JSON value starting at `pos`. Gives up on objects and
+    arrays extending past `limit`.
+    """
+    char = payload[pos : pos + 1]
+    if char == b'"':
+        return _skip_string(payload, pos)
+
+    if char in (b"{", b"["):
+        depth = 0
+        while True:
+            match = _STRUCTURE_RE.search(payload, pos, limit)
+            if match is None:
+                raise _ScanError("unterminated object or array, or scan limit reached")
+            char = match.group()
+            if char == b'"':
+                pos = _skip_string(payload, match.start())
+                continue
+            pos = match.end()
+            if char in (b"{", b"["):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+
+    match = _SCALAR_RE.match(payload, pos)
+    if match is None:
+        raise _ScanError("invalid value")
+    return match.end()
+
+
+def scan_top_level_fields(
+    payload: bytes, fields: Collection[str], max_bytes: int = MAX_SCAN_BYTES
+) -> dict[str, Any] | None:
+    """
+    Extract the given top-level fields from a JSON object, without parsing anything else.
+
+    Scanning stops as soon as all fields have been found, so fields near the start of the payload
+    (like the ones Relay writes first) are cheap to get no matter how large the payload is. Fields
+    which aren't in the payload are left out of the result. If a key is repeated, its first value
+    is used; Relay never writes repeated keys.
+
+    Returns `None` if the payload isn't a well-formed JSON object, or if the fields can't be found
+    within the first `max_bytes` bytes. Scanning is a lot slower than parsing per byte, so in both
+    cases the caller should fall back to parsing the payload fully.
+    """
+    found: dict[str, Any] = {}
+    try:
+        pos = _skip_whitespace(payload, 0)
+        if payload[pos : pos + 1] != b"{":
+            return None
+        pos = _skip_whitespace(payload, pos + 1)
+        if payload[pos : pos + 1] == b"}":
+            return found
+
+        while True:
+            key_end = _skip_string(payload, pos)
+            key = orjson.loads(payload[pos:key_end])
+
+            pos = _skip_whitespace(payload, key_end)
+            if payload[pos : pos + 1] != b":":
+                return None
+            pos = _skip_whitespace(payload, pos + 1)
+
+            value_end = _skip_value(payload, pos, max_bytes)
+            if key in fields and key not in found:
+                found[key] = orjson.loads(payload[pos:value_end])
+                if len(found) == len(fields):
+                    return found
+
+            pos = _skip_whitespace(payload, value_end)
+            separator = payload[pos : pos + 1]
+            if separator == b"}":
+                return found
+            if separator != b",":
+                return None
+            pos = _skip_whitespace(payload, pos + 1)
+            if pos >= max_bytes:
+                return None
+    except (_ScanError, orjson.JSONDecodeError):
+        return None
+
+
+class LazyEventPayload:
+    """
+    A view of a JSON event payload, which only parses the whole payload once `data` is accessed.
+
+    The routing fields (`type`) are extracted from the raw payload instead, so that events which
+    are load-shed based on them are never fully parsed.
+    """
+
+    ROUTING_FIELDS = ("type",)
+
+    def __init__(self, payload: str | bytes):
+        self.payload = payload
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        return orjson.loads(self.payload)
+
+    @cached_property
+    def _routing_fields(self) -> dict[str, Any]:
+        if "data" in self.__dict__:
+            return {field: self.data[field] for field in self.ROUTING_FIELDS if field in self.data}
+
+        payload = self.payload
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        fields = scan_top_level_fields(payload, self.ROUTING_FIELDS)
+        if fields is None:
+            return {field: self.data[field] for field in self.ROUTING_FIELDS if field in self.data}
+        return fields
+
+    @property
+    def type(self) -> str | None:
+        return self._routing_fields.get("type")
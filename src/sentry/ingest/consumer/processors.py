@@ -6,8 +6,8 @@ from typing import Any
 
 import orjson
 import sentry_sdk
+from arroyo.types import Partition
 from django.conf import settings
-from django.core.cache import cache
 from usageaccountant import UsageUnit
 
 from sentry import eventstore, features
@@ -15,6 +15,8 @@ from sentry.attachments import CachedAttachment, attachment_cache
 from sentry.event_manager import EventManager, save_attachment
 from sentry.eventstore.processing import event_processing_store, transaction_processing_store
 from sentry.feedback.usecases.create_feedback import FeedbackCreationSource, is_in_feedback_denylist
+from sentry.ingest import deduplication
+from sentry.ingest.consumer.lazy_event import LazyEventPayload
 from sentry.ingest.types import ConsumerType
 from sentry.ingest.userreport import Conflict, save_userreport
 from sentry.killswitches import killswitch_matches_context
@@ -97,9 +99,14 @@ def process_event(
     project: Project,
     reprocess_only_stuck_events: bool = False,
     no_celery_mode: bool = False,
+    partition: Partition | None = None,
 ) -> None:
     """
     Perform some initial filtering and deserialize the message payload.
+
+    `partition` is the Kafka partition the message was consumed from. It's only passed by
+    consumers which process every message of the partition in this process, whose deduplication
+    can then be sped up by a bloom filter of the partition.
     """
     payload = message["payload"]
     start_time = float(message["start_time"])
@@ -125,15 +132,16 @@ def process_event(
     # This code has been ripped from the old python store endpoint. We're
     # keeping it around because it does provide some protection against
     # reprocessing good events if a single consumer is in a restart loop.
+    #
+    # The store can be switched to Redis with `SENTRY_INGEST_DEDUPLICATION_STORE`, which does keep
+    # events for the whole TTL.
     with sentry_sdk.start_span(op="deduplication_check"):
-        deduplication_key = f"ev:{project_id}:{event_id}"
-
         try:
-            cached_value = cache.get(deduplication_key)
+            duplicate = deduplication.is_duplicate(project_id, event_id, partition)
         except Exception as exc:
             raise Retriable(exc)
 
-        if cached_value is not None:
+        if duplicate:
             logger.warning(
                 "pre-process-forwarder detected a duplicated event" " with id:%s for project:%s.",
                 event_id,
@@ -156,20 +164,22 @@ def process_event(
             # cause additional load on our logging infrastructure
             return
 
-    # Parse the JSON payload. This is required to compute the cache key and
-    # call process_event. The payload will be put into Kafka raw, to avoid
+    # Only the event type is read from the payload until the event has made it past load shedding,
+    # so that load-shed events are never fully parsed. The full parse is required to compute the
+    # cache key and call process_event. The payload will be put into Kafka raw, to avoid
     # serializing it again.
-    with sentry_sdk.start_span(op="orjson.loads"):
-        data = orjson.loads(payload)
+    event = LazyEventPayload(payload)
+    with sentry_sdk.start_span(op="ingest_consumer.scan_event_type"):
+        event_type = event.type
 
     # We also need to check "type" as transactions are also sent to ingest-attachments
     # along with other event types if they have attachments.
-    if consumer_type == ConsumerType.Transactions or data.get("type") == "transaction":
+    if consumer_type == ConsumerType.Transactions or event_type == "transaction":
         processing_store = transaction_processing_store
     else:
         processing_store = event_processing_store
 
-    sentry_sdk.set_extra("event_type", data.get("type"))
+    sentry_sdk.set_extra("event_type", event_type)
 
     with sentry_sdk.start_span(
         op="killswitch_matches_context", name="store.load-shed-parsed-pipeline-projects"
@@ -179,13 +189,17 @@ def process_event(
             {
                 "organization_id": project.organization_id,
                 "project_id": project.id,
-                "event_type": data.get("type") or "null",
+                "event_type": event_type or "null",
                 "has_attachments": bool(attachments),
                 "event_id": event_id,
             },
         ):
             return
 
+    # Parse errors are not retriable, so the full parse happens outside of the block below.
+    with sentry_sdk.start_span(op="orjson.loads"):
+        data = event.data
+
     # Raise the retriable exception and skip DLQ if anything below this point fails as it may be caused by
     # intermittent network issue
     try:
@@ -215,7 +229,6 @@ def process_event(
         try:
             # Records rc-processing usage broken down by
             # event type.
-            event_type = data.get("type")
             if event_type == "error":
                 app_feature = "errors"
             elif event_type == "transaction":
@@ -228,7 +241,7 @@ def process_event(
         except Exception:
             pass
 
-        if data.get("type") == "transaction":
+        if event_type == "transaction":
             if no_celery_mode:
                 with sentry_sdk.start_span(op="ingest_consumer.process_transaction_no_celery"):
                     sentry_sdk.set_tag("no_celery_mode", True)
@@ -250,7 +263,7 @@ def process_event(
                 collect_span_metrics(project, data)
             except Exception:
                 pass
-        elif data.get("type") == "feedback":
+        elif event_type == "feedback":
             if not is_in_feedback_denylist(project.organization):
                 save_event_feedback.delay(
                     cache_key=None,  # no need to cache as volume is low
@@ -275,9 +288,9 @@ def process_event(
                     has_attachments=bool(attachments),
                 )
 
-        # remember for an 1 hour that we saved this event (deduplication protection)
-        with sentry_sdk.start_span(op="cache.set"):
-            cache.set(deduplication_key, "", CACHE_TIMEOUT)
+        # remember that we saved this event (deduplication protection)
+        with sentry_sdk.start_span(op="deduplication.mark_processed"):
+            deduplication.mark_processed(project_id, event_id, partition)
 
         # emit event_accepted once everything is done
         with sentry_sdk.start_span(op="event_accepted.send_robust"):
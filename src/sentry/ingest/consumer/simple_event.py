@@ -18,6 +18,7 @@ def process_simple_event_message(
     consumer_type: str,
     reprocess_only_stuck_events: bool,
     no_celery_mode: bool = False,
+    deduplicate_per_partition: bool = False,
 ) -> None:
     """
     Processes a single Kafka Message containing a "simple" Event payload.
@@ -33,6 +34,9 @@ def process_simple_event_message(
       `symbolicate_event` or `process_event`.
 
     No celery mode only applies to the transactions consumer.
+
+    `deduplicate_per_partition` may only be set if every message of a partition is processed in
+    this process, see `sentry.ingest.deduplication.is_duplicate`.
     """
 
     raw_payload = raw_message.payload.value
@@ -58,12 +62,19 @@ def process_simple_event_message(
         except Project.DoesNotExist:
             return
 
+        partition = None
+        if deduplicate_per_partition:
+            raw_value = raw_message.value
+            assert isinstance(raw_value, BrokerValue)
+            partition = raw_value.partition
+
         return process_event(
             consumer_type,
             message,
             project,
             reprocess_only_stuck_events,
             no_celery_mode,
+            partition=partition,
         )
 
     except Exception as exc:
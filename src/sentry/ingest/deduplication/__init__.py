@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from arroyo.types import Partition
+from django.conf import settings
+
+from sentry import options
+from sentry.utils import metrics
+from sentry.utils.services import LazyServiceWrapper
+
+from .base import DEFAULT_TTL, EventDeduplicationStore, get_deduplication_key
+from .bloom import PartitionBloomFilters
+
+backend = LazyServiceWrapper(
+    EventDeduplicationStore,
+    settings.SENTRY_INGEST_DEDUPLICATION_STORE,
+    settings.SENTRY_INGEST_DEDUPLICATION_STORE_OPTIONS,
+)
+
+# About 0.9MB per generation and partition
+BLOOM_FILTER_CAPACITY = 500_000
+BLOOM_FILTER_ERROR_RATE = 0.001
+
+_partition_filters = PartitionBloomFilters(
+    BLOOM_FILTER_CAPACITY,
+    BLOOM_FILTER_ERROR_RATE,
+    max_age=DEFAULT_TTL,
+)
+
+
+def is_duplicate(project_id: int, event_id: str, partition: Partition | None = None) -> bool:
+    """
+    Whether the given event has been processed already.
+
+    If the event was consumed from `partition`, and this process consumes every event of it, the
+    partition's bloom filter is consulted first. Events which it has certainly not seen aren't
+    looked up in the deduplication store. Such events are then not recognized as duplicates of
+    events consumed from another partition, or of events processed by another consumer (like the
+    attachments consumer), which the deduplication store would have caught.
+    """
+    if partition is not None and options.get("ingest.deduplication.bloom-front.enabled"):
+        warmup = options.get("ingest.deduplication.bloom-front.warmup")
+        if not _partition_filters.is_warm(partition, warmup):
+            metrics.incr("ingest_consumer.deduplication.bloom", tags={"result": "cold"})
+        elif get_deduplication_key(project_id, event_id).encode() in _partition_filters.get(
+            partition
+        ):
+            metrics.incr("ingest_consumer.deduplication.bloom", tags={"result": "positive"})
+            if not backend.is_duplicate(project_id, event_id):
+                metrics.incr("ingest_consumer.deduplication.bloom_false_positive")
+                return False
+            metrics.incr("ingest_consumer.deduplication.duplicate")
+            return True
+        else:
+            metrics.incr("ingest_consumer.deduplication.bloom", tags={"result": "negative"})
+            return False
+
+    if backend.is_duplicate(project_id, event_id):
+        metrics.incr("ingest_consumer.deduplication.duplicate")
+        return True
+    return False
+
+
+def mark_processed(project_id: int, event_id: str, partition: Partition | None = None) -> None:
+    """
+    Remember that the given event has been processed, both in the deduplication store and in the
+    bloom filter of the partition it was consumed from.
+    """
+    backend.mark_processed(project_id, event_id)
+    if partition is not None:
+        # Filters are kept up to date even while they aren't consulted, so that they can be
+        # trusted as soon as they are enabled again.
+        _partition_filters.get(partition).add(get_deduplication_key(project_id, event_id).encode())
+
+
+def reset_partitions() -> None:
+    """
+    Forget the bloom filters of all partitions, once partitions have been (re)assigned to this
+    consumer.
+    """
+    _partition_filters.reset()
+
+
+__all__ = ["backend", "is_duplicate", "mark_processed", "reset_partitions"]
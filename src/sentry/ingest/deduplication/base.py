@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from sentry.utils.services import Service
+
+# Events are remembered for an hour after they were processed
+DEFAULT_TTL = 60 * 60
+
+
+class EventDeduplicationStore(Service):
+    """
+    Remembers which events the ingest consumer has processed, so that events which are consumed
+    twice (because a consumer died before it could commit its offsets, or because an SDK sent the
+    same event twice) are only processed once.
+
+    Events are only remembered for a limited time, configured with the ``ttl`` option. This base
+    implementation doesn't remember anything.
+    """
+
+    __all__ = ("is_duplicate", "mark_processed")
+
+    def __init__(self, **options):
+        self.ttl = options.pop("ttl", DEFAULT_TTL)
+
+    def is_duplicate(self, project_id: int, event_id: str) -> bool:
+        """Whether the given event has been processed already."""
+        return False
+
+    def mark_processed(self, project_id: int, event_id: str) -> None:
+        """Remember that the given event has been processed."""
+
+
+def get_deduplication_key(project_id: int, event_id: str) -> str:
+    return f"ev:{project_id}:{event_id}"
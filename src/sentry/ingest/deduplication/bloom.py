@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections.abc import Hashable
+
+
+class BloomFilter:
+    """
+    A fixed-size set of keys which can tell for sure that a key was never added, but may wrongly
+    claim that a key was added with a probability of about `error_rate` once `capacity` keys were
+    added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Double hashing: all positions are derived from the two halves of a single digest.
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+
+class RotatingBloomFilter:
+    """
+    A bloom filter which forgets keys over time.
+
+    Keys are added to the current generation, and looked up in both the current and the previous
+    one. Once the current generation is full or older than `max_age` seconds, it replaces the
+    previous one, so keys are remembered for at least `max_age` seconds unless more than
+    `capacity` keys are added in that time.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, max_age: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_age = max_age
+        self._previous: BloomFilter | None = None
+        self._current = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+        # The number of keys added over all generations
+        self.added = 0
+
+    def _maybe_rotate(self) -> None:
+        if (
+            self._current.count >= self.capacity
+            or time.monotonic() - self._rotated_at >= self.max_age
+        ):
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+
+    def add(self, key: bytes) -> None:
+        self._maybe_rotate()
+        self._current.add(key)
+        self.added += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._current or (self._previous is not None and key in self._previous)
+
+
+class PartitionBloomFilters:
+    """
+    Rotating bloom filters of the events processed from each Kafka partition.
+
+    A filter only knows about events processed by this process since the partition was assigned
+    to it. The events consumed right after an assignment may have been processed by the previous
+    owner of the partition already, so a filter can only vouch for events it doesn't know about
+    once it is warm, that is once it has remembered enough events.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, max_age: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_age = max_age
+        self._filters: dict[Hashable, RotatingBloomFilter] = {}
+
+    def get(self, partition: Hashable) -> RotatingBloomFilter:
+        bloom_filter = self._filters.get(partition)
+        if bloom_filter is None:
+            bloom_filter = self._filters[partition] = RotatingBloomFilter(
+                self.capacity, self.error_rate, self.max_age
+            )
+        return bloom_filter
+
+    def is_warm(self, partition: Hashable, warmup: int) -> bool:
+        """Whether the filter of the given partition has remembered at least `warmup` events."""
+        bloom_filter = self._filters.get(partition)
+        return bloom_filter is not None and bloom_filter.added >= warmup
+
+    def reset(self) -> None:
+        """
+        Forget all partitions, after partitions were (re)assigned to this process. Filters of
+        partitions which were revoked would otherwise be kept for as long as the process runs.
+        """
+        self._filters.clear()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+
+from .base import EventDeduplicationStore, get_deduplication_key
+
+
+class DjangoCacheEventDeduplicationStore(EventDeduplicationStore):
+    """
+    Remembers processed events in the default Django cache. In production this is memcached,
+    which may evict entries at any time, so this only offers best-effort deduplication.
+    """
+
+    def is_duplicate(self, project_id: int, event_id: str) -> bool:
+        return cache.get(get_deduplication_key(project_id, event_id)) is not None
+
+    def mark_processed(self, project_id: int, event_id: str) -> None:
+        cache.set(get_deduplication_key(project_id, event_id), "", self.ttl)
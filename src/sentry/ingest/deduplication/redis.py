@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry.utils.redis import redis_clusters
+
+from .base import EventDeduplicationStore, get_deduplication_key
+
+
+class RedisEventDeduplicationStore(EventDeduplicationStore):
+    """
+    Remembers processed events in a Redis cluster, configured with the ``cluster`` option. Unlike
+    memcached, entries are kept until their TTL expires unless the cluster runs out of memory.
+    """
+
+    def __init__(self, **options):
+        self.cluster = options.pop("cluster", "default")
+        super().__init__(**options)
+
+    @property
+    def client(self) -> RedisCluster | StrictRedis:
+        return redis_clusters.get(self.cluster)
+
+    def is_duplicate(self, project_id: int, event_id: str) -> bool:
+        return bool(self.client.exists(get_deduplication_key(project_id, event_id)))
+
+    def mark_processed(self, project_id: int, event_id: str) -> None:
+        self.client.set(get_deduplication_key(project_id, event_id), b"", ex=self.ttl)
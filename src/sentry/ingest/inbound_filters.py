@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable, Sequence
 from typing import cast
 
@@ -336,6 +337,9 @@ def _error_message_condition(values: Sequence[tuple[str | None, str | None]]) ->
     )
 
 
+# The conditions of generic filters are the same for every project, so they are only built once.
+# They must not be modified.
+@functools.cache
 def _chunk_load_error_filter() -> RuleCondition:
     """
     Filters out chunk load errors.
@@ -353,6 +357,7 @@ def _chunk_load_error_filter() -> RuleCondition:
     return _error_message_condition(values)
 
 
+@functools.cache
 def _hydration_error_filter() -> RuleCondition:
     """
     Filters out hydration errors.
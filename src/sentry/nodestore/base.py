@@ -72,12 +72,17 @@ class NodeStorage(local, Service):
         "get_multi",
         "set",
         "set_bytes",
+        "set_bytes_multi",
         "set_subkeys",
+        "set_subkeys_multi",
         "cleanup",
         "validate",
         "bootstrap",
     )
 
+    # How long nodes written without a TTL are kept, for backends which expire nodes on their own.
+    default_ttl: timedelta | None = None
+
     def delete(self, id: str) -> None:
         """
         >>> nodestore.delete('key1')
@@ -144,7 +149,7 @@ class NodeStorage(local, Service):
                     metrics.incr("nodestore.get", tags={"cache": "hit"})
                     span.set_tag("origin", "from_cache")
                     span.set_tag("found", bool(item_from_cache))
-                    return item_from_cache
+                    return self._assemble_one(item_from_cache)
 
             span.set_tag("subkey", str(subkey))
             bytes_data = self._get_bytes(id)
@@ -159,7 +164,7 @@ class NodeStorage(local, Service):
             span.set_tag("found", bool(rv))
             metrics.incr("nodestore.get", tags={"cache": "miss", "found": bool(rv)})
 
-            return rv
+            return self._assemble_one(rv)
 
     def _get_bytes_multi(self, id_list: list[str]) -> dict[str, bytes | None]:
         """
@@ -187,7 +192,7 @@ class NodeStorage(local, Service):
                 cache_items = self._get_cache_items(id_list)
                 if len(cache_items) == len(id_list):
                     span.set_tag("result", "from_cache")
-                    return cache_items
+                    return self._assemble_many(cache_items)
 
                 uncached_ids = [id for id in id_list if id not in cache_items]
             else:
@@ -205,8 +210,41 @@ class NodeStorage(local, Service):
             span.set_tag("result", "from_service")
             span.set_tag("found", len(items))
 
+            return self._assemble_many(items)
+
+    def _assemble_one(self, item: Any) -> Any:
+        # Imported here as the event models, which the eventstore package imports, import nodestore.
+        from sentry.eventstore import compressor
+
+        if not compressor.get_checksums(item):
+            return item
+        return self._assemble_many({None: item})[None]
+
+    def _assemble_many(self, items: dict[Any, Any]) -> dict[Any, Any]:
+        """
+        Put the blobs deduplicated by the event compressor back into the given items. The blobs
+        referenced by all items are fetched at once.
+        """
+        from sentry.eventstore import compressor
+
+        checksums = {
+            checksum for item in items.values() for checksum in compressor.get_checksums(item)
+        }
+        if not checksums:
             return items
 
+        with sentry_sdk.start_span(op="nodestore.assemble") as span:
+            span.set_tag("num_blobs", len(checksums))
+            blobs = self.get_multi([compressor.get_blob_id(checksum) for checksum in checksums])
+            blobs_by_checksum = {
+                checksum: blobs.get(compressor.get_blob_id(checksum)) for checksum in checksums
+            }
+            for item in items.values():
+                if compressor.get_checksums(item):
+                    compressor.assemble(item, lambda _: blobs_by_checksum)
+
+        return items
+
     def _encode(self, data: dict[str | None, Mapping[str, Any]]) -> bytes:
         """
         Encode data dict in a way where its keys can be deserialized
@@ -234,6 +272,20 @@ class NodeStorage(local, Service):
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
 
+    def set_bytes_multi(self, items: dict[str, bytes], ttl: timedelta | None = None) -> None:
+        """
+        >>> nodestore.set_bytes_multi({'key1': b"{'foo': 'bar'}", 'key2': b"{'foo': 'baz'}"})
+        """
+        for data in items.values():
+            metrics.distribution("nodestore.set_bytes", len(data))
+        return self._set_bytes_multi(items, ttl)
+
+    def _set_bytes_multi(self, items: dict[str, bytes], ttl: timedelta | None = None) -> None:
+        # This implementation can/should be overridden by concrete subclasses
+        # to write all items in a single request where possible.
+        for item_id, data in items.items():
+            self._set_bytes(item_id, data, ttl)
+
     def set(self, item_id: str, data: Mapping[str, Any], ttl: timedelta | None = None) -> None:
         """
         Set value for `item_id`. Note that this deletes existing subkeys for `item_id` as
@@ -267,6 +319,27 @@ class NodeStorage(local, Service):
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
             self._set_cache_item(item_id, cache_item)
 
+    @sentry_sdk.tracing.trace
+    def set_subkeys_multi(
+        self,
+        items: dict[str, dict[str | None, Mapping[str, Any]]],
+        ttl: timedelta | None = None,
+    ) -> None:
+        """
+        Set values and subkeys for multiple items at once, see `set_subkeys`.
+
+        >>> nodestore.set_subkeys_multi({
+        ...    'key1': {None: {'foo': 'bar'}, "reprocessing": {'foo': 'bam'}},
+        ...    'key2': {None: {'foo': 'baz'}},
+        ... })
+        """
+        cache_items = {item_id: data.get(None) for item_id, data in items.items()}
+        bytes_data = {item_id: self._encode(data) for item_id, data in items.items()}
+        self.set_bytes_multi(bytes_data, ttl=ttl)
+        # set cache only after encoding and write to nodestore has succeeded
+        if options.get("nodestore.set-subkeys.enable-set-cache-item"):
+            self._set_cache_items({k: v for k, v in cache_items.items() if v})
+
     def cleanup(self, cutoff_timestamp: datetime) -> None:
         raise NotImplementedError
 
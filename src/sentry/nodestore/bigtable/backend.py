@@ -60,6 +60,7 @@ class BigtableNodeStorage(NodeStorage):
             compression=_compression,
             client_options=client_options,
         )
+        self.default_ttl = default_ttl
         self.automatic_expiry = automatic_expiry
         self.skip_deletes = automatic_expiry and "_SENTRY_CLEANUP" in os.environ
 
@@ -76,6 +77,10 @@ class BigtableNodeStorage(NodeStorage):
     def _set_bytes(self, id: str, data: Any, ttl: timedelta | None = None) -> None:
         self.store.set(id, data, ttl)
 
+    @sentry_sdk.tracing.trace
+    def _set_bytes_multi(self, items: dict[str, bytes], ttl: timedelta | None = None) -> None:
+        self.store.set_many(items, ttl)
+
     def delete(self, id: str) -> None:
         if self.skip_deletes:
             return
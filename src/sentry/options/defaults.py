@@ -822,6 +822,51 @@ register(
 # Killswitch to stop storing any reprocessing payloads.
 register("store.reprocessing-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Share of events of existing groups which skip buffering group values that are unchanged since
+# the process last buffered them
+register(
+    "store.hot-group-cache.rollout",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Share of events saved to nodestore with their repeating interfaces (like modules, SDK info and
+# host contexts) pulled out into content-addressed blobs which are shared by events. Blobs are
+# not deleted with events and expire up to an hour after the last event referencing them.
+register(
+    "nodestore.compressor.rollout",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The encoding events are written to the processing store in, one of `json`, `msgpack` and
+# `msgpack+zstd`. Events are read back in whichever encoding they were written.
+register(
+    "eventstore.processing.encoding",
+    type=String,
+    default="json",
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Consult per-partition bloom filters before the deduplication store in single-process ingest
+# consumers, skipping the store for events the filters have certainly not seen
+register(
+    "ingest.deduplication.bloom-front.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# The number of events a partition's bloom filter has to remember after the partition was
+# assigned before it is consulted, as the previous owner may have processed those already
+register(
+    "ingest.deduplication.bloom-front.warmup",
+    type=Int,
+    default=10_000,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Enable calling the severity modeling API on group creation
 register(
     "processing.calculate-severity-on-group-creation",
@@ -2055,6 +2100,27 @@ register("hybridcloud.integrationproxy.retries", default=5, flags=FLAG_AUTOMATOR
 register("hybridcloud.endpoint_flag_logging", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_retry_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_timeout_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Maximum number of calls sent in a single request by an RPC batch
+register("hybridcloud.rpc.batch_size", default=50, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Send the calls of an RPC batch to the `rpc/batch/` endpoint. Only enable this once every silo
+# serves the endpoint, until then the calls of a batch are sent one by one.
+register(
+    "hybridcloud.rpc.batch-calls",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of coalesced messages delivered together to the batch handler
+# of an outbox category.
+register("hybridcloud.outbox.batch_size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Deliver batches of audit log events with a single `record_audit_logs` RPC. Only enable this
+# once the control silo serves the method, until then every event is sent with an RPC of its own.
+register(
+    "hybridcloud.outbox.batch-audit-logs",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Webhook processing controls
 register(
     "hybridcloud.webhookpayload.worker_threads",
@@ -2909,6 +2975,22 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of threads that delete child relations of a deletion declared with
+# `parallel=True` (and following each other) concurrently.
+register(
+    "deletions.child-relations.concurrency",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Number of ready digest timelines delivered by a single task. With a batch
+# size of 1 every timeline is delivered by its own task.
+register(
+    "digests.delivery.batch_size",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "delayed_processing.batch_size",
     default=10000,
@@ -2944,6 +3026,27 @@ register(
     default=0.0,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Share of events whose grouphashes are looked up in the grouphash cache before the database
+register(
+    "grouping.grouphash_cache.rollout",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds grouphash records are kept in the grouphash cache
+register(
+    "grouping.grouphash_cache.timeout",
+    type=Int,
+    default=60 * 60,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Share of stacktraces whose grouping components are memoized in a process-local cache
+register(
+    "grouping.component_cache.rollout",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 register(
     "ecosystem:enable_integration_form_error_raise", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import threading
+import time
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
@@ -11,7 +13,7 @@ from sentry_redis_tools.sliding_windows_rate_limiter import (
 from sentry_redis_tools.sliding_windows_rate_limiter import RequestedQuota, Timestamp
 
 from sentry.exceptions import InvalidConfiguration
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.services import Service
 
 __all__ = ["Quota", "GrantedQuota", "RequestedQuota", "Timestamp"]
@@ -158,3 +160,281 @@ class RedisSlidingWindowRateLimiter(SlidingWindowRateLimiter):
         timestamp: Timestamp,
     ) -> None:
         return self.impl.use_quotas(requests, grants, timestamp)
+
+
+class _GranuleRing:
+    """
+    Fixed-size ring buffer of per-granule counters covering one quota window.
+
+    Slot `i` holds the count for the most recent granule whose index is
+    congruent to `i` modulo the ring size. Stale slots are lazily reset when
+    a newer granule maps onto them.
+    """
+
+    __slots__ = ("granularity_seconds", "granules", "counts")
+
+    def __init__(self, window_seconds: int, granularity_seconds: int) -> None:
+        size = max(1, window_seconds // granularity_seconds)
+        self.granularity_seconds = granularity_seconds
+        self.granules = [-1] * size
+        self.counts = [0] * size
+
+    def add(self, timestamp: Timestamp, amount: int) -> None:
+        granule = timestamp // self.granularity_seconds
+        index = granule % len(self.counts)
+        if self.granules[index] != granule:
+            self.granules[index] = granule
+            self.counts[index] = 0
+        self.counts[index] += amount
+
+    def total(self, timestamp: Timestamp) -> int:
+        newest = timestamp // self.granularity_seconds
+        oldest = newest - len(self.counts) + 1
+        return sum(
+            count
+            for granule, count in zip(self.granules, self.counts)
+            if oldest <= granule <= newest
+        )
+
+    def drain(self) -> list[tuple[Timestamp, int]]:
+        """
+        Return all non-zero `(timestamp, count)` pairs and reset their counters.
+        """
+        drained = []
+        for index, (granule, count) in enumerate(zip(self.granules, self.counts)):
+            if count:
+                drained.append((granule * self.granularity_seconds, count))
+                self.counts[index] = 0
+        return drained
+
+
+class _LocalQuotaState:
+    __slots__ = ("prefix", "quota", "ring", "remote_used", "pending", "flushing", "last_used")
+
+    def __init__(self, prefix: str, quota: Quota, timestamp: Timestamp) -> None:
+        self.prefix = prefix
+        self.quota = quota
+        self.ring = _GranuleRing(quota.window_seconds, quota.granularity_seconds)
+        # Usage of the whole window as last observed in Redis, including
+        # everything this process has already flushed.
+        self.remote_used = 0
+        # Usage consumed locally since the last flush to Redis.
+        self.pending = 0
+        # Usage drained from the ring which is being flushed to Redis right now.
+        self.flushing = 0
+        self.last_used = timestamp
+
+    def used(self, timestamp: Timestamp) -> int:
+        return self.remote_used + self.flushing + self.ring.total(timestamp)
+
+
+_LocalQuotaKey = tuple[str, Quota]
+
+
+class ApproximateRedisSlidingWindowRateLimiter(RedisSlidingWindowRateLimiter):
+    """
+    A sliding window rate limiter that checks and consumes quotas against
+    in-memory counters and only periodically synchronizes with Redis.
+
+    Each quota is tracked locally as a ring buffer of granule counters. Usage
+    consumed in this process is flushed to Redis as deltas, at the latest
+    every `sync_interval_ms`, at which point the view of the usage of all
+    other processes is refreshed as well.
+
+    This trades accuracy for throughput: between two syncs, other processes'
+    consumption is not visible, so the effective limit can be overshot. The
+    local share of that overshoot is bounded by `max_overshoot`, a fraction of
+    each quota's limit; once the unflushed usage of any quota exceeds it, a
+    sync is forced. With N processes sharing a quota, the worst case overshoot
+    is therefore roughly `N * max_overshoot * limit`.
+
+    Usage observed in Redis is a snapshot of the whole window at sync time and
+    does not slide until the next sync, so in between syncs the limiter errs
+    on the side of granting too little rather than too much.
+
+    The local state is guarded by a lock, which is never held while talking
+    to Redis: a sync drains the pending usage under the lock, flushes it and
+    refreshes the global usage without it, and then merges the results back.
+    Only one sync runs at a time, other threads keep using the local state
+    meanwhile.
+
+    :param sync_interval_ms: Maximum time between two syncs with Redis.
+    :param max_overshoot: Fraction of a quota's limit that may be consumed
+        locally before a sync is forced.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self.sync_interval = options.pop("sync_interval_ms", 1000) / 1000.0
+        self.max_overshoot = options.pop("max_overshoot", 0.1)
+        self._lock = threading.Lock()
+        self._states: dict[_LocalQuotaKey, _LocalQuotaState] = {}
+        self._last_sync = time.monotonic()
+        self._syncing = False
+        super().__init__(**options)
+
+    def check_within_quotas(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
+    ) -> tuple[Timestamp, Sequence[GrantedQuota]]:
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self._sync(timestamp)
+
+        keys = {
+            (quota.prefix_override or request.prefix, quota)
+            for request in requests
+            for quota in request.quotas
+        }
+        while True:
+            with self._lock:
+                missing = [key for key in keys if key not in self._states]
+                if not missing:
+                    return timestamp, self._grant(requests, timestamp)
+
+            # Quotas seen for the first time are looked up in Redis, and only
+            # added if no other thread did so in the meantime.
+            states = [_LocalQuotaState(prefix, quota, timestamp) for prefix, quota in missing]
+            self._refresh(states, timestamp)
+            with self._lock:
+                for state in states:
+                    self._states.setdefault((state.prefix, state.quota), state)
+
+    def _grant(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp
+    ) -> list[GrantedQuota]:
+        grants = []
+        for request in requests:
+            granted = request.requested
+            reached_quotas = []
+            for quota in request.quotas:
+                state = self._states[(quota.prefix_override or request.prefix, quota)]
+                remaining = max(0, quota.limit - state.used(timestamp))
+                if remaining < request.requested:
+                    reached_quotas.append(quota)
+                granted = min(granted, remaining)
+
+            grants.append(
+                GrantedQuota(prefix=request.prefix, granted=granted, reached_quotas=reached_quotas)
+            )
+        return grants
+
+    def use_quotas(
+        self,
+        requests: Sequence[RequestedQuota],
+        grants: Sequence[GrantedQuota],
+        timestamp: Timestamp,
+    ) -> None:
+        needs_sync = time.monotonic() - self._last_sync >= self.sync_interval
+
+        with self._lock:
+            for request, grant in zip(requests, grants):
+                if grant.granted <= 0:
+                    continue
+
+                for quota in request.quotas:
+                    key = (quota.prefix_override or request.prefix, quota)
+                    state = self._states.get(key)
+                    if state is None:
+                        state = self._states[key] = _LocalQuotaState(key[0], quota, timestamp)
+                    state.ring.add(timestamp, grant.granted)
+                    state.pending += grant.granted
+                    state.last_used = timestamp
+                    if state.pending > quota.limit * self.max_overshoot:
+                        needs_sync = True
+
+        if needs_sync:
+            self._sync(timestamp)
+
+    def sync(self, timestamp: Timestamp | None = None) -> None:
+        """
+        Flush all locally consumed quota to Redis and refresh the local view
+        of the global usage. Does nothing if another thread is syncing already.
+        """
+        self._sync(int(time.time()) if timestamp is None else timestamp)
+
+    def _sync(self, timestamp: Timestamp) -> None:
+        with self._lock:
+            if self._syncing:
+                return
+            self._syncing = True
+
+            drained: list[tuple[_LocalQuotaState, list[tuple[Timestamp, int]]]] = []
+            for key, state in list(self._states.items()):
+                if not state.pending:
+                    if state.last_used + state.quota.window_seconds < timestamp:
+                        # Nothing consumed for a whole window, stop tracking it.
+                        del self._states[key]
+                    continue
+
+                counts = state.ring.drain()
+                state.flushing += sum(count for _, count in counts)
+                state.pending = 0
+                drained.append((state, counts))
+            states = list(self._states.values())
+
+        flushed = False
+        remote_used: list[int] | None = None
+        try:
+            with metrics.timer("ratelimits.sliding_windows.approximate.sync"):
+                deltas: dict[Timestamp, tuple[list[RequestedQuota], list[GrantedQuota]]] = {}
+                for state, counts in drained:
+                    for granule_timestamp, count in counts:
+                        requests, grants = deltas.setdefault(granule_timestamp, ([], []))
+                        requests.append(
+                            RequestedQuota(
+                                prefix=state.prefix, requested=count, quotas=[state.quota]
+                            )
+                        )
+                        grants.append(
+                            GrantedQuota(prefix=state.prefix, granted=count, reached_quotas=[])
+                        )
+
+                for granule_timestamp, (requests, grants) in deltas.items():
+                    super().use_quotas(requests, grants, granule_timestamp)
+                flushed = True
+
+                remote_used = self._get_remote_used(states, timestamp)
+        finally:
+            with self._lock:
+                for state, counts in drained:
+                    if not flushed:
+                        # Keep the usage around to be flushed with the next sync.
+                        for granule_timestamp, count in counts:
+                            state.ring.add(granule_timestamp, count)
+                            state.pending += count
+                    elif remote_used is None:
+                        # Flushed, but not refreshed: count it as global usage.
+                        state.remote_used += state.flushing
+                    state.flushing = 0
+                if remote_used is not None:
+                    for state, used in zip(states, remote_used):
+                        state.remote_used = used
+                self._last_sync = time.monotonic()
+                self._syncing = False
+
+        metrics.incr("ratelimits.sliding_windows.approximate.synced_quotas", amount=len(states))
+
+    def _refresh(self, states: Iterable[_LocalQuotaState], timestamp: Timestamp) -> None:
+        to_refresh = list(states)
+        for state, used in zip(to_refresh, self._get_remote_used(to_refresh, timestamp)):
+            state.remote_used = used
+
+    def _get_remote_used(
+        self, states: Sequence[_LocalQuotaState], timestamp: Timestamp
+    ) -> list[int]:
+        if not states:
+            return []
+
+        # Requesting the full limit of a single quota makes the granted amount
+        # equal to whatever is left of it, which tells us the current usage.
+        _, grants = super().check_within_quotas(
+            [
+                RequestedQuota(
+                    prefix=state.prefix, requested=state.quota.limit, quotas=[state.quota]
+                )
+                for state in states
+            ],
+            timestamp,
+        )
+        return [state.quota.limit - grant.granted for state, grant in zip(states, grants)]
@@ -9,6 +9,7 @@ and perform RPC calls to propagate changes to Control Silo.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from django.dispatch import receiver
@@ -17,8 +18,9 @@ from sentry import options
 from sentry.audit_log.services.log import AuditLogEvent, UserIpEvent, log_rpc_service
 from sentry.auth.services.auth import auth_service
 from sentry.auth.services.orgauthtoken import orgauthtoken_rpc_service
+from sentry.hybridcloud.models.outbox import RegionOutboxBase
 from sentry.hybridcloud.outbox.category import OutboxCategory
-from sentry.hybridcloud.outbox.signals import process_region_outbox
+from sentry.hybridcloud.outbox.signals import process_region_outbox, process_region_outbox_batch
 from sentry.hybridcloud.services.organization_mapping import organization_mapping_service
 from sentry.hybridcloud.services.organization_mapping.model import CustomerId
 from sentry.hybridcloud.services.organization_mapping.serial import (
@@ -41,6 +43,24 @@ def process_audit_log_event(payload: Any, **kwds: Any):
         log_rpc_service.record_audit_log(event=AuditLogEvent(**payload))
 
 
+@receiver(process_region_outbox_batch, sender=OutboxCategory.AUDIT_LOG_EVENT)
+def process_audit_log_events(messages: Sequence[RegionOutboxBase], **kwds: Any):
+    # Every audit log event is a message of its own, deliver all events
+    # queued for an organization with a single RPC.
+    events = [
+        AuditLogEvent(**message.payload) for message in messages if message.payload is not None
+    ]
+    if not events:
+        return
+
+    # The control silo may not serve `record_audit_logs` yet while silos are deployed.
+    if not options.get("hybridcloud.outbox.batch-audit-logs"):
+        for event in events:
+            log_rpc_service.record_audit_log(event=event)
+        return
+    log_rpc_service.record_audit_logs(events=events)
+
+
 @receiver(process_region_outbox, sender=OutboxCategory.ORGAUTHTOKEN_UPDATE_USED)
 def process_orgauthtoken_update(payload: Any, **kwds: Any):
     if payload is not None:
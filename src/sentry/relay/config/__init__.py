@@ -127,6 +127,14 @@ def get_public_key_configs(
     return public_keys
 
 
+def _unique_patterns(patterns: Sequence[str] | None) -> list[str]:
+    """
+    Drop repeated patterns from a filter's patterns, keeping their order. Relay compiles and
+    matches every pattern it gets, so repeated patterns only cost time for every event.
+    """
+    return list(dict.fromkeys(patterns or ()))
+
+
 def get_filter_settings(project: Project) -> Mapping[str, Any]:
     filter_settings = {}
 
@@ -137,18 +145,18 @@ def get_filter_settings(project: Project) -> Mapping[str, Any]:
         if settings is not None and settings.get("isEnabled", True):
             filter_settings[filter_id] = settings
 
-    error_messages: list[str] = []
-    if features.has("projects:custom-inbound-filters", project):
-        invalid_releases = project.get_option(f"sentry:{FilterTypes.RELEASES}")
+    # The options are read before the feature is checked, as most projects don't set them.
+    invalid_releases = _unique_patterns(project.get_option(f"sentry:{FilterTypes.RELEASES}"))
+    error_messages = _unique_patterns(project.get_option(f"sentry:{FilterTypes.ERROR_MESSAGES}"))
+    if (invalid_releases or error_messages) and features.has(
+        "projects:custom-inbound-filters", project
+    ):
         if invalid_releases:
             filter_settings["releases"] = {"releases": invalid_releases}
+        if error_messages:
+            filter_settings["errorMessages"] = {"patterns": error_messages}
 
-        error_messages += project.get_option(f"sentry:{FilterTypes.ERROR_MESSAGES}") or []
-
-    if error_messages:
-        filter_settings["errorMessages"] = {"patterns": error_messages}
-
-    blacklisted_ips = project.get_option("sentry:blacklisted_ips")
+    blacklisted_ips = _unique_patterns(project.get_option("sentry:blacklisted_ips"))
     if blacklisted_ips:
         filter_settings["clientIps"] = {"blacklistedIps": blacklisted_ips}
 
@@ -156,6 +164,7 @@ def get_filter_settings(project: Project) -> Mapping[str, Any]:
     if bool(project.get_option("sentry:csp_ignored_sources_defaults", True)):
         csp_disallowed_sources += DEFAULT_DISALLOWED_SOURCES
     csp_disallowed_sources += project.get_option("sentry:csp_ignored_sources", [])
+    csp_disallowed_sources = _unique_patterns(csp_disallowed_sources)
     if csp_disallowed_sources:
         filter_settings["csp"] = {"disallowedSources": csp_disallowed_sources}
 
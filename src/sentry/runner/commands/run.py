@@ -308,6 +308,38 @@ def taskworker_scheduler(redis_cluster: str, **options: Any) -> None:
     help="The number of tasks to process before choosing a new broker instance. Requires num-brokers > 1",
     default=taskworker_constants.DEFAULT_REBALANCE_AFTER,
 )
+@click.option(
+    "--fetch-batch-size",
+    help="The number of tasks to fetch from brokers at a time. 1 disables batched fetches.",
+    default=taskworker_constants.DEFAULT_WORKER_BATCH_SIZE,
+)
+@click.option(
+    "--result-batch-size",
+    help="The number of task results to deliver to brokers at a time. 1 disables batched delivery.",
+    default=taskworker_constants.DEFAULT_WORKER_BATCH_SIZE,
+)
+@click.option(
+    "--result-batch-timeout",
+    help="The maximum number of seconds to wait for a result batch to fill up before delivering it.",
+    default=taskworker_constants.DEFAULT_RESULT_BATCH_TIMEOUT,
+)
+@click.option(
+    "--transport",
+    help="How tasks and results are passed to and from child processes.",
+    type=click.Choice(["queue", "shm"]),
+    default="queue",
+)
+@click.option(
+    "--shm-ring-size",
+    help="The size in bytes of the per-child shared memory ring buffers of the shm transport.",
+    default=taskworker_constants.DEFAULT_SHM_RING_SIZE,
+)
+@click.option(
+    "--zygote",
+    is_flag=True,
+    default=False,
+    help="Fork child processes from a warmed up copy of the worker instead of the worker itself.",
+)
 @log_options()
 @configuration
 def taskworker(**options: Any) -> None:
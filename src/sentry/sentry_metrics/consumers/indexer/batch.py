@@ -19,7 +19,11 @@ from sentry_kafka_schemas.schema_types.snuba_metrics_v1 import Metric
 
 from sentry import options
 from sentry.options.rollout import in_random_rollout
-from sentry.sentry_metrics.aggregation_option_registry import get_aggregation_options
+from sentry.sentry_metrics.aggregation_option_registry import (
+    AggregationOption,
+    TimeWindow,
+    get_aggregation_options,
+)
 from sentry.sentry_metrics.configuration import MAX_INDEXED_COLUMN_LENGTH
 from sentry.sentry_metrics.consumers.indexer.common import (
     BrokerMeta,
@@ -114,6 +118,14 @@ class IndexerBatch:
         self.filtered_msg_meta: set[BrokerMeta] = set()
         self.parsed_payloads_by_meta: MutableMapping[BrokerMeta, ParsedMessage] = {}
 
+        # Strings to index are collected while messages are parsed, so that
+        # `extract_strings` does not have to walk every payload a second time.
+        self._strings: MutableMapping[UseCaseID, MutableMapping[OrgId, set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        # Metric names repeat heavily within a batch, only parse each MRI once.
+        self._use_case_ids_by_name: MutableMapping[str, UseCaseID] = {}
+
         self._extract_messages()
 
     @metrics.wraps("process_messages.extract_messages")
@@ -148,6 +160,7 @@ class IndexerBatch:
                 parsed_payload = self._extract_message(msg)
                 self._validate_message(parsed_payload)
                 self.parsed_payloads_by_meta[broker_meta] = parsed_payload
+                self._collect_strings(parsed_payload)
             except Exception as e:
                 self.invalid_msg_meta.add(broker_meta)
                 logger.exception(
@@ -176,8 +189,12 @@ class IndexerBatch:
             )
             raise
 
-        assert parsed_payload.get("name", None) is not None
-        parsed_payload["use_case_id"] = use_case_id = extract_use_case_id(parsed_payload["name"])
+        metric_name = parsed_payload.get("name", None)
+        assert metric_name is not None
+        use_case_id = self._use_case_ids_by_name.get(metric_name)
+        if use_case_id is None:
+            use_case_id = self._use_case_ids_by_name[metric_name] = extract_use_case_id(metric_name)
+        parsed_payload["use_case_id"] = use_case_id
 
         try:
             self.schema_validator(use_case_id.value, parsed_payload)
@@ -248,39 +265,24 @@ class IndexerBatch:
             )
             raise ValueError(f"Invalid metric tags: {tags}")
 
+    def _collect_strings(self, message: ParsedMessage) -> None:
+        tags = message.get("tags", {})
+        strings = self._strings[message["use_case_id"]][message["org_id"]]
+        strings.add(message["name"])
+        strings.update(tags.keys())
+        if self.__should_index_tag_values:
+            strings.update(tags.values())
+
     @metrics.wraps("process_messages.extract_strings")
     def extract_strings(self) -> Mapping[UseCaseID, Mapping[OrgId, set[str]]]:
-        strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]] = defaultdict(
-            lambda: defaultdict(set)
-        )
-
-        for broker_meta, message in self.parsed_payloads_by_meta.items():
-            if broker_meta in self.invalid_msg_meta or broker_meta in self.filtered_msg_meta:
-                continue
-
-            metric_name = message["name"]
-            use_case_id = message["use_case_id"]
-            org_id = message["org_id"]
-            tags = message.get("tags", {})
-
-            strings_in_message = {
-                metric_name,
-                *tags.keys(),
-            }
-
-            if self.__should_index_tag_values:
-                strings_in_message.update(tags.values())
-
-            strings[use_case_id][org_id].update(strings_in_message)
-
-        for use_case_id, org_mapping in strings.items():
+        for use_case_id, org_mapping in self._strings.items():
             metrics.gauge(
                 "process_messages.lookups_per_batch",
                 value=sum(len(parsed_strings) for parsed_strings in org_mapping.values()),
                 tags={"use_case": use_case_id.value},
             )
 
-        return strings
+        return self._strings
 
     @metrics.wraps("process_messages.reconstruct_messages")
     def reconstruct_messages(
@@ -290,6 +292,12 @@ class IndexerBatch:
     ) -> IndexerOutputMessageBatch:
         new_messages: MutableSequence[Message[RoutingPayload | KafkaPayload | InvalidMessage]] = []
         cogs_usage: MutableMapping[UseCaseID, int] = defaultdict(int)
+        # Resolved once per batch rather than once per message, both only
+        # depend on options and the metric name.
+        use_orjson = in_random_rollout("sentry-metrics.indexer.reconstruct.enable-orjson")
+        aggregation_options_by_name: MutableMapping[
+            str, dict[AggregationOption, TimeWindow] | None
+        ] = {}
 
         for message in self.outer_message.payload:
             used_tags: set[str] = set()
@@ -467,7 +475,11 @@ class IndexerBatch:
                         "value": old_payload_value["value"],
                         "sentry_received_timestamp": sentry_received_timestamp,
                     }
-                    if aggregation_options := get_aggregation_options(old_payload_value["name"]):
+                    if metric_name not in aggregation_options_by_name:
+                        aggregation_options_by_name[metric_name] = get_aggregation_options(
+                            metric_name
+                        )
+                    if aggregation_options := aggregation_options_by_name[metric_name]:
                         # TODO: This should eventually handle multiple aggregation options
                         option = list(aggregation_options.items())[0][0]
                         assert option is not None
@@ -480,7 +492,7 @@ class IndexerBatch:
                 with metrics.timer(
                     "metrics_consumer.reconstruct_messages.build_new_payload.json_step"
                 ):
-                    if in_random_rollout("sentry-metrics.indexer.reconstruct.enable-orjson"):
+                    if use_orjson:
                         serialized_msg = orjson.dumps(new_payload_value)
                     else:
                         serialized_msg = rapidjson.dumps(new_payload_value).encode()
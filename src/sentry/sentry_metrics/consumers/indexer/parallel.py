@@ -27,6 +27,7 @@ from sentry.sentry_metrics.consumers.indexer.routing_producer import (
     RoutingProducerStep,
 )
 from sentry.sentry_metrics.consumers.indexer.slicing_router import SlicingRouter
+from sentry.sentry_metrics.indexer.shared_table import SharedStringTable
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 from sentry.utils.kafka import delay_kafka_rebalance
 
@@ -110,6 +111,7 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         output_block_size: int | None,
         ingest_profile: str,
         indexer_db: str,
+        shared_string_table_slots: int = 0,
     ):
         from sentry.sentry_metrics.configuration import (
             IndexerStorage,
@@ -151,6 +153,12 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
             initializer=functools.partial(initialize_subprocess_state, self.config),
         )
 
+        # Lets all subprocesses share the strings any of them has resolved,
+        # instead of each one looking them up in the indexer cache again.
+        self.__shared_string_table: SharedStringTable | None = None
+        if shared_string_table_slots and processes > 1:
+            self.__shared_string_table = SharedStringTable.create(shared_string_table_slots)
+
         if use_case is UseCaseKey.PERFORMANCE and options.get(
             "sentry-metrics.synchronize-kafka-rebalances"
         ):
@@ -171,7 +179,12 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         )
 
         parallel_strategy = run_task_with_multiprocessing(
-            function=MessageProcessor(self.config).process_messages,
+            function=MessageProcessor(
+                self.config,
+                shared_string_table=(
+                    self.__shared_string_table.name if self.__shared_string_table else None
+                ),
+            ).process_messages,
             next_step=Unbatcher(next_step=producer),
             pool=self.__pool,
             max_batch_size=self.__max_parallel_batch_size,
@@ -189,6 +202,8 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
 
     def shutdown(self) -> None:
         self.__pool.close()
+        if self.__shared_string_table is not None:
+            self.__shared_string_table.close()
 
 
 def get_metrics_producer_strategy(
@@ -23,6 +23,7 @@ from sentry.sentry_metrics.consumers.indexer.tags_validator import (
 from sentry.sentry_metrics.indexer.base import StringIndexer
 from sentry.sentry_metrics.indexer.mock import MockIndexer
 from sentry.sentry_metrics.indexer.postgres.postgres_v2 import PostgresIndexer
+from sentry.sentry_metrics.indexer.shared_table import SharedStringTable, SharedTableIndexer
 from sentry.utils import metrics, sdk
 
 logger = logging.getLogger(__name__)
@@ -36,9 +37,21 @@ INGEST_CODEC: Codec[IngestMetric] = get_topic_codec(Topic.INGEST_METRICS)
 
 
 class MessageProcessor:
-    def __init__(self, config: MetricsIngestConfiguration):
-        self._indexer = STORAGE_TO_INDEXER[config.db_backend](**config.db_backend_options)
+    def __init__(
+        self, config: MetricsIngestConfiguration, shared_string_table: str | None = None
+    ) -> None:
+        """
+        :param shared_string_table: Name of a `SharedStringTable` created by
+            the consumer's main process. If set, strings are looked up there
+            before going through the indexer, and resolved strings are
+            published there for the other subprocesses.
+        """
+        self._indexer: StringIndexer = STORAGE_TO_INDEXER[config.db_backend](
+            **config.db_backend_options
+        )
         self._config = config
+        self._shared_string_table = shared_string_table
+        self._shared_table_indexer: SharedTableIndexer | None = None
 
     # The following two methods are required to work such that the parallel
     # indexer can spawn subprocesses correctly.
@@ -46,13 +59,25 @@ class MessageProcessor:
     # We get/set just the config (assuming it's pickleable) and re-instantiate
     # the indexer backend in the subprocess (assuming that it usually isn't)
 
-    def __getstate__(self) -> MetricsIngestConfiguration:
-        return self._config
+    def __getstate__(self) -> tuple[MetricsIngestConfiguration, str | None]:
+        return self._config, self._shared_string_table
 
-    def __setstate__(self, config: MetricsIngestConfiguration) -> None:
+    def __setstate__(self, state: tuple[MetricsIngestConfiguration, str | None]) -> None:
         # mypy: "cannot access init directly"
         # yes I can, watch me.
-        self.__init__(config)  # type: ignore[misc]
+        self.__init__(*state)  # type: ignore[misc]
+
+    def __get_indexer(self) -> StringIndexer:
+        if self._shared_string_table is None:
+            return self._indexer
+
+        # Attached lazily, so that only the subprocesses actually doing the
+        # indexing map the table.
+        if self._shared_table_indexer is None:
+            self._shared_table_indexer = SharedTableIndexer(
+                SharedStringTable.attach(self._shared_string_table), self._indexer
+            )
+        return self._shared_table_indexer
 
     def __get_tags_validator(self) -> Callable[[Mapping[str, str]], bool]:
         """
@@ -131,7 +156,7 @@ class MessageProcessor:
         sdk.set_measurement("org_strings.len", len(extracted_strings))
 
         with metrics.timer("metrics_consumer.bulk_record"), sentry_sdk.start_span(op="bulk_record"):
-            record_result = self._indexer.bulk_record(extracted_strings)
+            record_result = self.__get_indexer().bulk_record(extracted_strings)
 
         mapping = record_result.get_mapped_results()
         bulk_record_meta = record_result.get_fetch_metadata()
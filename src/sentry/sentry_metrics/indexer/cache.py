@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
+import sys
 from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timedelta
 
@@ -22,6 +23,7 @@ from sentry.sentry_metrics.indexer.base import (
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.utils import metrics
 from sentry.utils.hashlib import md5_text
+from sentry.utils.lru import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,8 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_CACHE_TIER_METRIC = "sentry_metrics.indexer.cache.tier"
+_INDEXER_LOCAL_CACHE_SIZE_METRIC = "sentry_metrics.indexer.local_cache.size"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -45,11 +49,36 @@ BULK_RECORD_CACHE_NAMESPACE = "br"
 RESOLVE_CACHE_NAMESPACE = "res"
 
 
+def _local_cache_entry_size(key: str, value: int) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
 class StringIndexerCache:
-    def __init__(self, cache_name: str, partition_key: str):
+    def __init__(
+        self,
+        cache_name: str,
+        partition_key: str,
+        local_cache_max_size: int = 0,
+        local_cache_max_bytes: int | None = None,
+    ):
+        """
+        :param local_cache_max_size: If non-zero, keep up to this many
+            resolved strings in an in-process LRU in front of the shared cache.
+            Hot metric names and tag values then skip both the md5 of the
+            cache key and the roundtrip to the shared cache.
+        :param local_cache_max_bytes: Optionally also bound the in-process
+            LRU by the approximate size of its entries.
+        """
         self.version = 1
         self.cache = caches[cache_name]
         self.partition_key = partition_key
+        self.local_cache: LRUCache[str, int] | None = None
+        if local_cache_max_size:
+            self.local_cache = LRUCache(
+                local_cache_max_size,
+                max_bytes=local_cache_max_bytes,
+                sizeof=_local_cache_entry_size,
+            )
 
     @property
     def randomized_ttl(self) -> int:
@@ -130,7 +159,35 @@ class StringIndexerCache:
 
         return int(result)
 
+    def _make_local_cache_key(self, namespace: str, key: str) -> str:
+        return f"{namespace}:{key}"
+
+    def _record_tier_metrics(self, tier: str, hits: int, misses: int) -> None:
+        metrics.incr(
+            _INDEXER_CACHE_TIER_METRIC, tags={"tier": tier, "cache_hit": "true"}, amount=hits
+        )
+        metrics.incr(
+            _INDEXER_CACHE_TIER_METRIC, tags={"tier": tier, "cache_hit": "false"}, amount=misses
+        )
+
     def get(self, namespace: str, key: str) -> int | None:
+        if self.local_cache is not None:
+            local_key = self._make_local_cache_key(namespace, key)
+            result = self.local_cache.get(local_key)
+            if result is not None:
+                self._record_tier_metrics("local", 1, 0)
+                return result
+            self._record_tier_metrics("local", 0, 1)
+
+            result = self._get_shared(namespace, key)
+            self._record_tier_metrics("shared", int(result is not None), int(result is None))
+            if result is not None:
+                self.local_cache.set(local_key, result, ttl=self.randomized_ttl)
+            return result
+
+        return self._get_shared(namespace, key)
+
+    def _get_shared(self, namespace: str, key: str) -> int | None:
         if options.get(NAMESPACED_READ_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_READ_METRIC)
             result = self.cache.get(
@@ -140,6 +197,10 @@ class StringIndexerCache:
         return self.cache.get(self._make_cache_key(key), version=self.version)
 
     def set(self, namespace: str, key: str, value: int) -> None:
+        if self.local_cache is not None:
+            self.local_cache.set(
+                self._make_local_cache_key(namespace, key), value, ttl=self.randomized_ttl
+            )
         self.cache.set(
             key=self._make_cache_key(key),
             value=value,
@@ -156,6 +217,36 @@ class StringIndexerCache:
             )
 
     def get_many(self, namespace: str, keys: Iterable[str]) -> MutableMapping[str, int | None]:
+        if self.local_cache is None:
+            return self._get_many_shared(namespace, keys)
+
+        key_list = list(keys)
+        local_keys = {self._make_local_cache_key(namespace, key): key for key in key_list}
+        local_results = self.local_cache.get_many(local_keys)
+        results: MutableMapping[str, int | None] = {
+            local_keys[local_key]: value for local_key, value in local_results.items()
+        }
+        self._record_tier_metrics("local", len(results), len(key_list) - len(results))
+        metrics.gauge(_INDEXER_LOCAL_CACHE_SIZE_METRIC, len(self.local_cache))
+
+        missing = [key for key in key_list if key not in results]
+        if not missing:
+            return results
+
+        shared_results = self._get_many_shared(namespace, missing)
+        found = {key: value for key, value in shared_results.items() if value is not None}
+        self._record_tier_metrics("shared", len(found), len(missing) - len(found))
+
+        ttl = self.randomized_ttl
+        for key, value in found.items():
+            self.local_cache.set(self._make_local_cache_key(namespace, key), value, ttl=ttl)
+
+        results.update(shared_results)
+        return {key: results.get(key) for key in key_list}
+
+    def _get_many_shared(
+        self, namespace: str, keys: Iterable[str]
+    ) -> MutableMapping[str, int | None]:
         if options.get(NAMESPACED_READ_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_READ_METRIC)
             cache_keys = {self._make_namespaced_cache_key(namespace, key): key for key in keys}
@@ -176,6 +267,11 @@ class StringIndexerCache:
             return self._format_results(keys, results)
 
     def set_many(self, namespace: str, key_values: Mapping[str, int]) -> None:
+        if self.local_cache is not None:
+            ttl = self.randomized_ttl
+            for key, value in key_values.items():
+                self.local_cache.set(self._make_local_cache_key(namespace, key), value, ttl=ttl)
+
         cache_key_values = {self._make_cache_key(k): v for k, v in key_values.items()}
         self.cache.set_many(cache_key_values, timeout=self.randomized_ttl, version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
@@ -190,12 +286,17 @@ class StringIndexerCache:
             )
 
     def delete(self, namespace: str, key: str) -> None:
+        if self.local_cache is not None:
+            self.local_cache.delete(self._make_local_cache_key(namespace, key))
         self.cache.delete(self._make_cache_key(key), version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_WRITE_METRIC)
             self.cache.delete(self._make_namespaced_cache_key(namespace, key), version=self.version)
 
     def delete_many(self, namespace: str, keys: Sequence[str]) -> None:
+        if self.local_cache is not None:
+            for key in keys:
+                self.local_cache.delete(self._make_local_cache_key(namespace, key))
         self.cache.delete_many([self._make_cache_key(key) for key in keys], version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_WRITE_METRIC)
@@ -6,6 +6,7 @@ from typing import Any
 
 from sentry import options
 from sentry.ratelimits.sliding_windows import (
+    ApproximateRedisSlidingWindowRateLimiter,
     GrantedQuota,
     Quota,
     RedisSlidingWindowRateLimiter,
@@ -98,7 +99,13 @@ class RateLimitState:
 class WritesLimiter:
     def __init__(self, namespace: str, **options: Mapping[str, str]) -> None:
         self.namespace = namespace
-        self.rate_limiter: RedisSlidingWindowRateLimiter = RedisSlidingWindowRateLimiter(**options)
+        self.rate_limiter: RedisSlidingWindowRateLimiter
+        if "sync_interval_ms" in options:
+            # Opt-in: rate-limit against local counters that are periodically
+            # synced to Redis instead of doing a Redis roundtrip per batch.
+            self.rate_limiter = ApproximateRedisSlidingWindowRateLimiter(**options)
+        else:
+            self.rate_limiter = RedisSlidingWindowRateLimiter(**options)
 
     def _build_quota_key(self, use_case_id: UseCaseID, org_id: OrgId | None = None) -> str:
         if org_id is not None:
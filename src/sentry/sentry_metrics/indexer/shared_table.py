@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections.abc import Collection, Iterable, Mapping, MutableMapping
+from multiprocessing.shared_memory import SharedMemory
+
+from sentry.sentry_metrics.indexer.base import (
+    FetchType,
+    OrgId,
+    StringIndexer,
+    UseCaseKeyCollection,
+    UseCaseKeyResult,
+    UseCaseKeyResults,
+)
+from sentry.sentry_metrics.use_case_id_registry import UseCaseID
+from sentry.utils import metrics
+
+__all__ = ["SharedStringTable", "SharedTableIndexer"]
+
+_INDEXER_SHARED_TABLE_METRIC = "sentry_metrics.indexer.shared_table"
+
+# Only strings that are resolved through the indexer's cache or database are
+# shared, hardcoded strings are cheap to resolve and keep their fetch type.
+_SHAREABLE_FETCH_TYPES = {FetchType.CACHE_HIT, FetchType.DB_READ, FetchType.FIRST_SEEN}
+
+_MAGIC = 0x5E57_1D7A_B1E5_0001
+_HEADER = struct.Struct("<QQ")
+# Key digest, indexed ID, checksum over both.
+_SLOT = struct.Struct("<16sqQ")
+_EMPTY_DIGEST = b"\x00" * 16
+_UINT64_MASK = (1 << 64) - 1
+
+# Bound the linear probing so that lookups in a full table stay cheap. Keys
+# that don't find a slot within this distance are simply not shared.
+MAX_PROBES = 16
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def _checksum(digest: bytes, id: int) -> int:
+    low, high = struct.unpack("<QQ", digest)
+    return (low ^ high ^ id ^ _MAGIC) & _UINT64_MASK
+
+
+class SharedStringTable:
+    """
+    A fixed-size, open-addressing hash table from indexer keys
+    (`"use_case_id:org_id:string"`) to indexed IDs, living in shared memory.
+
+    The table is created once by the consumer's main process and attached to
+    by every subprocess, so all of them share a single copy of the hot
+    strings instead of each holding and resolving their own. Since an indexed
+    ID never changes once assigned, entries are only ever added and never
+    invalidated.
+
+    Writers don't take any locks. Every slot carries a checksum over its key
+    and ID, and a slot is only returned to readers if the checksum matches,
+    so torn reads and racing writers result in a miss rather than a wrong ID.
+    A miss falls back to the regular (cached) indexer.
+    """
+
+    def __init__(self, shm: SharedMemory, num_slots: int, owner: bool) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self.num_slots = num_slots
+        self._owner = owner
+
+    @classmethod
+    def create(cls, num_slots: int) -> SharedStringTable:
+        shm = SharedMemory(create=True, size=_HEADER.size + num_slots * _SLOT.size)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, num_slots)
+        return cls(shm, num_slots, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedStringTable:
+        # Only the creating process is responsible for unlinking the segment.
+        shm = SharedMemory(name=name, track=False)
+        magic, num_slots = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f"{name} is not a shared string table")
+        return cls(shm, num_slots, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _offsets(self, digest: bytes) -> Iterable[int]:
+        start = int.from_bytes(digest[:8], "little") % self.num_slots
+        for probe in range(min(MAX_PROBES, self.num_slots)):
+            yield _HEADER.size + ((start + probe) % self.num_slots) * _SLOT.size
+
+    def get(self, key: str) -> int | None:
+        digest = _digest(key)
+        for offset in self._offsets(digest):
+            stored_digest, id, checksum = _SLOT.unpack_from(self._buf, offset)
+            if stored_digest == digest:
+                return id if checksum == _checksum(digest, id) else None
+            if stored_digest == _EMPTY_DIGEST:
+                return None
+        return None
+
+    def get_many(self, keys: Iterable[str]) -> MutableMapping[str, int]:
+        """
+        Return the IDs of all keys found in the table, misses are omitted.
+        """
+        results = {}
+        for key in keys:
+            id = self.get(key)
+            if id is not None:
+                results[key] = id
+        return results
+
+    def set(self, key: str, id: int) -> bool:
+        """
+        Add a key to the table. Returns False if no free slot was found.
+        """
+        digest = _digest(key)
+        for offset in self._offsets(digest):
+            stored_digest, stored_id, checksum = _SLOT.unpack_from(self._buf, offset)
+            if stored_digest == digest and checksum == _checksum(digest, stored_id):
+                return True
+            if stored_digest == digest or stored_digest == _EMPTY_DIGEST:
+                # Publish the ID and checksum before the key, so that readers
+                # matching on the key never observe a half written slot as
+                # valid.
+                struct.pack_into("<qQ", self._buf, offset + 16, id, _checksum(digest, id))
+                struct.pack_into("<16s", self._buf, offset, digest)
+                return True
+        return False
+
+    def set_many(self, key_values: Mapping[str, int]) -> int:
+        """
+        Add all keys to the table, returning the number of keys that did not
+        fit.
+        """
+        return sum(not self.set(key, id) for key, id in key_values.items())
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class SharedTableIndexer(StringIndexer):
+    """
+    Resolves strings from a `SharedStringTable` before falling back to the
+    wrapped indexer, and publishes whatever the wrapped indexer resolved to
+    the table for the other processes.
+
+    Strings found in the table are reported as cache hits.
+    """
+
+    def __init__(self, table: SharedStringTable, indexer: StringIndexer) -> None:
+        self.table = table
+        self.indexer = indexer
+
+    def bulk_record(
+        self, strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]]
+    ) -> UseCaseKeyResults:
+        keys = UseCaseKeyCollection(strings)
+        found = self.table.get_many(keys.as_strings())
+
+        metrics.incr(_INDEXER_SHARED_TABLE_METRIC, tags={"hit": "true"}, amount=len(found))
+        metrics.incr(
+            _INDEXER_SHARED_TABLE_METRIC, tags={"hit": "false"}, amount=keys.size - len(found)
+        )
+
+        results = UseCaseKeyResults()
+        results.add_use_case_key_results(
+            [UseCaseKeyResult.from_string(key, id) for key, id in found.items()],
+            FetchType.CACHE_HIT,
+        )
+
+        remaining = results.get_unmapped_use_case_keys(keys)
+        if remaining.size == 0:
+            return results
+
+        resolved = self.indexer.bulk_record(
+            {
+                use_case_id: key_collection.mapping
+                for use_case_id, key_collection in remaining.mapping.items()
+            }
+        )
+
+        shareable = {
+            f"{use_case_id.value}:{org_id}:{string}": metadata.id
+            for use_case_id, key_results in resolved.results.items()
+            for org_id, org_meta in key_results.meta.items()
+            for string, metadata in org_meta.items()
+            if metadata.id is not None and metadata.fetch_type in _SHAREABLE_FETCH_TYPES
+        }
+        if dropped := self.table.set_many(shareable):
+            metrics.incr(f"{_INDEXER_SHARED_TABLE_METRIC}.full", amount=dropped)
+
+        return results.merge(resolved)
+
+    def record(self, use_case_id: UseCaseID, org_id: int, string: str) -> int | None:
+        result = self.bulk_record(strings={use_case_id: {org_id: {string}}})
+        return result[use_case_id][org_id][string]
+
+    def resolve(self, use_case_id: UseCaseID, org_id: int, string: str) -> int | None:
+        return self.indexer.resolve(use_case_id, org_id, string)
+
+    def reverse_resolve(self, use_case_id: UseCaseID, org_id: int, id: int) -> str | None:
+        return self.indexer.reverse_resolve(use_case_id, org_id, id)
+
+    def bulk_reverse_resolve(
+        self, use_case_id: UseCaseID, org_id: int, ids: Collection[int]
+    ) -> Mapping[int, str]:
+        return self.indexer.bulk_reverse_resolve(use_case_id, org_id, ids)
+
+    def resolve_shared_org(self, string: str) -> int | None:
+        return self.indexer.resolve_shared_org(string)
+
+    def reverse_shared_org_resolve(self, id: int) -> str | None:
+        return self.indexer.reverse_shared_org_resolve(id)
@@ -123,4 +123,5 @@ def _build_dispatcher(methodname):
 
 merge = _build_dispatcher("merge")
 record = _build_dispatcher("record")
+record_many = _build_dispatcher("record_many")
 delete = _build_dispatcher("delete")
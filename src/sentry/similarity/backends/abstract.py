@@ -14,6 +14,10 @@ class AbstractIndexBackend(metaclass=ABCMeta):
     def record(self, scope, key, items, timestamp=None):
         pass
 
+    @abstractmethod
+    def record_many(self, scope, entries, timestamp=None):
+        pass
+
     @abstractmethod
     def merge(self, scope, destination, items, timestamp=None):
         pass
@@ -40,6 +40,23 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
             arguments.extend([1, ",".join(str(b) for b in bucket), 1])
         return arguments
 
+    def _build_signature_arguments_many(self, feature_sets):
+        # Build all signatures in one go, so that features shared between the
+        # feature sets are only hashed once.
+        signatures = iter(self.signature_builder.bulk([f for f in feature_sets if f]))
+
+        results = []
+        for features in feature_sets:
+            if not features:
+                results.append([0] * self.bands)
+                continue
+
+            arguments = []
+            for bucket in band(self.bands, next(signatures)):
+                arguments.extend([1, ",".join(str(b) for b in bucket), 1])
+            results.append(arguments)
+        return results
+
     def __index(self, scope, args):
         # scope must be passed into the script call as a key to allow the
         # cluster client to determine what cluster the script should be
@@ -142,6 +159,44 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
 
         return self.__index(scope, arguments)
 
+    def record_many(self, scope, entries, timestamp=None):
+        """
+        Record many `(key, items, timestamp)` entries with a single script call. Every entry is
+        recorded at its own timestamp (`timestamp` if it has none), just like `record` would.
+        """
+        entries = [entry for entry in entries if entry[1]]
+        if not entries:
+            return  # nothing to do
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        arguments = [
+            "RECORD_MANY",
+            timestamp,
+            self.namespace,
+            self.bands,
+            self.interval,
+            self.retention,
+            self.candidate_set_limit,
+            scope,
+        ]
+
+        signature_arguments = iter(
+            self._build_signature_arguments_many(
+                [features for _, items, _ in entries for _, features in items]
+            )
+        )
+        for key, items, entry_timestamp in entries:
+            arguments.extend(
+                [key, entry_timestamp if entry_timestamp is not None else timestamp, len(items)]
+            )
+            for idx, _ in items:
+                arguments.append(idx)
+                arguments.extend(next(signature_arguments))
+
+        return self.__index(scope, arguments)
+
     def merge(self, scope, destination, items, timestamp=None):
         if timestamp is None:
             timestamp = int(time.time())
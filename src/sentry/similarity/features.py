@@ -91,6 +91,22 @@ class FeatureSet:
                 )
         return results
 
+    def __encode(self, event, label, features):
+        try:
+            return [self.encoder.dumps(feature) for feature in features]
+        except Exception as error:
+            log = (
+                logger.debug if isinstance(error, self.expected_encoding_errors) else logger.warning
+            )
+            log(
+                "Could not encode features from %r for %r due to error: %r",
+                event,
+                label,
+                error,
+                exc_info=True,
+            )
+            return None
+
     def record(self, events):
         if not events:
             return []
@@ -117,27 +133,35 @@ class FeatureSet:
                         self.__get_key(event.group) == key
                     ), "all events must be associated with the same group"
 
-                try:
-                    features = [self.encoder.dumps(feature) for feature in features]
-                except Exception as error:
-                    log = (
-                        logger.debug
-                        if isinstance(error, self.expected_encoding_errors)
-                        else logger.warning
-                    )
-                    log(
-                        "Could not encode features from %r for %r due to error: %r",
-                        event,
-                        label,
-                        error,
-                        exc_info=True,
-                    )
-                else:
-                    if features:
-                        items.append((self.aliases[label], features))
+                features = self.__encode(event, label, features)
+                if features:
+                    items.append((self.aliases[label], features))
 
         return self.index.record(scope, key, items, timestamp=int(event.datetime.timestamp()))
 
+    def record_many(self, events):
+        """
+        Record events that may belong to many groups (and projects), issuing
+        a single index call per project rather than one per event. Every event
+        is recorded at its own timestamp, the same as with `record`.
+        """
+        scopes: dict[str, list] = {}
+        for event in events:
+            if not event.group_id:
+                continue
+
+            items = []
+            for label, features in self.extract(event).items():
+                features = self.__encode(event, label, features)
+                if features:
+                    items.append((self.aliases[label], features))
+
+            scopes.setdefault(self.__get_scope(event.project), []).append(
+                (self.__get_key(event.group), items, int(event.datetime.timestamp()))
+            )
+
+        return {scope: self.index.record_many(scope, entries) for scope, entries in scopes.items()}
+
     def classify(self, events, limit=None, thresholds=None):
         if not events:
             return []
@@ -158,25 +182,10 @@ class FeatureSet:
                         self.__get_scope(event.project) == scope
                     ), "all events must be associated with the same project"
 
-                try:
-                    features = [self.encoder.dumps(feature) for feature in features]
-                except Exception as error:
-                    log = (
-                        logger.debug
-                        if isinstance(error, self.expected_encoding_errors)
-                        else logger.warning
-                    )
-                    log(
-                        "Could not encode features from %r for %r due to error: %r",
-                        event,
-                        label,
-                        error,
-                        exc_info=True,
-                    )
-                else:
-                    if features:
-                        items.append((self.aliases[label], thresholds.get(label, 0), features))
-                        labels.append(label)
+                features = self.__encode(event, label, features)
+                if features:
+                    items.append((self.aliases[label], thresholds.get(label, 0), features))
+                    labels.append(label)
 
         return [
             (int(key), dict(zip(labels, scores)))
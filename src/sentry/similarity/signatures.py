@@ -15,3 +15,33 @@ class MinHashSignatureBuilder:
             min(mmh3.hash(feature, column) % self.rows for feature in features)
             for column in range(self.columns)
         ]
+
+    def bulk(self, feature_sets: Iterable[Iterable[str]]) -> list[list[int]]:
+        """
+        Build the signatures of many feature sets at once.
+
+        The result is identical to calling the builder on every feature set,
+        but each distinct feature is only hashed once across all of them.
+        Shingles repeat heavily between events of the same project, so this
+        is much cheaper when (re)indexing many events.
+        """
+        columns = range(self.columns)
+        hashes: dict[str, list[int]] = {}
+        signatures = []
+        for features in feature_sets:
+            signature: list[int] | None = None
+            for feature in features:
+                feature_hashes = hashes.get(feature)
+                if feature_hashes is None:
+                    feature_hashes = hashes[feature] = [
+                        mmh3.hash(feature, column) % self.rows for column in columns
+                    ]
+                signature = (
+                    list(feature_hashes)
+                    if signature is None
+                    else [min(a, b) for a, b in zip(signature, feature_hashes)]
+                )
+            if signature is None:
+                raise ValueError("cannot build a signature without any features")
+            signatures.append(signature)
+        return signatures
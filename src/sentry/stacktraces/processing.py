@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import logging
 from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timezone
@@ -129,6 +130,25 @@ class StacktraceProcessingTask:
 
 
 class StacktraceProcessor:
+    """Processes the stacktraces of an event.  After ``preprocess_step``,
+    the stacktraces are processed one after the other: ``process_exception``
+    is called for the exception of a stacktrace, and then ``process_frame``
+    for each of its frames.
+
+    If a processor of the event overrides ``process_frames`` or sets
+    ``dedupe_frames``, ``process_exception`` is instead called for the
+    exceptions of all stacktraces first, and only then are the frames of all
+    stacktraces handed to ``process_frames`` at once.  So every exception is
+    still processed before the frames of its stacktrace, but also before the
+    frames of the stacktraces preceding it.
+    """
+
+    #: If set, frames with the same cache key which are otherwise identical are
+    #: only processed once per event, and the result is copied to the other
+    #: frames.  Only enable this if processing a frame does not depend on
+    #: anything but the frame and does not modify the frame in place.
+    dedupe_frames = False
+
     def __init__(self, data, stacktrace_infos, project=None):
         self.data = data
         self.stacktrace_infos = stacktrace_infos
@@ -184,6 +204,22 @@ class StacktraceProcessor:
         the original input frame is assumed.
         """
 
+    def process_frames(self, processable_frames, processing_task):
+        """Processes all processable frames of an event handled by this
+        processor at once and returns a list with the result of
+        ``process_frame`` for each of them, in the same order.  Processors
+        which can look up many frames at once should override this, by
+        default the frames are processed one by one.
+        """
+        rv = []
+        for processable_frame in processable_frames:
+            try:
+                rv.append(self.process_frame(processable_frame, processing_task))
+            except Exception:
+                logger.exception("Failed to process frame")
+                rv.append(None)
+        return rv
+
     def preprocess_step(self, processing_task):
         """After frames are preprocessed but before frame processing kicks in
         the preprocessing step is run.  This already has access to the cache
@@ -449,7 +485,82 @@ def get_processable_frames(stacktrace_info, processors):
     return rv
 
 
-def process_single_stacktrace(processing_task, stacktrace_info, processable_frames):
+def _dedupe_processable_frames(processable_frames):
+    """Splits processable frames into the frames which have to be processed and
+    the identical frames with the same cache key, mapped to the first of them.
+    """
+    unique_frames = []
+    duplicates = {}
+    by_cache_key: dict[str, list[ProcessableFrame]] = {}
+    for processable_frame in processable_frames:
+        if processable_frame.cache_key is not None:
+            candidates = by_cache_key.setdefault(processable_frame.cache_key, [])
+            original = next((c for c in candidates if c.frame == processable_frame.frame), None)
+            if original is not None:
+                duplicates[processable_frame] = original
+                continue
+            candidates.append(processable_frame)
+        unique_frames.append(processable_frame)
+    return unique_frames, duplicates
+
+
+def _batches_frames(processor):
+    return (
+        processor.dedupe_frames
+        or type(processor).process_frames is not StacktraceProcessor.process_frames
+    )
+
+
+def process_exception(processing_task, stacktrace_info):
+    """Lets the stacktrace processors touch the exception of a stacktrace,
+    and returns whether any of them changed it.
+    """
+    changed = False
+    if stacktrace_info.is_exception and stacktrace_info.container:
+        for processor in processing_task.iter_processors():
+            with sentry_sdk.start_span(
+                op="stacktraces.processing.process_stacktraces.process_exception"
+            ) as span:
+                span.set_data("processor", processor.__class__.__name__)
+                if processor.process_exception(stacktrace_info.container):
+                    changed = True
+                    span.set_data("data_changed", True)
+    return changed
+
+
+def process_frames(processing_task):
+    """Hands all frames of the processing task to their processors, in one
+    batch per processor, and returns the results by processable frame.
+    """
+    rv = {}
+    for processor in processing_task.iter_processors():
+        processable_frames = list(processing_task.iter_processable_frames(processor))
+        if processor.dedupe_frames:
+            unique_frames, duplicates = _dedupe_processable_frames(processable_frames)
+        else:
+            unique_frames, duplicates = processable_frames, {}
+
+        with sentry_sdk.start_span(
+            op="stacktraces.processing.process_stacktraces.process_frames"
+        ) as span:
+            span.set_data("processor", processor.__class__.__name__)
+            span.set_data("frames", len(processable_frames))
+            span.set_data("unique_frames", len(unique_frames))
+            try:
+                results = processor.process_frames(unique_frames, processing_task)
+            except Exception:
+                logger.exception("Failed to process frames")
+                results = [None] * len(unique_frames)
+
+        rv.update(zip(unique_frames, results))
+        for processable_frame, original in duplicates.items():
+            rv[processable_frame] = copy.deepcopy(rv[original])
+    return rv
+
+
+def process_single_stacktrace(
+    processing_task, stacktrace_info, processable_frames, frame_results=None
+):
     # TODO: associate errors with the frames and processing issues
     changed_raw = False
     changed_processed = False
@@ -468,10 +579,15 @@ def process_single_stacktrace(processing_task, stacktrace_info, processable_fram
         if idx in processable_frames:
             processable_frame = processable_frames[idx]
             assert processable_frame.frame is bare_frame
-            try:
-                rv = processable_frame.processor.process_frame(processable_frame, processing_task)
-            except Exception:
-                logger.exception("Failed to process frame")
+            if frame_results is not None:
+                rv = frame_results.get(processable_frame)
+            else:
+                try:
+                    rv = processable_frame.processor.process_frame(
+                        processable_frame, processing_task
+                    )
+                except Exception:
+                    logger.exception("Failed to process frame")
 
         expand_processed, expand_raw, errors = rv or (None, None, None)
 
@@ -539,9 +655,8 @@ def get_crash_frame_from_event_data(data, frame_filter=None):
 
 
 def lookup_frame_cache(keys):
-    rv = {}
-    for key in keys:
-        rv[key] = cache.get(key)
+    rv = dict.fromkeys(keys)
+    rv.update(cache.get_many(list(rv)))
     return rv
 
 
@@ -617,18 +732,22 @@ def process_stacktraces(
                     changed = True
                     span.set_data("data_changed", True)
 
+        processable_stacktraces = list(processing_task.iter_processable_stacktraces())
+
+        # If a processor batches frames, process the frames of all stacktraces at once, after
+        # letting the stacktrace processors touch all exceptions
+        frame_results = None
+        if any(_batches_frames(processor) for processor in processing_task.iter_processors()):
+            for stacktrace_info, _ in processable_stacktraces:
+                if process_exception(processing_task, stacktrace_info):
+                    changed = True
+            frame_results = process_frames(processing_task)
+
         # Process all stacktraces
-        for stacktrace_info, processable_frames in processing_task.iter_processable_stacktraces():
+        for stacktrace_info, processable_frames in processable_stacktraces:
             # Let the stacktrace processors touch the exception
-            if stacktrace_info.is_exception and stacktrace_info.container:
-                for processor in processing_task.iter_processors():
-                    with sentry_sdk.start_span(
-                        op="stacktraces.processing.process_stacktraces.process_exception"
-                    ) as span:
-                        span.set_data("processor", processor.__class__.__name__)
-                        if processor.process_exception(stacktrace_info.container):
-                            changed = True
-                            span.set_data("data_changed", True)
+            if frame_results is None and process_exception(processing_task, stacktrace_info):
+                changed = True
 
             # If the stacktrace is empty we skip it for processing
             if not stacktrace_info.stacktrace:
@@ -637,7 +756,7 @@ def process_stacktraces(
                 op="stacktraces.processing.process_stacktraces.process_single_stacktrace"
             ) as span:
                 new_frames, new_raw_frames, errors = process_single_stacktrace(
-                    processing_task, stacktrace_info, processable_frames
+                    processing_task, stacktrace_info, processable_frames, frame_results
                 )
                 if new_frames is not None:
                     stacktrace_info.stacktrace["frames"] = new_frames
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import functools
 import logging
 import random
@@ -138,6 +139,7 @@ def instrumented_task(
     silo_mode=None,
     record_timing=False,
     taskworker_config=None,
+    use_silo_cache_scope=False,
     **kwargs,
 ):
     """
@@ -149,6 +151,11 @@ def instrumented_task(
     - sentry sdk tagging.
     - hybrid cloud silo restrictions
     - disabling of result collection.
+
+    With `use_silo_cache_scope`, silo cached records are memoized for the
+    duration of the task, like they are for a request. Records cleared by
+    another process while the task runs are still served from the memo, so
+    only use it for short tasks.
     """
 
     def wrapped(func):
@@ -181,9 +188,12 @@ def instrumented_task(
             scope.set_tag("task_name", name)
             scope.set_tag("transaction_id", transaction_id)
 
+            from sentry.hybridcloud.rpc.caching.impl import silo_cache_scope
+
             with (
                 metrics.timer(key, instance=instance),
                 track_memory_usage("jobs.memory_change", instance=instance),
+                silo_cache_scope() if use_silo_cache_scope else contextlib.nullcontext(),
             ):
                 result = func(*args, **kwargs)
 
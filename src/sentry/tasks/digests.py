@@ -2,15 +2,17 @@ import logging
 import time
 from datetime import datetime
 
+from sentry import options
 from sentry.digests import get_option_key
 from sentry.digests.backends.base import InvalidState
-from sentry.digests.notifications import build_digest, split_key
+from sentry.digests.notifications import build_digest, build_digests, split_key, split_keys
 from sentry.digests.types import Record
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.utils import snuba
+from sentry.utils.iterators import chunked
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +38,14 @@ def schedule_digests() -> None:
     timeout = 300
     digests.backend.maintenance(deadline - timeout)
 
-    for entry in digests.backend.schedule(deadline):
-        deliver_digest.delay(entry.key, entry.timestamp)
+    batch_size = options.get("digests.delivery.batch_size")
+    if batch_size <= 1:
+        for entry in digests.backend.schedule(deadline):
+            deliver_digest.delay(entry.key, entry.timestamp)
+        return
+
+    for entries in chunked(digests.backend.schedule(deadline), batch_size):
+        deliver_digests.delay([entry.key for entry in entries])
 
 
 @instrumented_task(
@@ -96,6 +104,69 @@ def deliver_digest(
             )
 
 
+@instrumented_task(
+    name="sentry.tasks.digests.deliver_digests",
+    queue="digests.delivery",
+    silo_mode=SiloMode.REGION,
+)
+def deliver_digests(keys: list[str]) -> None:
+    """
+    Deliver the digests of several timelines, opening and closing all of them
+    together and loading their groups and rules in bulk.
+    """
+    from sentry import digests
+    from sentry.mail import mail_adapter
+
+    targets = split_keys(keys)
+    for key in keys:
+        if key not in targets:
+            logger.info("Cannot deliver digest %s due to error: project does not exist", key)
+            digests.backend.delete(key)
+
+    minimum_delays = {
+        key: ProjectOption.objects.get_value(project, get_option_key("mail", "minimum_delay"))
+        for key, (project, _, _, _) in targets.items()
+    }
+
+    with snuba.options_override({"consistent": True}):
+        with digests.backend.digest_many(list(targets), minimum_delays=minimum_delays) as records:
+            infos = build_digests(
+                {key: (targets[key][0], key_records) for key, key_records in records.items()}
+            )
+            notification_uuids = {
+                key: get_notification_uuid_from_records(key_records)
+                for key, key_records in records.items()
+            }
+
+        for key in targets.keys() - infos.keys():
+            logger.info("Skipped digest delivery: %s is not ready", key)
+
+        for key, digest in infos.items():
+            project, target_type, target_identifier, fallthrough_choice = targets[key]
+            if not digest.digest:
+                logger.info(
+                    "Skipped digest delivery due to empty digest",
+                    extra={
+                        "project": project.id,
+                        "target_type": target_type.value,
+                        "target_identifier": target_identifier,
+                        "fallthrough_choice": (
+                            fallthrough_choice.value if fallthrough_choice else None
+                        ),
+                    },
+                )
+                continue
+
+            mail_adapter.notify_digest(
+                project,
+                digest,
+                target_type,
+                target_identifier,
+                fallthrough_choice=fallthrough_choice,
+                notification_uuid=notification_uuids[key],
+            )
+
+
 def get_notification_uuid_from_records(records: list[Record]) -> str | None:
     for record in records:
         try:
@@ -2,7 +2,7 @@ import hashlib
 import hmac
 import logging
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import grpc
@@ -133,15 +133,15 @@ class TaskworkerClient:
         domain, port = pattern.split(":")
         return [f"{domain}-{i}:{port}" for i in range(0, num_brokers)]
 
-    def _get_cur_stub(self) -> tuple[str, ConsumerServiceStub]:
-        if self._num_tasks_before_rebalance == 0:
+    def _get_cur_stub(self, num_tasks: int = 1) -> tuple[str, ConsumerServiceStub]:
+        if self._num_tasks_before_rebalance <= 0:
             self._cur_host = random.choice(self._hosts)
             self._num_tasks_before_rebalance = self._max_tasks_before_rebalance
 
         if self._cur_host not in self._host_to_stubs:
             self._host_to_stubs[self._cur_host] = self._connect_to_host(self._cur_host)
 
-        self._num_tasks_before_rebalance -= 1
+        self._num_tasks_before_rebalance -= num_tasks
         return self._cur_host, self._host_to_stubs[self._cur_host]
 
     def get_task(self, namespace: str | None = None) -> TaskActivation | None:
@@ -172,6 +172,86 @@ class TaskworkerClient:
             return response.task
         return None
 
+    def get_tasks(self, count: int, namespace: str | None = None) -> list[TaskActivation]:
+        """
+        Fetch up to `count` pending tasks.
+
+        The broker doesn't have a batch fetch, instead all of the requests are
+        issued concurrently on the same channel and collected together. This
+        costs about one round trip instead of `count` of them.
+
+        Fewer tasks are returned when the broker runs out of pending tasks.
+        Errors are only raised if no task could be fetched at all.
+        """
+        request = GetTaskRequest(namespace=namespace)
+        tasks: list[TaskActivation] = []
+        error: grpc.RpcError | None = None
+        with metrics.timer("taskworker.get_tasks.rpc"):
+            host, stub = self._get_cur_stub(count)
+            futures = [stub.GetTask.future(request) for _ in range(count)]
+            for future in futures:
+                try:
+                    response = future.result()
+                except grpc.RpcError as err:
+                    metrics.incr(
+                        "taskworker.client.rpc_error",
+                        tags={"method": "GetTask", "status": err.code().name},
+                    )
+                    if err.code() != grpc.StatusCode.NOT_FOUND and error is None:
+                        error = err
+                    continue
+                if response.HasField("task"):
+                    metrics.incr(
+                        "taskworker.client.get_task",
+                        tags={"namespace": response.task.namespace},
+                    )
+                    self._task_id_to_host[response.task.id] = host
+                    tasks.append(response.task)
+
+        if error is not None and not tasks:
+            raise error
+        return tasks
+
+    def update_tasks(
+        self, updates: Sequence[tuple[str, TaskActivationStatus.ValueType]]
+    ) -> dict[str, grpc.RpcError]:
+        """
+        Update the status for many task activations at once, without fetching
+        new tasks.
+
+        As with `get_tasks` the updates are sent concurrently to the brokers
+        the activations were fetched from. Returns the errors of the updates
+        that failed keyed by task id. Activations the broker doesn't know
+        about (anymore) are not considered to have failed.
+        """
+        metrics.incr("taskworker.client.fetch_next", tags={"next": False}, amount=len(updates))
+        errors: dict[str, grpc.RpcError] = {}
+        with metrics.timer("taskworker.update_tasks.rpc"):
+            futures = []
+            for task_id, status in updates:
+                if task_id not in self._task_id_to_host:
+                    metrics.incr("taskworker.client.task_id_not_in_client")
+                    continue
+                host = self._task_id_to_host.pop(task_id)
+                request = SetTaskStatusRequest(id=task_id, status=status)
+                futures.append(
+                    (task_id, host, self._host_to_stubs[host].SetTaskStatus.future(request))
+                )
+
+            for task_id, host, future in futures:
+                try:
+                    future.result()
+                except grpc.RpcError as err:
+                    metrics.incr(
+                        "taskworker.client.rpc_error",
+                        tags={"method": "SetTaskStatus", "status": err.code().name},
+                    )
+                    if err.code() != grpc.StatusCode.NOT_FOUND:
+                        # Keep track of the broker so the update can be retried.
+                        self._task_id_to_host[task_id] = host
+                        errors[task_id] = err
+        return errors
+
     def update_task(
         self,
         task_id: str,
@@ -21,3 +21,35 @@ DEFAULT_CHILD_TASK_COUNT = 10000
 The number of tasks a worker child process will process
 before being restarted.
 """
+
+DEFAULT_WORKER_BATCH_SIZE = 1
+"""
+The number of activations a worker fetches, and the number of
+results it delivers, per batch of RPCs. A size of 1 disables batching.
+"""
+
+DEFAULT_RESULT_BATCH_TIMEOUT = 0.05
+"""
+The maximum number of seconds a result is held back waiting for
+its batch to fill up before it is delivered to the broker.
+"""
+
+DEFAULT_SHM_RING_SIZE = 1024 * 1024
+"""
+The size in bytes of each shared memory ring buffer used to
+exchange activations and results with child processes when using
+the `shm` transport.
+"""
+
+DEFAULT_THREAD_CONCURRENCY = 16
+"""
+The number of activations of a namespace using the `thread`
+execution mode that a child process runs concurrently.
+"""
+
+THREAD_DEADLINE_GRACE = 10
+"""
+The number of seconds an activation running in a thread may
+overrun its processing deadline before its child process is
+restarted.
+"""
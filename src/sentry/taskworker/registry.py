@@ -4,7 +4,7 @@ import datetime
 import logging
 from collections.abc import Callable
 from concurrent import futures
-from typing import Any
+from typing import Any, Literal
 
 from arroyo.backends.kafka import KafkaPayload, KafkaProducer
 from arroyo.types import BrokerValue
@@ -13,7 +13,7 @@ from django.conf import settings
 from sentry_protos.taskbroker.v1.taskbroker_pb2 import TaskActivation
 
 from sentry.conf.types.kafka_definition import Topic
-from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE
+from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE, DEFAULT_THREAD_CONCURRENCY
 from sentry.taskworker.retry import Retry
 from sentry.taskworker.router import TaskRouter
 from sentry.taskworker.task import P, R, Task
@@ -26,6 +26,8 @@ logger = logging.getLogger(__name__)
 
 ProducerFuture = futures.Future[BrokerValue[KafkaPayload]]
 
+ExecutionMode = Literal["process", "thread"]
+
 
 class TaskNamespace:
     """
@@ -41,12 +43,16 @@ class TaskNamespace:
         retry: Retry | None,
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int = DEFAULT_PROCESSING_DEADLINE,
+        execution_mode: ExecutionMode = "process",
+        thread_concurrency: int = DEFAULT_THREAD_CONCURRENCY,
     ):
         self.name = name
         self.router = router
         self.default_retry = retry
         self.default_expires = expires  # seconds
         self.default_processing_deadline_duration = processing_deadline_duration  # seconds
+        self.execution_mode = execution_mode
+        self.thread_concurrency = thread_concurrency
         self._registered_tasks: dict[str, Task[Any, Any]] = {}
         self._producers: dict[Topic, SingletonProducer] = {}
 
@@ -212,6 +218,8 @@ class TaskRegistry:
         retry: Retry | None = None,
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int = DEFAULT_PROCESSING_DEADLINE,
+        execution_mode: ExecutionMode = "process",
+        thread_concurrency: int = DEFAULT_THREAD_CONCURRENCY,
     ) -> TaskNamespace:
         """
         Create a namespaces.
@@ -220,13 +228,23 @@ class TaskRegistry:
         infrastructure to be scaled based on a region's requirements.
 
         Namespaces can define default behavior for tasks defined within a namespace.
+
+        By default every activation is executed on its own in a worker's child
+        process. Namespaces of I/O bound tasks can use the `thread` execution mode
+        instead, in which a child process runs up to `thread_concurrency`
+        activations of the namespace concurrently in threads. Processing deadlines
+        of these tasks are enforced cooperatively.
         """
+        if execution_mode not in ("process", "thread"):
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
         namespace = TaskNamespace(
             name=name,
             router=self._router,
             retry=retry,
             expires=expires,
             processing_deadline_duration=processing_deadline_duration,
+            execution_mode=execution_mode,
+            thread_concurrency=thread_concurrency,
         )
         self._namespaces[name] = namespace
 
@@ -47,6 +47,28 @@ class RunStorage:
         result = self._redis.set(self._make_key(taskname), now.isoformat(), ex=duration, nx=True)
         return bool(result)
 
+    def set_many(
+        self, next_runtimes: Mapping[str, datetime]
+    ) -> Mapping[str, tuple[bool, datetime | None]]:
+        """
+        Record a spawn time for many tasks in a single round trip.
+
+        Returns for every task whether the spawn time was recorded (and the
+        task should be spawned), along with the last run time in storage.
+        """
+        now = timezone.now()
+        pipeline = self._redis.pipeline(transaction=False)
+        for taskname, next_runtime in next_runtimes.items():
+            key = self._make_key(taskname)
+            pipeline.set(key, now.isoformat(), ex=next_runtime - now, nx=True)
+            pipeline.get(key)
+        values = pipeline.execute()
+
+        return {
+            taskname: (bool(recorded), datetime.fromisoformat(value) if value else None)
+            for taskname, recorded, value in zip(next_runtimes, values[::2], values[1::2])
+        }
+
     def read(self, taskname: str) -> datetime | None:
         """
         Retrieve the last run time of a task
@@ -85,6 +107,7 @@ class ScheduleEntry:
             scheduler = TimedeltaSchedule(schedule)
         self._schedule = scheduler
         self._last_run: datetime | None = None
+        self._next_run: int | None = None
 
     def __lt__(self, other: ScheduleEntry) -> bool:
         # Secondary sorting for heapq when remaining time is the same
@@ -102,6 +125,19 @@ class ScheduleEntry:
 
     def set_last_run(self, last_run: datetime | None) -> None:
         self._last_run = last_run
+        self._next_run = None
+
+    def next_run(self) -> int:
+        """
+        The timestamp this entry is next due at.
+
+        Computing this is comparatively expensive for crontab schedules, so
+        it is cached until the last run changes.
+        """
+        if self._next_run is None:
+            now = int(timezone.now().timestamp())
+            self._next_run = now + self._schedule.remaining_seconds(self._last_run)
+        return self._next_run
 
     def is_due(self) -> bool:
         return self._schedule.is_due(self._last_run)
@@ -131,6 +167,7 @@ class ScheduleRunner:
         self._entries: list[ScheduleEntry] = []
         self._registry = registry
         self._run_storage = run_storage
+        # Entries keyed by the timestamp they are next due at.
         self._heap: list[tuple[int, ScheduleEntry]] = []
 
     def add(self, task_config: ScheduleConfig) -> None:
@@ -155,51 +192,61 @@ class ScheduleRunner:
 
         Returns the number of seconds to sleep until the next task is due.
         """
-        self._update_heap()
+        if not self._heap:
+            self._build_heap()
 
         if not self._heap:
             return 60
 
-        while True:
-            # Peek at the top, and if it is due, pop, spawn and update last run time
-            _, entry = self._heap[0]
-            if entry.is_due():
-                heapq.heappop(self._heap)
+        now = timezone.now().timestamp()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+
+        if due:
+            metrics.distribution("taskworker.scheduler.due_entries", len(due))
+            try:
+                self._try_spawn(due)
+            except Exception as e:
+                # Trap errors from spawning/update state so that the heap stays consistent.
+                capture_exception(e)
+            for entry in due:
+                # Entries that couldn't be spawned are retried on the next tick.
+                heapq.heappush(self._heap, (max(entry.next_run(), int(now) + 1), entry))
+
+        return max(self._heap[0][0] - timezone.now().timestamp(), 0)
+
+    def _try_spawn(self, entries: list[ScheduleEntry]) -> None:
+        now = timezone.now()
+        results = self._run_storage.set_many(
+            {entry.fullname: entry.runtime_after(now) for entry in entries}
+        )
+        for entry in entries:
+            recorded, last_run = results[entry.fullname]
+            if recorded:
                 try:
-                    self._try_spawn(entry)
+                    entry.delay_task()
                 except Exception as e:
-                    # Trap errors from spawning/update state so that the heap stays consistent.
                     capture_exception(e)
-                heapq.heappush(self._heap, (entry.remaining_seconds(), entry))
-                continue
-            else:
-                # The top of the heap isn't ready, break for sleep
-                break
+                    continue
+                entry.set_last_run(now)
 
-        return self._heap[0][0]
-
-    def _try_spawn(self, entry: ScheduleEntry) -> None:
-        now = timezone.now()
-        next_runtime = entry.runtime_after(now)
-        if self._run_storage.set(entry.fullname, next_runtime):
-            entry.delay_task()
-            entry.set_last_run(now)
-
-            logger.info("taskworker.scheduler.delay_task", extra={"task": entry.fullname})
-            metrics.incr("taskworker.scheduler.delay_task")
-        else:
-            # sync with last_run state in storage
-            entry.set_last_run(self._run_storage.read(entry.fullname))
+                logger.info("taskworker.scheduler.delay_task", extra={"task": entry.fullname})
+                metrics.incr("taskworker.scheduler.delay_task")
+            else:
+                # sync with last_run state in storage
+                entry.set_last_run(last_run)
 
-            logger.info("taskworker.scheduler.sync_with_storage", extra={"task": entry.fullname})
-            metrics.incr("taskworker.scheduler.sync_with_storage")
+                logger.info(
+                    "taskworker.scheduler.sync_with_storage", extra={"task": entry.fullname}
+                )
+                metrics.incr("taskworker.scheduler.sync_with_storage")
 
-    def _update_heap(self) -> None:
-        """update the heap to reflect current remaining time"""
-        if not self._heap:
-            self._load_last_run()
+    def _build_heap(self) -> None:
+        """build the heap of entries by the time they are next due"""
+        self._load_last_run()
 
-        heap_items = [(item.remaining_seconds(), item) for item in self._entries]
+        heap_items = [(item.next_run(), item) for item in self._entries]
         heapq.heapify(heap_items)
         self._heap = heap_items
 
@@ -88,3 +88,14 @@ def at_most_once_task() -> None:
 def timed_task(sleep_seconds: float | str) -> None:
     sleep(float(sleep_seconds))
     logger.debug("timed_task complete")
+
+
+threadedexampletasks = taskregistry.create_namespace(
+    name="examples-threaded", execution_mode="thread", thread_concurrency=4
+)
+
+
+@threadedexampletasks.register(name="examples.threaded_timed")
+def threaded_timed_task(sleep_seconds: float | str) -> None:
+    sleep(float(sleep_seconds))
+    logger.debug("threaded_timed_task complete")
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from sentry_protos.taskbroker.v1.taskbroker_pb2 import TaskActivation
+
+from sentry.taskworker.task import Task
+
+logger = logging.getLogger("sentry.taskworker.threaded")
+
+R = TypeVar("R")
+
+
+@dataclasses.dataclass
+class _InFlight:
+    activation: TaskActivation
+    deadline: float
+    timed_out: bool = False
+
+
+class ThreadedExecutor(Generic[R]):
+    """
+    Runs the activations of a namespace concurrently in threads of a child
+    process, for namespaces registered with `execution_mode="thread"`.
+
+    Threads can't be interrupted, so processing deadlines are enforced
+    cooperatively: the child calls `enforce_deadlines` between activations,
+    which gives up on activations that ran past their deadline (through
+    `on_deadline_exceeded`) and discards their outcome once they do finish.
+    An activation that is still running `grace` seconds after its deadline
+    is considered stuck, at which point the child should give up on all
+    activations in flight and exit (see `fail_in_flight`).
+
+    Threads are daemon threads, so a child can exit while they're stuck.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        grace: float,
+        run: Callable[[Task[Any, Any], TaskActivation], R],
+        on_complete: Callable[[TaskActivation, R], None],
+        on_deadline_exceeded: Callable[[TaskActivation], None],
+    ) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.grace = grace
+        self._run = run
+        self._on_complete = on_complete
+        self._on_deadline_exceeded = on_deadline_exceeded
+        self._work: queue.SimpleQueue[tuple[Task[Any, Any], TaskActivation]] = queue.SimpleQueue()
+        self._in_flight: dict[str, _InFlight] = {}
+        self._lock = threading.Condition()
+        self._threads: list[threading.Thread] = []
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def full(self) -> bool:
+        return len(self._in_flight) >= self.concurrency
+
+    def submit(self, task_func: Task[Any, Any], activation: TaskActivation) -> None:
+        with self._lock:
+            self._in_flight[activation.id] = _InFlight(
+                activation, time.monotonic() + activation.processing_deadline_duration
+            )
+        if len(self._threads) < min(len(self._in_flight), self.concurrency):
+            thread = threading.Thread(
+                target=self._worker, name=f"taskworker-{self.name}-{len(self._threads)}"
+            )
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        self._work.put((task_func, activation))
+
+    def wait(self, timeout: float) -> None:
+        """Wait up to `timeout` seconds for an activation to finish."""
+        with self._lock:
+            self._lock.wait(timeout)
+
+    def _worker(self) -> None:
+        while True:
+            task_func, activation = self._work.get()
+            outcome = self._run(task_func, activation)
+            with self._lock:
+                entry = self._in_flight.pop(activation.id, None)
+                self._lock.notify_all()
+                if entry is not None and not entry.timed_out:
+                    self._on_complete(activation, outcome)
+
+    def enforce_deadlines(self) -> bool:
+        """
+        Give up on activations past their deadline. Returns True if any
+        activation is stuck past its deadline and grace period.
+        """
+        now = time.monotonic()
+        stuck = False
+        with self._lock:
+            for entry in self._in_flight.values():
+                if entry.deadline > now:
+                    continue
+                if not entry.timed_out:
+                    entry.timed_out = True
+                    self._on_deadline_exceeded(entry.activation)
+                if entry.deadline + self.grace <= now:
+                    stuck = True
+        return stuck
+
+    def fail_in_flight(self) -> None:
+        """Give up on every activation in flight."""
+        with self._lock:
+            for entry in self._in_flight.values():
+                if not entry.timed_out:
+                    entry.timed_out = True
+                    self._on_deadline_exceeded(entry.activation)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import mmap
+import queue
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Total bytes written, total bytes read, messages written, messages read.
+# Each counter only ever has a single writer.
+_HEADER = struct.Struct("<QQQQ")
+# Payload length and checksum, preceding every message.
+_RECORD = struct.Struct("<II")
+
+# Bounds for the sleep between polls of an empty (or full) ring.
+_MIN_POLL_INTERVAL = 0.00005
+_MAX_POLL_INTERVAL = 0.001
+
+
+class RingBuffer:
+    """
+    A single producer, single consumer byte ring buffer in shared memory.
+
+    The buffer is an anonymous shared mapping, so it is shared with every
+    process forked after it was created. Messages are length-prefixed and
+    written contiguously (wrapping around the end of the buffer). The producer
+    only ever advances the write counters, and the consumer only ever advances
+    the read counters, so neither side needs to take a lock.
+
+    Every message carries a checksum. A consumer that observes the write
+    counter before the message itself (stores are not necessarily visible in
+    order on all architectures) treats the message as not yet written.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._buf = mmap.mmap(-1, _HEADER.size + capacity)
+
+    def _counters(self) -> tuple[int, int, int, int]:
+        return _HEADER.unpack_from(self._buf, 0)
+
+    def __len__(self) -> int:
+        _, _, written, read = self._counters()
+        return written - read
+
+    def _write(self, position: int, data: bytes) -> None:
+        offset = position % self.capacity
+        head = min(len(data), self.capacity - offset)
+        self._buf[_HEADER.size + offset : _HEADER.size + offset + head] = data[:head]
+        if head < len(data):
+            self._buf[_HEADER.size : _HEADER.size + len(data) - head] = data[head:]
+
+    def _read(self, position: int, size: int) -> bytes:
+        offset = position % self.capacity
+        head = min(size, self.capacity - offset)
+        data = self._buf[_HEADER.size + offset : _HEADER.size + offset + head]
+        if head < size:
+            data += self._buf[_HEADER.size : _HEADER.size + size - head]
+        return data
+
+    def put(self, payload: bytes) -> bool:
+        """
+        Write a message to the buffer. Returns False if there is not enough
+        free space for it.
+        """
+        size = _RECORD.size + len(payload)
+        if size > self.capacity:
+            raise ValueError(f"message of {len(payload)} bytes does not fit in the ring buffer")
+
+        bytes_written, bytes_read, written, _ = self._counters()
+        if self.capacity - (bytes_written - bytes_read) < size:
+            return False
+
+        self._write(bytes_written, _RECORD.pack(len(payload), zlib.crc32(payload)) + payload)
+        struct.pack_into("<Q", self._buf, 0, bytes_written + size)
+        struct.pack_into("<Q", self._buf, 16, written + 1)
+        return True
+
+    def get(self) -> bytes | None:
+        """
+        Read the next message from the buffer, or None if it is empty.
+        """
+        bytes_written, bytes_read, _, read = self._counters()
+        if bytes_written - bytes_read < _RECORD.size:
+            return None
+
+        size, checksum = _RECORD.unpack(self._read(bytes_read, _RECORD.size))
+        if bytes_written - bytes_read < _RECORD.size + size:
+            return None
+        payload = self._read(bytes_read + _RECORD.size, size)
+        if zlib.crc32(payload) != checksum:
+            return None
+
+        struct.pack_into("<Q", self._buf, 8, bytes_read + _RECORD.size + size)
+        struct.pack_into("<Q", self._buf, 24, read + 1)
+        return payload
+
+
+def _poll(attempt: Callable[[], bool], timeout: float | None) -> bool:
+    """
+    Call `attempt` until it succeeds, backing off between calls. Returns
+    False if it did not succeed within `timeout` seconds.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = _MIN_POLL_INTERVAL
+    while not attempt():
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+        interval = min(interval * 2, _MAX_POLL_INTERVAL)
+    return True
+
+
+class RingReader(Generic[T]):
+    """The consuming end of a ring, with the `get` interface of a `Queue`."""
+
+    def __init__(self, ring: RingBuffer, loads: Callable[[bytes], T]) -> None:
+        self._ring = ring
+        self._loads = loads
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        payload = None
+
+        def attempt() -> bool:
+            nonlocal payload
+            payload = self._ring.get()
+            return payload is not None
+
+        if not _poll(attempt, timeout if block else 0) or payload is None:
+            raise queue.Empty
+        return self._loads(payload)
+
+
+class RingWriter(Generic[T]):
+    """The producing end of a ring, with the `put` interface of a `Queue`."""
+
+    def __init__(self, ring: RingBuffer, dumps: Callable[[T], bytes]) -> None:
+        self._ring = ring
+        self._dumps = dumps
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        payload = self._dumps(item)
+        if not _poll(lambda: self._ring.put(payload), timeout if block else 0):
+            raise queue.Full
+
+
+class FanOutQueue(Generic[T]):
+    """
+    Distributes items from the parent process to one ring per child.
+
+    Every item goes to the ring of the child with the fewest pending items,
+    so a child that is stuck on a slow task does not collect a backlog while
+    others are idle. Rings outlive their children: a replacement child that
+    is spawned for a slot picks up whatever its predecessor left behind.
+    """
+
+    def __init__(
+        self,
+        num_children: int,
+        maxsize: int,
+        capacity: int,
+        dumps: Callable[[T], bytes],
+        loads: Callable[[bytes], T],
+    ) -> None:
+        self._rings = [RingBuffer(capacity) for _ in range(num_children)]
+        self._max_per_ring = max(-(-maxsize // num_children), 1)
+        self._dumps = dumps
+        self._loads = loads
+        self._lock = threading.Lock()
+
+    def reader(self, slot: int) -> RingReader[T]:
+        return RingReader(self._rings[slot], self._loads)
+
+    def qsize(self) -> int:
+        return sum(len(ring) for ring in self._rings)
+
+    def full(self) -> bool:
+        return all(len(ring) >= self._max_per_ring for ring in self._rings)
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        payload = self._dumps(item)
+
+        def attempt() -> bool:
+            # Several parent threads produce into the rings, the lock keeps
+            # each ring single producer.
+            with self._lock:
+                ring = min(self._rings, key=len)
+                return len(ring) < self._max_per_ring and ring.put(payload)
+
+        if not _poll(attempt, timeout if block else 0):
+            raise queue.Full
+
+
+class FanInQueue(Generic[T]):
+    """
+    Collects items from one ring per child in the parent process.
+
+    Rings are read round robin so a busy child can't starve the others.
+    Items `put` by the parent itself (e.g. results that need to be retried)
+    are kept in a process local queue and returned along with the rest.
+    """
+
+    def __init__(
+        self,
+        num_children: int,
+        capacity: int,
+        dumps: Callable[[T], bytes],
+        loads: Callable[[bytes], T],
+    ) -> None:
+        self._rings = [RingBuffer(capacity) for _ in range(num_children)]
+        self._dumps = dumps
+        self._loads = loads
+        self._local: queue.SimpleQueue[T] = queue.SimpleQueue()
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def writer(self, slot: int) -> RingWriter[T]:
+        return RingWriter(self._rings[slot], self._dumps)
+
+    def put(self, item: T, block: bool = True, timeout: float | None = None) -> None:
+        self._local.put(item)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        item: T | None = None
+
+        def attempt() -> bool:
+            nonlocal item
+            with self._lock:
+                for i in range(len(self._rings)):
+                    ring = self._rings[(self._next + i) % len(self._rings)]
+                    payload = ring.get()
+                    if payload is not None:
+                        self._next = (self._next + i + 1) % len(self._rings)
+                        item = self._loads(payload)
+                        return True
+            try:
+                item = self._local.get_nowait()
+            except queue.Empty:
+                return False
+            return True
+
+        if not _poll(attempt, timeout if block else 0) or item is None:
+            raise queue.Empty
+        return item
+
+    def get_nowait(self) -> T:
+        return self.get(block=False)
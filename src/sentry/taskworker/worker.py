@@ -4,8 +4,10 @@ import atexit
 import dataclasses
 import logging
 import multiprocessing
+import multiprocessing.queues
 import queue
 import signal
+import struct
 import sys
 import threading
 import time
@@ -29,10 +31,20 @@ from sentry_protos.taskbroker.v1.taskbroker_pb2 import (
 )
 
 from sentry.taskworker.client import TaskworkerClient
-from sentry.taskworker.constants import DEFAULT_REBALANCE_AFTER, DEFAULT_WORKER_QUEUE_SIZE
+from sentry.taskworker.constants import (
+    DEFAULT_REBALANCE_AFTER,
+    DEFAULT_RESULT_BATCH_TIMEOUT,
+    DEFAULT_SHM_RING_SIZE,
+    DEFAULT_WORKER_BATCH_SIZE,
+    DEFAULT_WORKER_QUEUE_SIZE,
+    THREAD_DEADLINE_GRACE,
+)
 from sentry.taskworker.registry import taskregistry
-from sentry.taskworker.state import clear_current_task, current_task, set_current_task
+from sentry.taskworker.state import clear_current_task, set_current_task
 from sentry.taskworker.task import Task
+from sentry.taskworker.threaded import ThreadedExecutor
+from sentry.taskworker.transport import FanInQueue, FanOutQueue, RingReader, RingWriter
+from sentry.taskworker.zygote import Zygote, ZygoteChild, warm_process
 from sentry.utils import metrics
 from sentry.utils.memory import track_memory_usage
 
@@ -48,6 +60,21 @@ class ProcessingResult:
     status: TaskActivationStatus.ValueType
 
 
+_RESULT_STATUS = struct.Struct("<i")
+
+
+def _dump_result(result: ProcessingResult) -> bytes:
+    return _RESULT_STATUS.pack(result.status) + result.task_id.encode("utf-8")
+
+
+def _load_result(data: bytes) -> ProcessingResult:
+    (status,) = _RESULT_STATUS.unpack_from(data)
+    return ProcessingResult(
+        task_id=data[_RESULT_STATUS.size :].decode("utf-8"),
+        status=status,  # type: ignore[arg-type]
+    )
+
+
 AT_MOST_ONCE_TIMEOUT = 60 * 60 * 24  # 1 day
 
 
@@ -74,9 +101,21 @@ def _get_known_task(activation: TaskActivation) -> Task[Any, Any] | None:
     return namespace.get(activation.taskname)
 
 
+class ProcessingDeadlineExceeded(BaseException):
+    """
+    Raised by the SIGALRM handler of a child to interrupt the activation it
+    runs in its main thread. It isn't an `Exception`, so that the activation
+    can't handle it like an error of its own.
+    """
+
+
+# The next state of an activation, and when its execution started and completed.
+_Execution = tuple[TaskActivationStatus.ValueType, float, float]
+
+
 def child_worker(
-    child_tasks: queue.Queue[TaskActivation],
-    processed_tasks: queue.Queue[ProcessingResult],
+    child_tasks: queue.Queue[TaskActivation] | RingReader[TaskActivation],
+    processed_tasks: queue.Queue[ProcessingResult] | RingWriter[ProcessingResult],
     shutdown_event: Event,
     max_task_count: int | None,
 ) -> None:
@@ -84,32 +123,85 @@ def child_worker(
         __import__(module)
 
     processed_task_count = 0
+    # Results are pushed from executor threads as well as the main thread.
+    result_lock = threading.RLock()
+    executors: dict[str, ThreadedExecutor[_Execution]] = {}
+
+    def push_result(activation: TaskActivation, status: TaskActivationStatus.ValueType) -> None:
+        with result_lock:
+            processed_tasks.put(ProcessingResult(task_id=activation.id, status=status))
+
+    def complete(activation: TaskActivation, execution: _Execution) -> None:
+        nonlocal processed_task_count
+        next_state, execution_start_time, execution_complete_time = execution
+        processed_task_count += 1
+
+        push_result(activation, next_state)
+        metrics.distribution(
+            "taskworker.worker.processed_tasks.put.duration",
+            time.time() - execution_complete_time,
+        )
+        _record_execution(activation, next_state, execution_start_time, execution_complete_time)
+
+    def deadline_exceeded(activation: TaskActivation) -> None:
+        push_result(activation, TASK_ACTIVATION_STATUS_FAILURE)
+        metrics.incr(
+            "taskworker.worker.processing_deadline_exceeded",
+            tags={
+                "namespace": activation.namespace,
+                "taskname": activation.taskname,
+            },
+        )
+
+    def get_executor(task_func: Task[Any, Any]) -> ThreadedExecutor[_Execution] | None:
+        namespace = task_func.namespace
+        if namespace.execution_mode != "thread":
+            return None
+        if namespace.name not in executors:
+            executors[namespace.name] = ThreadedExecutor(
+                namespace.name,
+                namespace.thread_concurrency,
+                THREAD_DEADLINE_GRACE,
+                _run_activation,
+                complete,
+                deadline_exceeded,
+            )
+        return executors[namespace.name]
+
+    def enforce_deadlines() -> None:
+        if not any([executor.enforce_deadlines() for executor in executors.values()]):
+            return
+
+        # A thread is stuck far beyond its deadline, and threads can't be
+        # interrupted. Give up on everything in flight and let the parent
+        # replace this process.
+        logger.warning("taskworker.worker.thread_deadline_exceeded")
+        for executor in executors.values():
+            executor.fail_in_flight()
+        sys.exit(1)
 
     def handle_alarm(signum: int, frame: Any) -> None:
         """
         Handle SIGALRM
 
-        If we hit an alarm in a child, we need to push a result
-        and terminate the child.
+        If we hit an alarm in a child, the activation running in the main
+        thread is interrupted. Its result is pushed by the main loop, which
+        then terminates the child. Nothing is pushed from here, as the handler
+        may run while a result is being pushed.
         """
-        current = current_task()
-        if current:
-            processed_tasks.put(
-                ProcessingResult(task_id=current.id, status=TASK_ACTIVATION_STATUS_FAILURE)
-            )
-            metrics.incr(
-                "taskworker.worker.processing_deadline_exceeded",
-                tags={
-                    "namespace": current.namespace,
-                    "taskname": current.taskname,
-                },
-            )
-        sys.exit(1)
+        raise ProcessingDeadlineExceeded()
 
     signal.signal(signal.SIGALRM, handle_alarm)
 
     while True:
-        if max_task_count and processed_task_count >= max_task_count:
+        enforce_deadlines()
+        in_flight = sum(len(executor) for executor in executors.values())
+
+        if max_task_count and processed_task_count + in_flight >= max_task_count:
+            if in_flight:
+                # Let the activations in flight finish before exiting.
+                time.sleep(0.01)
+                continue
             metrics.incr(
                 "taskworker.worker.max_task_count_reached",
                 tags={"count": processed_task_count},
@@ -122,7 +214,8 @@ def child_worker(
             break
 
         try:
-            activation = child_tasks.get(timeout=1.0)
+            # Check on threaded activations regularly while any are in flight.
+            activation = child_tasks.get(timeout=0.1 if in_flight else 1.0)
         except queue.Empty:
             metrics.incr("taskworker.worker.child_task_queue_empty")
             continue
@@ -133,9 +226,7 @@ def child_worker(
                 "taskworker.worker.unknown_task",
                 tags={"namespace": activation.namespace, "taskname": activation.taskname},
             )
-            processed_tasks.put(
-                ProcessingResult(task_id=activation.id, status=TASK_ACTIVATION_STATUS_FAILURE)
-            )
+            push_result(activation, TASK_ACTIVATION_STATUS_FAILURE)
             continue
 
         if task_func.at_most_once:
@@ -150,68 +241,92 @@ def child_worker(
                 )
                 continue
 
-        set_current_task(activation)
-
-        # Set an alarm for the processing_deadline_duration
-        signal.alarm(activation.processing_deadline_duration)
+        executor = get_executor(task_func)
+        if executor is not None:
+            while executor.full():
+                executor.wait(0.1)
+                enforce_deadlines()
+            executor.submit(task_func, activation)
+            continue
 
-        execution_start_time = time.time()
-        next_state = TASK_ACTIVATION_STATUS_FAILURE
         try:
-            _execute_activation(task_func, activation)
-            next_state = TASK_ACTIVATION_STATUS_COMPLETE
-            # Clear the alarm
-            signal.alarm(0)
-        except Exception as err:
-            if task_func.should_retry(activation.retry_state, err):
-                logger.info("taskworker.task.retry", extra={"taskname": activation.taskname})
-                next_state = TASK_ACTIVATION_STATUS_RETRY
-
-            if next_state != TASK_ACTIVATION_STATUS_RETRY:
-                logger.info(
-                    "taskworker.task.errored", extra={"type": str(err.__class__), "error": str(err)}
-                )
+            # Set an alarm for the processing_deadline_duration
+            signal.alarm(activation.processing_deadline_duration)
+            try:
+                execution = _run_activation(task_func, activation)
+            finally:
+                # Clear the alarm
+                signal.alarm(0)
+        except ProcessingDeadlineExceeded:
+            clear_current_task()
+            deadline_exceeded(activation)
+            # Activations running in threads die with this process.
+            for executor in executors.values():
+                executor.fail_in_flight()
+            sys.exit(1)
+
+        complete(activation, execution)
+
+
+def _run_activation(task_func: Task[Any, Any], activation: TaskActivation) -> _Execution:
+    """Execute an activation and determine its next state."""
+    set_current_task(activation)
+
+    execution_start_time = time.time()
+    next_state = TASK_ACTIVATION_STATUS_FAILURE
+    try:
+        _execute_activation(task_func, activation)
+        next_state = TASK_ACTIVATION_STATUS_COMPLETE
+    except Exception as err:
+        if task_func.should_retry(activation.retry_state, err):
+            logger.info("taskworker.task.retry", extra={"taskname": activation.taskname})
+            next_state = TASK_ACTIVATION_STATUS_RETRY
+
+        if next_state != TASK_ACTIVATION_STATUS_RETRY:
+            logger.info(
+                "taskworker.task.errored", extra={"type": str(err.__class__), "error": str(err)}
+            )
 
-        clear_current_task()
-        processed_task_count += 1
+    clear_current_task()
+    # Get completion time before pushing to queue to avoid inflating latency metrics.
+    return next_state, execution_start_time, time.time()
 
-        # Get completion time before pushing to queue to avoid inflating latency metrics.
-        execution_complete_time = time.time()
-        processed_tasks.put(ProcessingResult(task_id=activation.id, status=next_state))
-        metrics.distribution(
-            "taskworker.worker.processed_tasks.put.duration",
-            time.time() - execution_complete_time,
-        )
 
-        task_added_time = activation.received_at.ToDatetime().timestamp()
-        execution_duration = execution_complete_time - execution_start_time
-        execution_latency = execution_complete_time - task_added_time
-        logger.debug(
-            "taskworker.task_execution",
-            extra={
-                "taskname": activation.taskname,
-                "execution_duration": execution_duration,
-                "execution_latency": execution_latency,
-                "status": next_state,
-            },
-        )
-        metrics.incr(
-            "taskworker.worker.execute_task",
-            tags={
-                "namespace": activation.namespace,
-                "status": next_state,
-            },
-        )
-        metrics.distribution(
-            "taskworker.worker.execution_duration",
-            execution_duration,
-            tags={"namespace": activation.namespace, "taskname": activation.taskname},
-        )
-        metrics.distribution(
-            "taskworker.worker.execution_latency",
-            execution_latency,
-            tags={"namespace": activation.namespace, "taskname": activation.taskname},
-        )
+def _record_execution(
+    activation: TaskActivation,
+    next_state: TaskActivationStatus.ValueType,
+    execution_start_time: float,
+    execution_complete_time: float,
+) -> None:
+    task_added_time = activation.received_at.ToDatetime().timestamp()
+    execution_duration = execution_complete_time - execution_start_time
+    execution_latency = execution_complete_time - task_added_time
+    logger.debug(
+        "taskworker.task_execution",
+        extra={
+            "taskname": activation.taskname,
+            "execution_duration": execution_duration,
+            "execution_latency": execution_latency,
+            "status": next_state,
+        },
+    )
+    metrics.incr(
+        "taskworker.worker.execute_task",
+        tags={
+            "namespace": activation.namespace,
+            "status": next_state,
+        },
+    )
+    metrics.distribution(
+        "taskworker.worker.execution_duration",
+        execution_duration,
+        tags={"namespace": activation.namespace, "taskname": activation.taskname},
+    )
+    metrics.distribution(
+        "taskworker.worker.execution_latency",
+        execution_latency,
+        tags={"namespace": activation.namespace, "taskname": activation.taskname},
+    )
 
 
 def _execute_activation(task_func: Task[Any, Any], activation: TaskActivation) -> None:
@@ -241,6 +356,19 @@ class TaskWorker:
     As tasks are completed status changes will be sent back to the RPC host and new tasks
     will be fetched.
 
+    When `fetch_batch_size` or `result_batch_size` are larger than 1, activations
+    are fetched and results are delivered in batches, which amortizes the RPC
+    round trips over many short tasks. Result batches are delivered once full,
+    or once `result_batch_timeout` seconds have passed since their first result.
+
+    With the `shm` transport, activations and results are exchanged with children
+    as serialized bytes through shared memory ring buffers (one pair per child)
+    instead of through `multiprocessing.Queue`, which avoids pickling, feeder
+    threads and locks on every handoff.
+
+    With `zygote` enabled, children are not forked from the worker itself but
+    from a warmed up, single threaded copy of it (see `Zygote`).
+
     Taskworkers can be run with `sentry run taskworker`
     """
 
@@ -254,20 +382,46 @@ class TaskWorker:
         child_tasks_queue_maxsize: int = DEFAULT_WORKER_QUEUE_SIZE,
         result_queue_maxsize: int = DEFAULT_WORKER_QUEUE_SIZE,
         rebalance_after: int = DEFAULT_REBALANCE_AFTER,
+        fetch_batch_size: int = DEFAULT_WORKER_BATCH_SIZE,
+        result_batch_size: int = DEFAULT_WORKER_BATCH_SIZE,
+        result_batch_timeout: float = DEFAULT_RESULT_BATCH_TIMEOUT,
+        transport: str = "queue",
+        shm_ring_size: int = DEFAULT_SHM_RING_SIZE,
+        zygote: bool = False,
         **options: dict[str, Any],
     ) -> None:
         self.options = options
         self._max_child_task_count = max_child_task_count
         self._namespace = namespace
         self._concurrency = concurrency
+        self._fetch_batch_size = max(fetch_batch_size, 1)
+        self._result_batch_size = max(result_batch_size, 1)
+        self._result_batch_timeout = result_batch_timeout
         self.client = TaskworkerClient(rpc_host, num_brokers, rebalance_after)
-        self._child_tasks: multiprocessing.Queue[TaskActivation] = mp_context.Queue(
-            maxsize=child_tasks_queue_maxsize
+        self._child_tasks_queue_maxsize = child_tasks_queue_maxsize
+        self._child_tasks: multiprocessing.Queue[TaskActivation] | FanOutQueue[TaskActivation]
+        self._processed_tasks: (
+            multiprocessing.Queue[ProcessingResult] | FanInQueue[ProcessingResult]
         )
-        self._processed_tasks: multiprocessing.Queue[ProcessingResult] = mp_context.Queue(
-            maxsize=result_queue_maxsize
-        )
-        self._children: list[ForkProcess] = []
+        if transport == "shm":
+            self._child_tasks = FanOutQueue(
+                concurrency,
+                child_tasks_queue_maxsize,
+                shm_ring_size,
+                TaskActivation.SerializeToString,
+                TaskActivation.FromString,
+            )
+            self._processed_tasks = FanInQueue(
+                concurrency, shm_ring_size, _dump_result, _load_result
+            )
+        elif transport == "queue":
+            self._child_tasks = mp_context.Queue(maxsize=child_tasks_queue_maxsize)
+            self._processed_tasks = mp_context.Queue(maxsize=result_queue_maxsize)
+        else:
+            raise ValueError(f"Unknown transport: {transport}")
+        self._child_slots: dict[int, ForkProcess | ZygoteChild] = {}
+        self._children: list[ForkProcess | ZygoteChild] = []
+        self._zygote = Zygote(self._run_child) if zygote else None
         self._shutdown_event = mp_context.Event()
         self._task_receive_timing: dict[str, float] = {}
         self._result_thread: threading.Thread | None = None
@@ -290,6 +444,8 @@ class TaskWorker:
         completes its max_task_count when it shuts down.
         """
         self.do_imports()
+        # The zygote has to be forked before the worker starts any threads.
+        self.start_zygote()
         self.start_result_thread()
         self._spawn_children()
 
@@ -298,6 +454,14 @@ class TaskWorker:
         while True:
             self.run_once()
 
+    def start_zygote(self) -> None:
+        if self._zygote is None:
+            return
+        start = time.monotonic()
+        warm_process()
+        self._zygote.start()
+        metrics.distribution("taskworker.worker.zygote.start_duration", time.monotonic() - start)
+
     def run_once(self) -> None:
         """Access point for tests to run a single worker loop"""
         self._add_task()
@@ -318,6 +482,9 @@ class TaskWorker:
             child.terminate()
             child.join()
 
+        if self._zygote:
+            self._zygote.stop()
+
         if self._result_thread:
             self._result_thread.join()
 
@@ -332,13 +499,18 @@ class TaskWorker:
 
     def _add_task(self) -> bool:
         """
-        Add a task to child tasks queue. Returns False if no new task was fetched.
+        Add tasks to child tasks queue. Returns False if no new task was fetched.
         """
         if self._child_tasks.full():
             return False
 
-        task = self.fetch_task()
-        if task:
+        if self._fetch_batch_size > 1:
+            tasks = self.fetch_tasks(min(self._fetch_batch_size, self._free_child_task_slots()))
+        else:
+            task = self.fetch_task()
+            tasks = [task] if task else []
+
+        for task in tasks:
             try:
                 start_time = time.time()
                 self._child_tasks.put(task)
@@ -349,9 +521,14 @@ class TaskWorker:
                 logger.warning(
                     "taskworker.add_task.child_task_queue_full", extra={"task_id": task.id}
                 )
-            return True
-        else:
-            return False
+        return bool(tasks)
+
+    def _free_child_task_slots(self) -> int:
+        try:
+            return max(self._child_tasks_queue_maxsize - self._child_tasks.qsize(), 1)
+        except NotImplementedError:
+            # qsize() is not available on all platforms (macOS)
+            return 1
 
     def start_result_thread(self) -> None:
         """
@@ -376,7 +553,42 @@ class TaskWorker:
                         metrics.incr("taskworker.worker.result_thread.queue_empty")
                         continue
 
-        self._result_thread = threading.Thread(target=result_thread)
+        def batched_result_thread() -> None:
+            logger.debug("taskworker.worker.result_thread_started")
+            iopool = ThreadPoolExecutor(max_workers=self._concurrency)
+            with iopool as executor:
+                batch: list[ProcessingResult] = []
+                flush_at = 0.0
+                while not self._shutdown_event.is_set():
+                    timeout = max(flush_at - time.monotonic(), 0) if batch else 1.0
+                    try:
+                        result = self._processed_tasks.get(timeout=timeout)
+                    except queue.Empty:
+                        if not batch:
+                            metrics.incr("taskworker.worker.result_thread.queue_empty")
+                            continue
+                        reason = "deadline"
+                    else:
+                        if not batch:
+                            flush_at = time.monotonic() + self._result_batch_timeout
+                        batch.append(result)
+                        if len(batch) >= self._result_batch_size:
+                            reason = "size"
+                        elif time.monotonic() >= flush_at:
+                            reason = "deadline"
+                        else:
+                            continue
+
+                    metrics.incr("taskworker.worker.result_batch.flush", tags={"reason": reason})
+                    executor.submit(self._send_results, batch)
+                    batch = []
+
+                if batch:
+                    executor.submit(self._send_results, batch)
+
+        self._result_thread = threading.Thread(
+            target=batched_result_thread if self._result_batch_size > 1 else result_thread
+        )
         self._result_thread.start()
 
     def _send_result(self, result: ProcessingResult, fetch: bool = True) -> bool:
@@ -410,6 +622,43 @@ class TaskWorker:
         self._send_update_task(result, fetch_next=None)
         return True
 
+    def _send_results(self, results: list[ProcessingResult]) -> None:
+        """
+        Send a batch of results to the brokers. New tasks are not fetched
+        along with the results, the main loop fetches them in batches instead.
+
+        Run in a thread, see `start_result_thread`
+        """
+        now = time.time()
+        for result in results:
+            task_received = self._task_receive_timing.pop(result.task_id, None)
+            if task_received is not None:
+                metrics.distribution("taskworker.worker.complete_duration", now - task_received)
+
+        metrics.distribution("taskworker.worker.result_batch.size", len(results))
+        metrics.distribution(
+            "taskworker.worker.result_batch.fill", len(results) / self._result_batch_size
+        )
+
+        # Use the shutdown_event as a sleep mechanism
+        self._shutdown_event.wait(self._setstatus_backoff_seconds)
+        errors = self.client.update_tasks([(result.task_id, result.status) for result in results])
+        if not errors:
+            self._setstatus_backoff_seconds = 0
+            return
+
+        self._setstatus_backoff_seconds = min(self._setstatus_backoff_seconds + 1, 10)
+        for result in results:
+            error = errors.get(result.task_id)
+            if error is None:
+                continue
+            if error.code() == grpc.StatusCode.UNAVAILABLE:
+                self._processed_tasks.put(result)
+            logger.warning(
+                "taskworker.send_update_task.failed",
+                extra={"task_id": result.task_id, "error": error},
+            )
+
     def _send_update_task(
         self, result: ProcessingResult, fetch_next: FetchNextTask | None
     ) -> TaskActivation | None:
@@ -440,25 +689,69 @@ class TaskWorker:
             )
             return None
 
+    def _child_transport(self, slot: int) -> tuple[
+        queue.Queue[TaskActivation] | RingReader[TaskActivation],
+        queue.Queue[ProcessingResult] | RingWriter[ProcessingResult],
+    ]:
+        # A replacement child takes over the rings of the child it
+        # replaces, including any activations that were still pending.
+        child_tasks: queue.Queue[TaskActivation] | RingReader[TaskActivation]
+        processed_tasks: queue.Queue[ProcessingResult] | RingWriter[ProcessingResult]
+        if isinstance(self._child_tasks, FanOutQueue):
+            child_tasks = self._child_tasks.reader(slot)
+        else:
+            child_tasks = self._child_tasks
+        if isinstance(self._processed_tasks, FanInQueue):
+            processed_tasks = self._processed_tasks.writer(slot)
+        else:
+            processed_tasks = self._processed_tasks
+        return child_tasks, processed_tasks
+
+    def _run_child(self, slot: int) -> None:
+        child_tasks, processed_tasks = self._child_transport(slot)
+        try:
+            child_worker(
+                child_tasks, processed_tasks, self._shutdown_event, self._max_child_task_count
+            )
+        finally:
+            # Children forked by the zygote exit without running the exit
+            # handlers of multiprocessing, which would flush the results still
+            # buffered by the queue's feeder thread.
+            if isinstance(processed_tasks, multiprocessing.queues.Queue):
+                processed_tasks.close()
+                processed_tasks.join_thread()
+
     def _spawn_children(self) -> None:
-        active_children = [child for child in self._children if child.is_alive()]
-        if len(active_children) >= self._concurrency:
-            return
-        for _ in range(self._concurrency - len(active_children)):
-            process = mp_context.Process(
-                target=child_worker,
-                args=(
-                    self._child_tasks,
-                    self._processed_tasks,
-                    self._shutdown_event,
-                    self._max_child_task_count,
-                ),
+        if self._zygote and not self._zygote.is_alive():
+            # The worker runs threads by now, so it can neither fork children
+            # itself nor fork a new zygote safely. Exit and leave the restart
+            # to whatever supervises the worker.
+            logger.error("taskworker.zygote.died")
+            metrics.incr("taskworker.worker.zygote.died")
+            self.shutdown()
+            sys.exit(1)
+
+        for slot in range(self._concurrency):
+            child = self._child_slots.get(slot)
+            if child is not None and child.is_alive():
+                continue
+
+            start = time.monotonic()
+            process: ForkProcess | ZygoteChild
+            if self._zygote:
+                process = self._zygote.spawn(slot)
+            else:
+                process = mp_context.Process(target=self._run_child, args=(slot,))
+                process.start()
+            metrics.distribution(
+                "taskworker.worker.spawn_child.duration",
+                time.monotonic() - start,
+                tags={"zygote": self._zygote is not None},
             )
-            process.start()
-            active_children.append(process)
+            self._child_slots[slot] = process
             logger.info("taskworker.spawn_child", extra={"pid": process.pid})
 
-        self._children = active_children
+        self._children = list(self._child_slots.values())
 
     def fetch_task(self) -> TaskActivation | None:
         # Use the shutdown_event as a sleep mechanism
@@ -481,3 +774,28 @@ class TaskWorker:
         self._gettask_backoff_seconds = 0
         self._task_receive_timing[activation.id] = time.time()
         return activation
+
+    def fetch_tasks(self, count: int) -> list[TaskActivation]:
+        # Use the shutdown_event as a sleep mechanism
+        self._shutdown_event.wait(self._gettask_backoff_seconds)
+        try:
+            activations = self.client.get_tasks(count, self._namespace)
+        except grpc.RpcError as e:
+            logger.info("taskworker.fetch_task.failed", extra={"error": e})
+
+            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            return []
+
+        metrics.distribution("taskworker.worker.fetch_batch.fill", len(activations) / count)
+        if not activations:
+            metrics.incr("taskworker.worker.fetch_task.not_found")
+            logger.debug("taskworker.fetch_task.not_found")
+
+            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            return []
+
+        self._gettask_backoff_seconds = 0
+        now = time.time()
+        for activation in activations:
+            self._task_receive_timing[activation.id] = now
+        return activations
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import gc
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.context import ForkProcess
+
+from django.apps import apps
+from django.db import connections
+
+logger = logging.getLogger("sentry.taskworker.zygote")
+
+mp_context = multiprocessing.get_context("fork")
+
+
+def warm_process() -> None:
+    """
+    Do the one-off work child processes would otherwise repeat after they are
+    forked, and prepare the process for forking.
+
+    This expects the task modules to be imported already.
+    """
+    # Populate the model caches (relations, fields) of every model, tasks
+    # commonly hit these on their first query.
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+    # Connections can't be shared with forked processes, make sure every
+    # child opens its own.
+    connections.close_all()
+
+    # Move everything allocated so far into the permanent generation. The
+    # collector will no longer touch (and with that copy) these objects in
+    # children.
+    gc.collect()
+    gc.freeze()
+
+
+class ZygoteChild:
+    """
+    Handle on a child process forked by the zygote, with the parts of the
+    `multiprocessing.Process` interface the worker uses.
+
+    The child is a child of the zygote and not of the worker, so the worker
+    can't wait for it. The zygote reaps its children as they exit and reports
+    every exit to the worker, which is what liveness is tracked from. Probing
+    the pid instead could mistake a new process that reused it for the child.
+    """
+
+    def __init__(self, pid: int, zygote: Zygote) -> None:
+        self.pid = pid
+        self.exited = False
+        self._zygote = zygote
+
+    def is_alive(self) -> bool:
+        self._zygote.poll()
+        if self.exited:
+            return False
+        if self._zygote.is_alive():
+            return True
+        # Without the zygote nobody reports the exit anymore. The orphaned
+        # child is reaped by init, so fall back to probing its pid.
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def terminate(self) -> None:
+        if not self.is_alive():
+            return
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def join(self, timeout: float | None = None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+
+
+def _run_zygote(conn: Connection, parent_conn: Connection, target: Callable[[int], None]) -> None:
+    # Only the worker may hold on to its end of the pipe, otherwise the
+    # zygote never notices the worker going away.
+    parent_conn.close()
+    children: set[int] = set()
+
+    def reap() -> None:
+        for pid in list(children):
+            try:
+                reaped, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                reaped = pid
+            if reaped:
+                children.discard(pid)
+                try:
+                    conn.send(("exited", pid))
+                except OSError:
+                    pass
+
+    while True:
+        reap()
+        try:
+            if not conn.poll(0.1):
+                continue
+            slot = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        pid = os.fork()
+        if pid == 0:
+            conn.close()
+            exitcode = 1
+            try:
+                target(slot)
+                exitcode = 0
+            except SystemExit as e:
+                exitcode = e.code if isinstance(e.code, int) else 1
+            except Exception:
+                logger.exception("taskworker.zygote.child_failed")
+            finally:
+                os._exit(exitcode)
+
+        children.add(pid)
+        conn.send(("spawned", pid))
+
+    # The worker went away, wait for the remaining children before exiting.
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
+class Zygote:
+    """
+    A pre-forked copy of the worker process that child processes are forked
+    from.
+
+    The zygote is forked once, after the worker has imported and warmed up
+    everything children need (see `warm_process`), and before the worker
+    starts any threads. Children forked from it start instantly and share the
+    warm image with each other copy-on-write, instead of each repeating the
+    imports and holding its own copy. Replacing a child that reached its
+    `max_child_task_count` is as cheap as the first spawn.
+    """
+
+    def __init__(self, target: Callable[[int], None]) -> None:
+        self._target = target
+        self._conn: Connection | None = None
+        self._process: ForkProcess | None = None
+        self._children: dict[int, ZygoteChild] = {}
+
+    def start(self) -> None:
+        self._conn, child_conn = mp_context.Pipe()
+        self._process = mp_context.Process(
+            target=_run_zygote,
+            args=(child_conn, self._conn, self._target),
+            name="taskworker-zygote",
+        )
+        self._process.start()
+        child_conn.close()
+        logger.info("taskworker.zygote.started", extra={"pid": self._process.pid})
+
+    def spawn(self, slot: int) -> ZygoteChild:
+        """Fork a child that runs the target for the given slot."""
+        assert self._conn is not None, "zygote must be started before spawning children"
+        self._conn.send(slot)
+        while True:
+            kind, pid = self._conn.recv()
+            if kind == "spawned":
+                break
+            self._child_exited(pid)
+
+        child = self._children[pid] = ZygoteChild(pid, self)
+        return child
+
+    def poll(self) -> None:
+        """Process the exits of children the zygote reported since the last call."""
+        if self._conn is None:
+            return
+        try:
+            while self._conn.poll():
+                _, pid = self._conn.recv()
+                self._child_exited(pid)
+        except (EOFError, OSError):
+            pass
+
+    def _child_exited(self, pid: int) -> None:
+        child = self._children.pop(pid, None)
+        if child is not None:
+            child.exited = True
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def stop(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join()
+            self._process = None
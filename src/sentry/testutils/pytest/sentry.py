@@ -363,6 +363,23 @@ def pytest_runtest_teardown(item: pytest.Item) -> None:
     ProjectOption.objects.clear_local_cache()
     UserOption.objects.clear_local_cache()
 
+    from sentry.hybridcloud.rpc.caching.impl import _local_cache, clear_scope
+
+    _local_cache.clear()
+    clear_scope()
+
+    from sentry.grouping.component_cache import clear_stacktrace_component_cache
+
+    clear_stacktrace_component_cache()
+
+    from sentry.event_manager import _hot_groups
+
+    _hot_groups.clear()
+
+    from sentry.eventstore.compressor import clear_written_blobs
+
+    clear_written_blobs()
+
     sentry_sdk.Scope.get_global_scope().set_client(None)
 
 
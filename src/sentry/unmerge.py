@@ -6,6 +6,7 @@ from typing import Any, Union
 
 from sentry import eventstream
 from sentry.eventstore.models import Event
+from sentry.grouping.ingest.grouphash_cache import invalidate_grouphash_cache
 from sentry.models.grouphash import GroupHash
 from sentry.models.project import Project
 from sentry.utils.datastructures import BidirectionalMapping
@@ -115,6 +116,7 @@ class PrimaryHashUnmergeReplacement(UnmergeReplacement):
         GroupHash.objects.filter(project_id=project.id, hash__in=locked_primary_hashes).update(
             group=destination_id
         )
+        invalidate_grouphash_cache([project.id])
 
     def get_activity_args(self) -> Mapping[str, Any]:
         return {"fingerprints": self.fingerprints}
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, NamedTuple, TypeVar
+
+from cachetools import TLRUCache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+__all__ = ["LRUCache"]
+
+
+class _Entry(NamedTuple, Generic[V]):
+    value: V
+    ttl: float | None
+    size: int
+
+
+def _ttu(key: Hashable, entry: _Entry[V], now: float) -> float:
+    return now + entry.ttl if entry.ttl is not None else math.inf
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe, process-local least-recently-used cache, built on
+    `cachetools.TLRUCache`.
+
+    The cache is bounded by the number of entries and, optionally, by the
+    approximate number of bytes its entries take up as reported by `sizeof`.
+    Entries can be given a TTL in seconds, after which they are treated as
+    missing.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[K, V], int] | None = None,
+    ) -> None:
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("sizeof is required when max_bytes is set")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._cache: TLRUCache[K, _Entry[V]]
+        if max_bytes is None:
+            self._cache = TLRUCache(max_size, _ttu, timer=lambda: time.monotonic())
+        else:
+            # Entries count for at least `max_bytes / max_size` bytes each, so
+            # that the cache also holds at most `max_size` of them.
+            self._min_entry_size = -(-max_bytes // max_size)
+            self._cache = TLRUCache(
+                max_bytes,
+                _ttu,
+                timer=lambda: time.monotonic(),
+                getsizeof=lambda entry: max(entry.size, self._min_entry_size),
+            )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._cache.get(key)
+        return entry.value if entry is not None else None
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """
+        Return the values of all keys that are present, skipping any misses.
+        """
+        rv = {}
+        with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    rv[key] = entry.value
+        return rv
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        size = self.sizeof(key, value) if self.sizeof is not None else 0
+
+        with self._lock:
+            try:
+                self._cache[key] = _Entry(value, ttl, size)
+            except ValueError:
+                # The entry is larger than the whole cache.
+                self._cache.pop(key, None)
+
+    def set_many(self, items: dict[K, V], ttl: float | None = None) -> None:
+        for key, value in items.items():
+            self.set(key, value, ttl=ttl)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
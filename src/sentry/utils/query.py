@@ -252,10 +252,7 @@ class WithProgressBar:
         pbar.finish()
 
 
-def bulk_delete_objects(
-    model, limit=10000, transaction_id=None, logger=None, partition_key=None, **filters
-):
-    connection = connections[router.db_for_write(model)]
+def _bulk_delete_conditions(connection, partition_key, filters):
     quote_name = connection.ops.quote_name
 
     query = []
@@ -276,6 +273,15 @@ def bulk_delete_objects(
             query.append(f"{quote_name(column)} = %s")
             params.append(value)
 
+    return partition_query, query, params
+
+
+def bulk_delete_objects(
+    model, limit=10000, transaction_id=None, logger=None, partition_key=None, **filters
+):
+    connection = connections[router.db_for_write(model)]
+    partition_query, query, params = _bulk_delete_conditions(connection, partition_key, filters)
+
     query_s = """
         delete from %(table)s
         where %(partition_query)s id = any(array(
@@ -303,3 +309,48 @@ def bulk_delete_objects(
         )
 
     return has_more
+
+
+def bulk_delete_objects_after(model, after_id=None, limit=10000, partition_key=None, **filters):
+    """
+    Delete up to ``limit`` rows matching the filters with an id greater than
+    ``after_id``, in id order. Returns the number of deleted rows and the
+    largest deleted id (None if no rows were deleted).
+
+    Passing the returned id back as ``after_id`` pages through the table by
+    key, so that every batch starts where the previous one stopped instead of
+    scanning past the rows deleted by previous batches again. Rows that were
+    added behind the cursor in the meantime are not seen, callers should
+    finish with a pass from the start.
+    """
+    connection = connections[router.db_for_write(model)]
+    partition_query, query, params = _bulk_delete_conditions(connection, partition_key, filters)
+
+    if after_id is not None:
+        query.append("id > %s")
+        params.append(after_id)
+
+    query_s = """
+        with deleted as (
+            delete from %(table)s
+            where %(partition_query)s id = any(array(
+                select id
+                from %(table)s
+                where (%(query)s)
+                order by id
+                limit %(limit)d
+            ))
+            returning id
+        )
+        select count(*), max(id) from deleted
+    """ % dict(
+        partition_query=(" AND ".join(partition_query)) + (" AND " if partition_query else ""),
+        query=" AND ".join(query),
+        table=model._meta.db_table,
+        limit=limit,
+    )
+
+    cursor = connection.cursor()
+    cursor.execute(query_s, params)
+    deleted, last_id = cursor.fetchone()
+    return deleted, last_id
@@ -142,3 +142,51 @@ class RpcServiceEndpointTest(APITestCase):
         assert response.data == {
             "detail": ErrorDetail(string="Malformed request.", code="parse_error")
         }
+
+
+@override_settings(RPC_SHARED_SECRET=["a-long-value-that-is-hard-to-guess"])
+class RpcBatchEndpointTest(APITestCase):
+    path = reverse("sentry-api-0-rpc-batch")
+
+    def _send_post_request(self, data):
+        data = orjson.dumps(data).decode()
+        signature = generate_request_signature(self.path, data.encode())
+        return self.client.post(
+            self.path,
+            data=data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"rpcsignature {signature}",
+        )
+
+    def test_missing_authentication(self):
+        response = self.client.post(self.path, data={"calls": []})
+        assert response.status_code == 403
+
+    def test_malformed_calls(self):
+        response = self._send_post_request({"calls": [{"service": "organization"}]})
+        assert response.status_code == 400
+
+    def test_calls(self):
+        organization = self.create_organization()
+        response = self._send_post_request(
+            {
+                "meta": {},
+                "calls": [
+                    {
+                        "service": "organization",
+                        "method": "get_organization_by_id",
+                        "args": {"id": organization.id},
+                    },
+                    {"service": "organization", "method": "not_a_method", "args": {}},
+                    {"service": "organization", "method": "get_organization_by_id", "args": {}},
+                ],
+            }
+        )
+        assert response.status_code == 200
+
+        results = response.data["results"]
+        assert len(results) == 3
+        response_obj = RpcUserOrganizationContext.parse_obj(results[0]["value"])
+        assert response_obj.organization.id == organization.id
+        assert "404 status" in results[1]["error"]
+        assert "400 status" in results[2]["error"]
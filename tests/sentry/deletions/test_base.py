@@ -0,0 +1,64 @@
+from sentry.deletions import get_manager
+from sentry.deletions.base import (
+    BulkModelDeletionTask,
+    ModelDeletionTask,
+    ModelRelation,
+    _delete_children,
+    _plan_children,
+)
+from sentry.models.groupmeta import GroupMeta
+from sentry.models.groupredirect import GroupRedirect
+from sentry.models.grouprulestatus import GroupRuleStatus
+from sentry.testutils.cases import TestCase
+
+
+class DeleteChildrenTest(TestCase):
+    def test_plan_children(self):
+        relations = [
+            ModelRelation(GroupMeta, {"group_id": 1}, BulkModelDeletionTask, parallel=True),
+            ModelRelation(GroupMeta, {"group_id": 2}, BulkModelDeletionTask, parallel=True),
+            ModelRelation(GroupMeta, {"group_id": 3}, BulkModelDeletionTask),
+            ModelRelation(GroupMeta, {"group_id": 4}, BulkModelDeletionTask),
+            ModelRelation(GroupRuleStatus, {"group_id": 1}, ModelDeletionTask),
+            ModelRelation(GroupMeta, {"group_id": 5}, BulkModelDeletionTask, parallel=True),
+        ]
+        tasks = [get_manager().get(task=relation.task, **relation.params) for relation in relations]
+
+        # Only consecutive relations declared as parallel share a stage.
+        assert _plan_children(list(zip(relations, tasks))) == [
+            [tasks[0], tasks[1]],
+            [tasks[2]],
+            [tasks[3]],
+            [tasks[4]],
+            [tasks[5]],
+        ]
+
+    def test_bulk_chunks(self):
+        group = self.create_group()
+        for i in range(5):
+            GroupMeta.objects.create(group=group, key=f"key{i}", value="value")
+
+        task = BulkModelDeletionTask(
+            get_manager(), model=GroupMeta, query={"group_id": group.id}, chunk_size=2
+        )
+        assert [task.chunk() for _ in range(4)] == [True, True, True, False]
+        assert not GroupMeta.objects.filter(group_id=group.id).exists()
+
+    def test_concurrent_children_in_transaction(self):
+        group = self.create_group()
+        GroupMeta.objects.create(group=group, key="key", value="value")
+        GroupRedirect.objects.create(group_id=group.id, previous_group_id=group.id + 1)
+
+        # Test cases run in a transaction, so relations are deleted in this
+        # thread even though concurrency is enabled.
+        with self.options({"deletions.child-relations.concurrency": 4}):
+            _delete_children(
+                get_manager(),
+                [
+                    ModelRelation(GroupMeta, {"group_id": group.id}),
+                    ModelRelation(GroupRedirect, {"group_id": group.id}),
+                ],
+            )
+
+        assert not GroupMeta.objects.filter(group_id=group.id).exists()
+        assert not GroupRedirect.objects.filter(group_id=group.id).exists()
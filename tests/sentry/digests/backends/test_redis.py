@@ -158,3 +158,45 @@ class RedisBackendTestCase(TestCase):
 
         with backend.digest("timeline", 0) as records:
             assert len(records) == n
+
+    def test_digest_many(self):
+        backend = RedisBackend()
+
+        for timeline in ("timeline:1", "timeline:2"):
+            for i in range(2):
+                record = Record(f"{timeline}:record:{i}", self.notification, time.time())
+                backend.add(timeline, record)
+
+        # Timelines that don't exist (or aren't ready) are left out.
+        with backend.digest_many(
+            ["timeline:1", "timeline:2", "timeline:3"], minimum_delays={"timeline:1": 0}
+        ) as digests:
+            assert {
+                key: {record.key for record in records} for key, records in digests.items()
+            } == {
+                "timeline:1": {"timeline:1:record:0", "timeline:1:record:1"},
+                "timeline:2": {"timeline:2:record:0", "timeline:2:record:1"},
+            }
+
+        # Both timelines were closed and moved back to the waiting state.
+        with backend.digest_many(["timeline:1", "timeline:2"]) as digests:
+            assert digests == {}
+        assert {entry.key for entry in backend.schedule(time.time())} == {"timeline:1"}
+
+        with backend.digest("timeline:1", 0) as records:
+            assert not records
+
+    def test_digest_many_failure_recovery(self):
+        backend = RedisBackend()
+        backend.add("timeline", Record("record:1", self.notification, time.time()))
+
+        try:
+            with backend.digest_many(["timeline"]) as digests:
+                assert len(digests["timeline"]) == 1
+                raise Exception("This causes the digests to not be closed.")
+        except Exception:
+            pass
+
+        # The timeline is still ready and its records are preserved.
+        with backend.digest_many(["timeline"], minimum_delays={"timeline": 0}) as digests:
+            assert [record.key for record in digests["timeline"]] == ["record:1"]
@@ -10,6 +10,7 @@ from sentry.digests.notifications import (
     _sort_digest,
     event_to_record,
     split_key,
+    split_keys,
     unsplit_key,
 )
 from sentry.digests.types import NotificationWithRuleObjects, Record, RecordWithRuleObjects
@@ -153,6 +154,21 @@ class SplitKeyTestCase(TestCase):
         ) == (self.project, ActionTargetType.ISSUE_OWNERS, identifier, None)
 
 
+class SplitKeysTestCase(TestCase):
+    def test_split_keys(self):
+        project = self.create_project()
+        keys = [
+            f"mail:p:{self.project.id}",
+            f"mail:p:{project.id}:{ActionTargetType.MEMBER.value}:123:",
+            f"mail:p:0:{ActionTargetType.ISSUE_OWNERS.value}:",
+        ]
+        with self.assertNumQueries(1):
+            assert split_keys(keys) == {
+                keys[0]: (self.project, ActionTargetType.ISSUE_OWNERS, None, None),
+                keys[1]: (project, ActionTargetType.MEMBER, "123", None),
+            }
+
+
 class UnsplitKeyTestCase(TestCase):
     def test_no_identifier(self):
         assert (
@@ -2649,6 +2649,37 @@ class EventManagerTest(TestCase, SnubaTestCase, EventManagerTestMixin, Performan
             assert "grouping.in_app_frame_mix" not in metrics_logged
 
 
+class HotGroupCacheTest(TestCase):
+    @override_options({"store.hot-group-cache.rollout": 1.0})
+    def test_skips_unchanged_values(self) -> None:
+        timestamp = int(time()) // 10 * 10 - 100
+
+        def save_event(**kwargs: Any) -> Event:
+            manager = EventManager(
+                make_event(message="Dogs are great!", timestamp=timestamp, **kwargs)
+            )
+            manager.normalize()
+            return manager.save(self.project.id)
+
+        with mock.patch("sentry.event_manager.buffer_incr") as buffer_incr:
+            group_id = save_event().group_id
+            assert buffer_incr.call_count == 0
+
+            # The first update of the group buffers all values
+            assert save_event().group_id == group_id
+            assert set(buffer_incr.call_args.args[3]) >= {"last_seen", "data"}
+
+            assert save_event().group_id == group_id
+            assert buffer_incr.call_args.args[2] == {"id": group_id}
+            assert buffer_incr.call_args.args[3] == {}
+
+            assert save_event(culprit="dogs.py").group_id == group_id
+            assert buffer_incr.call_args.args[3]["culprit"] == "dogs.py"
+            assert "last_seen" not in buffer_incr.call_args.args[3]
+
+        assert buffer_incr.call_count == 3
+
+
 class ReleaseIssueTest(TestCase):
     def setUp(self) -> None:
         self.project = self.create_project()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from sentry.constants import DATA_ROOT
+from sentry.eventstore.processing import event_processing_store
+from sentry.eventstore.processing.codec import (
+    ENCODINGS,
+    FORMAT_MSGPACK,
+    FORMAT_MSGPACK_ZSTD,
+    EventProcessingStoreCodec,
+)
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.utils import json
+
+SAMPLES_DIR = os.path.join(DATA_ROOT, "samples")
+
+
+def load_sample(name: str) -> dict:
+    with open(os.path.join(SAMPLES_DIR, name)) as fp:
+        return json.load(fp)
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("name", sorted(os.listdir(SAMPLES_DIR)))
+def test_roundtrip(encoding: str, name: str) -> None:
+    event = load_sample(name)
+    codec = EventProcessingStoreCodec(encoding)
+    assert codec.decode(codec.encode(event)) == event
+
+
+def test_formats() -> None:
+    event = load_sample("python.json")
+    assert EventProcessingStoreCodec("json").encode(event) == json.dumps(event).encode()
+    assert EventProcessingStoreCodec("msgpack").encode(event)[0] == FORMAT_MSGPACK
+    assert EventProcessingStoreCodec("msgpack+zstd").encode(event)[0] == FORMAT_MSGPACK_ZSTD
+    # Small events aren't compressed.
+    assert EventProcessingStoreCodec("msgpack+zstd").encode({"a": 1})[0] == FORMAT_MSGPACK
+
+
+def test_decode_any_format() -> None:
+    event = load_sample("python.json")
+    codec = EventProcessingStoreCodec("json")
+    for encoding in ENCODINGS:
+        assert codec.decode(EventProcessingStoreCodec(encoding).encode(event)) == event
+
+
+def test_json_fallback() -> None:
+    codec = EventProcessingStoreCodec("msgpack")
+    event = {"extra": {"big": 2**70}}
+    encoded = codec.encode(event)
+    assert encoded == json.dumps(event).encode()
+    assert codec.decode(encoded) == event
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("name", sorted(os.listdir(SAMPLES_DIR)))
+def test_same_data_as_json(encoding: str, name: str) -> None:
+    event = load_sample(name)
+    # Values which JSON doesn't keep as they are.
+    event["extra"] = {
+        "int_keys": {1: "a", 2.5: "b", False: "c", None: "d"},
+        "bytes": b"value",
+        "nan": float("nan"),
+        "tuple": (1, 2),
+    }
+    json_codec = EventProcessingStoreCodec("json")
+    codec = EventProcessingStoreCodec(encoding)
+    assert codec.decode(codec.encode(event)) == json_codec.decode(json_codec.encode(event))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{1: "a"}, {"a": [{2: "b"}]}, {"a": b"b"}, {"a": float("inf")}, {"a": {"b": (float("nan"),)}}],
+)
+def test_json_fallback_for_json_only_values(value: dict) -> None:
+    assert EventProcessingStoreCodec("msgpack").encode(value) == json.dumps(value).encode()
+
+
+def test_unknown_encoding() -> None:
+    with pytest.raises(ValueError):
+        EventProcessingStoreCodec("pickle")
+
+
+@django_db_all
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_store(encoding: str) -> None:
+    event = {**load_sample("python.json"), "project": 1, "event_id": "a" * 32}
+    with override_options({"eventstore.processing.encoding": encoding}):
+        key = event_processing_store.store(event)
+    assert event_processing_store.get(key) == event
+    event_processing_store.delete_by_key(key)
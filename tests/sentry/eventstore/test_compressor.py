@@ -1,6 +1,7 @@
 import copy
+from datetime import timedelta
 
-from sentry.eventstore.compressor import assemble, deduplicate
+from sentry.eventstore.compressor import BLOB_REWRITE_INTERVAL, assemble, deduplicate, get_blob_ttl
 
 
 def _assert_roundtrip(data, assert_extra_keys=None):
@@ -52,3 +53,73 @@ def test_basic():
             }
         },
     )
+
+
+def test_interfaces():
+    data = {
+        "event_id": "a" * 32,
+        "modules": {"django": "5.0", "requests": "2.31"},
+        "sdk": {"name": "sentry.python", "version": "2.0.0", "packages": []},
+        "contexts": {
+            "os": {"type": "os", "name": "Android", "version": "14"},
+            "device": {"type": "device", "model": "Pixel 8", "free_memory": 1024, "name": "Jo"},
+            "trace": {"type": "trace", "trace_id": "b" * 32},
+        },
+    }
+    new_data, extra_keys = deduplicate(copy.deepcopy(data))
+
+    assert set(new_data) == {"event_id", "__nodestore_patchsets"}
+    inlined = {key: to_inline for key, _, to_inline in new_data["__nodestore_patchsets"]}
+    # Only the parts of contexts describing the host are deduplicated.
+    assert inlined["contexts"] == {
+        "os": {"type": "os"},
+        "device": {"type": "device", "free_memory": 1024, "name": "Jo"},
+        "trace": {"type": "trace", "trace_id": "b" * 32},
+    }
+    assert {"django": "5.0", "requests": "2.31"} in extra_keys.values()
+    _assert_roundtrip(data)
+
+
+def test_deduplicate_does_not_modify_data():
+    data = {
+        "debug_meta": {"images": [{"debug_id": "1234abcdef", "image_addr": "0x0"}]},
+        "contexts": {"os": {"name": "Linux"}},
+    }
+    original = copy.deepcopy(data)
+    deduplicate(data)
+    assert data == original
+
+
+def test_namespace():
+    data = {"modules": {"django": "5.0"}}
+    _, extra_keys = deduplicate(data)
+    _, same_keys = deduplicate(data)
+    _, other_keys = deduplicate(data, namespace=1)
+    assert extra_keys.keys() == same_keys.keys()
+    assert extra_keys.keys().isdisjoint(other_keys)
+
+
+def test_min_size():
+    data = {"modules": {"django": "5.0"}, "sdk": {"packages": ["pypi:sentry-sdk"] * 100}}
+    new_data, extra_keys = deduplicate(data, min_size=256)
+    assert new_data["modules"] == {"django": "5.0"}
+    assert "sdk" not in new_data
+    assert len(extra_keys) == 1
+
+
+def test_missing_blob():
+    data = {
+        "modules": {"django": "5.0"},
+        "debug_meta": {"images": [{"debug_id": "1234abcdef", "image_addr": "0x0"}]},
+    }
+    new_data, _ = deduplicate(copy.deepcopy(data))
+    assert assemble(new_data, lambda checksums: {}) == {
+        "debug_meta": {"images": [{"image_addr": "0x0"}]}
+    }
+
+
+def test_blob_ttl():
+    # Blobs outlive the events written up to BLOB_REWRITE_INTERVAL after them.
+    ttl = get_blob_ttl(timedelta(days=30))
+    assert ttl == timedelta(days=30, seconds=BLOB_REWRITE_INTERVAL)
+    assert get_blob_ttl(None) is None
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.urls import reverse
+
+from sentry.deletions.tasks.groups import delete_groups
+from sentry.grouping.ingest.grouphash_cache import (
+    cache_grouphashes,
+    get_cached_grouphashes,
+    invalidate_grouphash_cache,
+)
+from sentry.grouping.ingest.hashing import _create_grouphashes
+from sentry.models.grouphash import GroupHash
+from sentry.models.grouptombstone import GroupTombstone
+from sentry.tasks.merge import merge_groups
+from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
+from sentry.testutils.helpers.eventprocessing import save_new_event
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.skips import requires_snuba
+from sentry.unmerge import PrimaryHashUnmergeReplacement
+
+
+class GroupHashCacheTest(TestCase):
+    def test_cache_grouphashes(self) -> None:
+        group = self.create_group()
+        assigned = GroupHash.objects.create(project=self.project, hash="a" * 32, group=group)
+        tombstoned = GroupHash.objects.create(
+            project=self.project, hash="b" * 32, group_tombstone_id=1
+        )
+        unassigned = GroupHash.objects.create(project=self.project, hash="c" * 32)
+        hashes = [assigned.hash, tombstoned.hash, unassigned.hash]
+
+        found, generation = get_cached_grouphashes(self.project.id, hashes)
+        assert found == {}
+        cache_grouphashes(self.project.id, generation, [assigned, tombstoned, unassigned])
+
+        found, _ = get_cached_grouphashes(self.project.id, hashes)
+        assert found.keys() == {assigned.hash, tombstoned.hash}
+        assert found[assigned.hash].id == assigned.id
+        assert found[assigned.hash].group_id == group.id
+        assert found[assigned.hash].project_id == self.project.id
+        assert found[tombstoned.hash].group_tombstone_id == 1
+
+    @mock.patch("sentry.grouping.ingest.grouphash_cache.metrics")
+    def test_hit_and_miss(self, mock_metrics: mock.MagicMock) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.create_group()
+        )
+        hashes = [grouphash.hash, "b" * 32]
+
+        _, generation = get_cached_grouphashes(self.project.id, hashes)
+        assert mock_metrics.incr.call_args_list == [
+            mock.call("grouping.grouphash_cache.hit", 0, sample_rate=1.0),
+            mock.call("grouping.grouphash_cache.miss", 2, sample_rate=1.0),
+        ]
+        cache_grouphashes(self.project.id, generation, [grouphash])
+
+        mock_metrics.reset_mock()
+        found, _ = get_cached_grouphashes(self.project.id, hashes)
+        assert found.keys() == {grouphash.hash}
+        assert mock_metrics.incr.call_args_list == [
+            mock.call("grouping.grouphash_cache.hit", 1, sample_rate=1.0),
+            mock.call("grouping.grouphash_cache.miss", 1, sample_rate=1.0),
+        ]
+
+    def test_invalidate(self) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.create_group()
+        )
+        _, generation = get_cached_grouphashes(self.project.id, [grouphash.hash])
+        cache_grouphashes(self.project.id, generation, [grouphash])
+        _, generation = get_cached_grouphashes(self.project.id, [grouphash.hash])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_grouphash_cache([self.project.id])
+        assert get_cached_grouphashes(self.project.id, [grouphash.hash])[0] == {}
+
+        # Records read before the invalidation are not cached anymore.
+        cache_grouphashes(self.project.id, generation, [grouphash])
+        assert get_cached_grouphashes(self.project.id, [grouphash.hash])[0] == {}
+
+    def test_invalidate_before_first_cache(self) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.create_group()
+        )
+        found, generation = get_cached_grouphashes(self.project.id, [grouphash.hash])
+        assert found == {}
+        assert generation is None
+
+        # The project is invalidated between the lookup and caching the records read after it.
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_grouphash_cache([self.project.id])
+        cache_grouphashes(self.project.id, generation, [grouphash])
+        assert get_cached_grouphashes(self.project.id, [grouphash.hash])[0] == {}
+
+    def test_invalidate_not_committed(self) -> None:
+        grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.create_group()
+        )
+        _, generation = get_cached_grouphashes(self.project.id, [grouphash.hash])
+        cache_grouphashes(self.project.id, generation, [grouphash])
+
+        with self.captureOnCommitCallbacks(execute=False):
+            invalidate_grouphash_cache([self.project.id])
+        assert get_cached_grouphashes(self.project.id, [grouphash.hash])[0].keys() == {
+            grouphash.hash
+        }
+
+
+class CreateGroupHashesTest(TestCase):
+    def test_create(self) -> None:
+        grouphashes, created = _create_grouphashes(self.project, ["a" * 32, "b" * 32])
+        assert grouphashes.keys() == created == {"a" * 32, "b" * 32}
+        assert GroupHash.objects.filter(project=self.project).count() == 2
+
+    def test_fallback_on_existing_hash(self) -> None:
+        existing = GroupHash.objects.create(project=self.project, hash="a" * 32)
+
+        # The bulk insert fails on the existing hash, leaving nothing inserted, so the records are
+        # created one by one instead.
+        grouphashes, created = _create_grouphashes(self.project, ["a" * 32, "b" * 32])
+        assert grouphashes.keys() == {"a" * 32, "b" * 32}
+        assert created == {"b" * 32}
+        assert grouphashes["a" * 32].id == existing.id
+        assert GroupHash.objects.filter(project=self.project).count() == 2
+
+
+class GroupHashCacheInvalidationTestMixin:
+    def cache_grouphash(self, grouphash: GroupHash) -> None:
+        _, generation = get_cached_grouphashes(grouphash.project_id, [grouphash.hash])
+        cache_grouphashes(grouphash.project_id, generation, [grouphash])
+        found, _ = get_cached_grouphashes(grouphash.project_id, [grouphash.hash])
+        assert found.keys() == {grouphash.hash}
+
+    def assert_not_cached(self, grouphash: GroupHash) -> None:
+        assert get_cached_grouphashes(grouphash.project_id, [grouphash.hash])[0] == {}
+
+
+class GroupHashCacheEndpointInvalidationTest(APITestCase, GroupHashCacheInvalidationTestMixin):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_as(user=self.user)
+        self.group = self.create_group()
+        self.grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.group
+        )
+        self.cache_grouphash(self.grouphash)
+
+    @property
+    def path(self) -> str:
+        return f"/api/0/projects/{self.organization.slug}/{self.project.slug}/issues/"
+
+    @mock.patch("sentry.eventstream.backend")
+    def test_delete(self, mock_eventstream: mock.MagicMock) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"{self.path}?id={self.group.id}")
+        assert response.status_code == 204
+        self.assert_not_cached(self.grouphash)
+
+    def test_discard(self) -> None:
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            self.feature("projects:discard-groups"),
+        ):
+            response = self.client.put(f"{self.path}?id={self.group.id}", data={"discard": True})
+        assert response.status_code == 204
+        assert GroupHash.objects.get(id=self.grouphash.id).group_tombstone_id is not None
+        self.assert_not_cached(self.grouphash)
+
+    def test_undiscard(self) -> None:
+        tombstone = GroupTombstone.objects.create(
+            project_id=self.project.id,
+            previous_group_id=self.group.id,
+            message=self.group.message,
+        )
+        GroupHash.objects.filter(id=self.grouphash.id).update(
+            group=None, group_tombstone_id=tombstone.id
+        )
+        self.grouphash.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_grouphash_cache([self.project.id])
+        self.cache_grouphash(self.grouphash)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                reverse(
+                    "sentry-api-0-group-tombstone-details",
+                    kwargs={
+                        "organization_id_or_slug": self.organization.slug,
+                        "project_id_or_slug": self.project.slug,
+                        "tombstone_id": tombstone.id,
+                    },
+                )
+            )
+        assert response.status_code == 204
+        self.assert_not_cached(self.grouphash)
+
+
+@requires_snuba
+class GroupHashCacheTaskInvalidationTest(
+    TestCase, SnubaTestCase, GroupHashCacheInvalidationTestMixin
+):
+    def setUp(self) -> None:
+        super().setUp()
+        self.group = self.create_group()
+        self.grouphash = GroupHash.objects.create(
+            project=self.project, hash="a" * 32, group=self.group
+        )
+        self.cache_grouphash(self.grouphash)
+
+    def test_merge(self) -> None:
+        other_group = self.create_group()
+        with self.tasks(), self.captureOnCommitCallbacks(execute=True):
+            merge_groups([self.group.id], other_group.id)
+        assert GroupHash.objects.get(id=self.grouphash.id).group_id == other_group.id
+        self.assert_not_cached(self.grouphash)
+
+    def test_unmerge(self) -> None:
+        other_group = self.create_group()
+        replacement = PrimaryHashUnmergeReplacement(fingerprints=[self.grouphash.hash])
+        with self.captureOnCommitCallbacks(execute=True):
+            replacement.run_postgres_replacement(
+                self.project, other_group.id, [self.grouphash.hash]
+            )
+        assert GroupHash.objects.get(id=self.grouphash.id).group_id == other_group.id
+        self.assert_not_cached(self.grouphash)
+
+    def test_group_deletion(self) -> None:
+        with self.tasks(), self.captureOnCommitCallbacks(execute=True):
+            delete_groups(object_ids=[self.group.id])
+        assert not GroupHash.objects.filter(id=self.grouphash.id).exists()
+        self.assert_not_cached(self.grouphash)
+
+
+@requires_snuba
+class GetOrCreateGroupHashesCacheTest(TestCase):
+    @override_options({"grouping.grouphash_cache.rollout": 1.0})
+    def test_existing_group(self) -> None:
+        event = save_new_event({"message": "Dogs are great!"}, self.project)
+        primary_hash = event.get_primary_hash()
+        # The grouphash is only cached once it's assigned to the group.
+        assert get_cached_grouphashes(self.project.id, [primary_hash])[0] == {}
+
+        event2 = save_new_event({"message": "Dogs are great!"}, self.project)
+        assert event2.group_id == event.group_id
+        found, _ = get_cached_grouphashes(self.project.id, [primary_hash])
+        assert found[primary_hash].group_id == event.group_id
+
+        event3 = save_new_event({"message": "Dogs are great!"}, self.project)
+        assert event3.group_id == event.group_id
+
+    @override_options({"grouping.grouphash_cache.rollout": 1.0})
+    def test_moved_grouphash(self) -> None:
+        event = save_new_event({"message": "Dogs are great!"}, self.project)
+        save_new_event({"message": "Dogs are great!"}, self.project)
+        other_group = self.create_group()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GroupHash.objects.filter(group_id=event.group_id).update(group=other_group)
+            invalidate_grouphash_cache([self.project.id])
+
+        event2 = save_new_event({"message": "Dogs are great!"}, self.project)
+        assert event2.group_id == other_group.id
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from sentry.eventstore.models import Event
+from sentry.grouping.component import (
+    FrameGroupingComponent,
+    FunctionGroupingComponent,
+    StacktraceGroupingComponent,
+)
+from sentry.grouping.component_cache import (
+    cache_stacktrace_component,
+    clear_stacktrace_component_cache,
+    get_cached_stacktrace_component,
+)
+from sentry.grouping.strategies.configurations import CONFIGURATIONS
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from tests.sentry.grouping import GROUPING_INPUTS_DIR, GroupingInput, with_grouping_inputs
+
+
+def _get_variants(event: Event) -> dict[str, tuple[str | None, dict[str, Any]]]:
+    return {
+        variant_name: (variant.get_hash(), variant.as_dict())
+        for variant_name, variant in event.get_grouping_variants().items()
+    }
+
+
+@django_db_all
+@with_grouping_inputs("grouping_input", GROUPING_INPUTS_DIR)
+@override_options({"grouping.experiments.parameterization.uniq_id": 0})
+@pytest.mark.parametrize(
+    "config_name",
+    sorted(CONFIGURATIONS.keys()),
+    ids=lambda config_name: config_name.replace("-", "_"),
+)
+def test_cached_components_match(config_name: str, grouping_input: GroupingInput) -> None:
+    event = grouping_input.create_event(config_name, use_full_ingest_pipeline=False)
+    event.project = mock.Mock(id=11211231)
+    clear_stacktrace_component_cache()
+
+    expected = _get_variants(event)
+
+    with override_options({"grouping.component_cache.rollout": 1.0}):
+        # The first pass fills the cache and the second one is served from it
+        assert _get_variants(event) == expected
+        assert _get_variants(event) == expected
+
+
+def test_cached_component_is_copied() -> None:
+    clear_stacktrace_component_cache()
+    frame_component = FrameGroupingComponent(
+        values=[FunctionGroupingComponent(values=["dogs_are_great"])], in_app=True
+    )
+    component = StacktraceGroupingComponent(values=[frame_component])
+    cache_stacktrace_component("key", component)
+
+    # Updating the original or a cached copy doesn't change what's cached
+    frame_component.update(contributes=False, hint="ignored")
+    cached = get_cached_stacktrace_component("key")
+    assert cached is not None
+    assert (
+        cached.as_dict()
+        == StacktraceGroupingComponent(
+            values=[
+                FrameGroupingComponent(
+                    values=[FunctionGroupingComponent(values=["dogs_are_great"])], in_app=True
+                )
+            ]
+        ).as_dict()
+    )
+    cached.values[0].update(contributes=False, hint="ignored")
+
+    cached = get_cached_stacktrace_component("key")
+    assert cached is not None
+    assert cached.contributes
+    assert cached.values[0].contributes
+    assert cached.values[0].hint is None
+    assert get_cached_stacktrace_component("other key") is None
@@ -9,6 +9,7 @@ import pytest
 from django.db import connections
 from pytest import raises
 
+from sentry.audit_log.services.log import AuditLogEvent
 from sentry.hybridcloud.models.outbox import (
     ControlOutbox,
     OutboxFlushError,
@@ -367,6 +368,67 @@ class RegionOutboxTest(TestCase):
             ctx.__exit__(type(e), e, None)
             raise
 
+    def test_select_batch_messages(self) -> None:
+        with outbox_context(flush=False):
+            member_outbox = OrganizationMember(id=1, organization_id=1).outbox_for_update()
+            member_outbox.save()
+            OrganizationMember(id=1, organization_id=1).outbox_for_update().save()
+            OrganizationMember(id=2, organization_id=1).outbox_for_update().save()
+            org_outbox = Organization(id=1).outbox_for_update()
+            org_outbox.save()
+            OrganizationMember(id=3, organization_id=1).outbox_for_update().save()
+            last_org_outbox = Organization(id=1).outbox_for_update()
+            last_org_outbox.save()
+
+        # The run of member updates at the head of the shard ends at the
+        # organization update, every member is delivered once.
+        batch = member_outbox.select_batch_messages()
+        assert [message.object_identifier for message in batch] == [1, 2]
+        assert batch[0].id > member_outbox.id
+
+        RegionOutbox.objects.filter(category=OutboxCategory.ORGANIZATION_MEMBER_UPDATE).exclude(
+            object_identifier=3
+        ).delete()
+        assert [message.id for message in org_outbox.select_batch_messages()] == [
+            last_org_outbox.id
+        ]
+
+    def _save_audit_log_events(self, count: int) -> None:
+        with outbox_context(flush=False):
+            for event_id in range(count):
+                RegionOutbox(
+                    shard_scope=OutboxScope.AUDIT_LOG_SCOPE,
+                    shard_identifier=1,
+                    category=OutboxCategory.AUDIT_LOG_EVENT,
+                    object_identifier=RegionOutbox.next_object_identifier(),
+                    payload=AuditLogEvent(organization_id=1, event_id=event_id).__dict__,
+                ).save()
+
+    @patch("sentry.receivers.outbox.region.log_rpc_service")
+    def test_batch_handler(self, mock_log_rpc_service: Mock) -> None:
+        self._save_audit_log_events(3)
+
+        with self.options({"hybridcloud.outbox.batch-audit-logs": True}), outbox_runner():
+            pass
+
+        assert RegionOutbox.objects.count() == 0
+        (record_call,) = mock_log_rpc_service.record_audit_logs.mock_calls
+        assert [event.event_id for event in record_call.kwargs["events"]] == [0, 1, 2]
+
+    @patch("sentry.receivers.outbox.region.log_rpc_service")
+    def test_batch_handler_disabled(self, mock_log_rpc_service: Mock) -> None:
+        self._save_audit_log_events(3)
+
+        with outbox_runner():
+            pass
+
+        # Until the control silo serves record_audit_logs, every event is sent on its own.
+        assert RegionOutbox.objects.count() == 0
+        assert not mock_log_rpc_service.record_audit_logs.called
+        assert [
+            c.kwargs["event"].event_id for c in mock_log_rpc_service.record_audit_log.mock_calls
+        ] == [0, 1, 2]
+
     def test_outbox_rescheduling(self) -> None:
         with patch(
             "sentry.hybridcloud.models.outbox.process_region_outbox.send"
@@ -1,5 +1,8 @@
+import threading
+import time
 from collections.abc import Generator, Iterator
 from random import Random
+from unittest import mock
 
 from django.core.cache import cache
 
@@ -10,7 +13,12 @@ from sentry.hybridcloud.rpc.caching import (
     control_caching_service,
     region_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import (
+    CacheBackend,
+    _consume_generator,
+    _local_cache,
+    silo_cache_scope,
+)
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -326,3 +334,100 @@ def test_caching_list() -> None:
 
     cached_members = get_org_members(org.id)
     assert len(cached_members) == 0, "with members updated none are owners"
+
+
+@django_db_all(transaction=True)
+def test_caching_scope() -> None:
+    cache.clear()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    key = get_user.key_from(user.id)
+
+    with silo_cache_scope():
+        assert get_user(user.id)
+        # Further reads within the scope are served by the scope memo
+        # without looking at versions or either cache.
+        with mock.patch("sentry.hybridcloud.rpc.caching.impl._version_model") as version_model:
+            _local_cache.clear()
+            cache.clear()
+            with assume_test_silo_mode(SiloMode.CONTROL):
+                user.update(username=user.username + "moocow")
+            assert get_user(user.id).username != user.username
+        assert not version_model.called
+
+        # Clearing the key drops it from the scope as well.
+        region_caching_service.clear_key(region_name=get_local_region().name, key=key)
+        assert get_user(user.id).username == user.username
+
+
+@django_db_all(transaction=True)
+def test_caching_process_local() -> None:
+    cache.clear()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    assert get_user(user.id)
+
+    # Hits in the process local cache never reach the shared cache.
+    with mock.patch.object(cache, "get_many") as get_many:
+        assert get_user(user.id) == get_user.cb(user.id)
+    assert not get_many.called
+
+    # Versions are still read on every lookup, entries of cleared keys are
+    # not served.
+    with assume_test_silo_mode(SiloMode.CONTROL):
+        user.update(username=user.username + "moocow")
+    region_caching_service.clear_key(
+        region_name=get_local_region().name, key=get_user.key_from(user.id)
+    )
+    assert get_user(user.id).username == user.username
+
+
+@django_db_all(transaction=True)
+def test_caching_single_flight() -> None:
+    cache.clear()
+
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        calls.append(user_id)
+        started.set()
+        release.wait(5)
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    values = _consume_generator(
+        CacheBackend.get_cache([get_user.key_from(user.id)], SiloMode.REGION)
+    )
+    results: list[RpcUser | None] = []
+
+    def resolve() -> None:
+        results.append(_consume_generator(get_user.resolve_from(user.id, values)))
+
+    threads = [threading.Thread(target=resolve) for _ in range(3)]
+    threads[0].start()
+    assert started.wait(5)
+    with mock.patch("sentry.hybridcloud.rpc.caching.impl.metrics") as metrics:
+        for thread in threads[1:]:
+            thread.start()
+        # Wait for the other threads to queue up behind the first one.
+        deadline = time.monotonic() + 5
+        while metrics.incr.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [user.id]
+    assert len(results) == 3
+    assert all(result == results[0] for result in results)
@@ -14,9 +14,11 @@ from sentry.auth.services.auth import AuthService
 from sentry.hybridcloud.rpc.service import (
     RpcAuthenticationSetupException,
     RpcDisabledException,
+    RpcRemoteException,
     _RemoteSiloCall,
     dispatch_remote_call,
     dispatch_to_local_service,
+    rpc_batch,
 )
 from sentry.models.organizationmapping import OrganizationMapping
 from sentry.organizations.services.organization import (
@@ -34,6 +36,7 @@ from sentry.testutils.silo import assume_test_silo_mode, no_silo_test
 from sentry.types.region import Region, RegionCategory
 from sentry.users.services.user import RpcUser
 from sentry.users.services.user.serial import serialize_rpc_user
+from sentry.users.services.user.service import UserService
 from sentry.utils import json
 
 _REGIONS = [
@@ -308,3 +311,108 @@ class DispatchRemoteCallTest(TestCase):
         timeout_override_setting = {"organization_service.some_other_method": 20}
         with override_options({"hybridcloud.rpc.method_retry_overrides": timeout_override_setting}):
             assert test_class.get_method_retry_count() == default_value
+
+
+@no_silo_test
+class RpcBatchTest(TestCase):
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.REGION)
+    @override_options({"hybridcloud.rpc.batch-calls": True})
+    def test_batch(self) -> None:
+        user = self.create_user(is_superuser=True)
+        serial = serialize_rpc_user(user)
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/batch/",
+            content_type="json",
+            body=json.dumps(
+                {
+                    "meta": {},
+                    "results": [{"value": serial.dict()}, {"value": None}, {"error": "oops"}],
+                }
+            ),
+        )
+
+        user_service = UserService.create_delegation(use_test_client=False)
+        organization_service = OrganizationService.create_delegation(use_test_client=False)
+        with rpc_batch() as batch:
+            results = [batch.call(user_service.get_first_superuser) for _ in range(3)]
+            # Calls to the current silo are made right away.
+            local = batch.call(organization_service.get_organization_by_id, id=0)
+            assert local.done()
+            assert not results[0].done()
+            assert len(batch) == 3
+
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert [call["method"] for call in body["calls"]] == ["get_first_superuser"] * 3
+
+        assert results[0].result() == serial
+        assert results[1].result() is None
+        with pytest.raises(RpcRemoteException):
+            results[2].result()
+        assert local.result() is None
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.REGION)
+    @override_options({"hybridcloud.rpc.batch-calls": True})
+    def test_batch_size(self) -> None:
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/batch/",
+            content_type="json",
+            body=json.dumps({"meta": {}, "results": [{"value": None}] * 2}),
+        )
+
+        user_service = UserService.create_delegation(use_test_client=False)
+        with override_options({"hybridcloud.rpc.batch_size": 2}), rpc_batch() as batch:
+            results = [batch.call(user_service.get_first_superuser) for _ in range(4)]
+
+        assert len(responses.calls) == 2
+        assert all(result.result() is None for result in results)
+
+        # A batch size below 1 sends each call in a request of its own.
+        responses.calls.reset()
+        with override_options({"hybridcloud.rpc.batch_size": 0}), rpc_batch() as batch:
+            results = [batch.call(user_service.get_first_superuser) for _ in range(2)]
+
+        assert len(responses.calls) == 2
+        assert all(result.result() is None for result in results)
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.REGION)
+    def test_batch_calls_disabled(self) -> None:
+        responses.add(
+            responses.POST,
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/user/get_first_superuser/",
+            content_type="json",
+            body=json.dumps({"meta": {}, "value": None}),
+        )
+
+        user_service = UserService.create_delegation(use_test_client=False)
+        with rpc_batch() as batch:
+            results = [batch.call(user_service.get_first_superuser) for _ in range(2)]
+            # Without the option, calls are made right away with a request each.
+            assert all(result.done() for result in results)
+            assert len(batch) == 0
+
+        assert [call.request.url for call in responses.calls] == [
+            f"{settings.SENTRY_CONTROL_ADDRESS}/api/0/internal/rpc/user/get_first_superuser/"
+        ] * 2
+        assert all(result.result() is None for result in results)
+
+    @override_settings(SILO_MODE=SiloMode.REGION)
+    @override_options(
+        {
+            "hybrid_cloud.rpc.disabled-service-methods": ["user.get_first_superuser"],
+            "hybridcloud.rpc.batch-calls": True,
+        }
+    )
+    def test_batch_disabled_method(self) -> None:
+        user_service = UserService.create_delegation(use_test_client=False)
+        with rpc_batch() as batch:
+            result = batch.call(user_service.get_first_superuser)
+            assert len(batch) == 0
+
+        with pytest.raises(RpcDisabledException):
+            result.result()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from sentry.ingest.consumer.lazy_event import LazyEventPayload, scan_top_level_fields
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        (b'{"type":"error","event_id":"a"}', {"type": "error"}),
+        (b' { "event_id" : "a" , "type" : "transaction" } ', {"type": "transaction"}),
+        (b'{"exception":{"values":[{"type":"ValueError"}]},"type":"error"}', {"type": "error"}),
+        (b'{"message":"\\"type\\": \\"nope\\"","type":"error"}', {"type": "error"}),
+        (b'{"extra":{"a":"}]","b":["{",1,null]},"type":"error"}', {"type": "error"}),
+        (b'{"level":1.5e3,"ok":true,"type":null}', {"type": None}),
+        (b'{"t\\u0079pe":"error"}', {"type": "error"}),
+        (b'{"type":"error","type":"transaction"}', {"type": "error"}),
+        (b'{"event_id":"a"}', {}),
+        (b"{}", {}),
+        (b"[]", None),
+        (b'"type"', None),
+        (b'{"extra":{"a":1},"type"', None),
+        (b'{"extra":{"a":1}', None),
+        (b'{"extra":{"a":"unterminated}', None),
+        (b'{"extra":1 "type":"error"}', None),
+    ],
+)
+def test_scan_top_level_fields(payload: bytes, expected: dict | None) -> None:
+    assert scan_top_level_fields(payload, ("type",)) == expected
+
+
+def test_scan_top_level_fields_max_bytes() -> None:
+    payload = orjson.dumps({"extra": {"a": "b" * 100}, "type": "error"})
+    assert scan_top_level_fields(payload, ("type",)) == {"type": "error"}
+    assert scan_top_level_fields(payload, ("type",), max_bytes=50) is None
+
+
+def test_type_does_not_parse_payload() -> None:
+    event = LazyEventPayload(orjson.dumps({"type": "transaction", "spans": [{"op": "db"}]}))
+    assert event.type == "transaction"
+    assert "data" not in event.__dict__
+
+    assert event.data == {"type": "transaction", "spans": [{"op": "db"}]}
+
+
+@pytest.mark.parametrize("payload", ['{"type": "error"}', b'{"type": "error"}'])
+def test_type(payload: str | bytes) -> None:
+    assert LazyEventPayload(payload).type == "error"
+
+
+def test_type_falls_back_to_parsed_payload() -> None:
+    payload = orjson.dumps({"extra": {"a": "b" * 100_000}, "type": "error"})
+    event = LazyEventPayload(payload)
+    assert event.type == "error"
+    assert "data" in event.__dict__
+
+    event = LazyEventPayload(b'{"message": "hello"}')
+    assert event.type is None
+    assert "data" not in event.__dict__
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import uuid
+from unittest import mock
+
+import pytest
+from arroyo.types import Partition, Topic
+
+from sentry.ingest import deduplication
+from sentry.ingest.deduplication.bloom import BloomFilter, RotatingBloomFilter
+from sentry.ingest.deduplication.cache import DjangoCacheEventDeduplicationStore
+from sentry.ingest.deduplication.redis import RedisEventDeduplicationStore
+from sentry.testutils.helpers.options import override_options
+
+PARTITION = Partition(Topic("ingest-events"), 0)
+
+
+def test_bloom_filter() -> None:
+    bloom_filter = BloomFilter(capacity=10_000, error_rate=0.01)
+    keys = [uuid.uuid4().hex.encode() for _ in range(10_000)]
+    for key in keys:
+        bloom_filter.add(key)
+
+    assert all(key in bloom_filter for key in keys)
+    false_positives = sum(uuid.uuid4().hex.encode() in bloom_filter for _ in range(10_000))
+    assert false_positives < 200
+
+
+def test_rotating_bloom_filter() -> None:
+    bloom_filter = RotatingBloomFilter(capacity=2, error_rate=0.001, max_age=60)
+    bloom_filter.add(b"a")
+    bloom_filter.add(b"b")
+    bloom_filter.add(b"c")
+    assert b"a" in bloom_filter
+    assert b"c" in bloom_filter
+
+    # Once the generation of `c` is full, the generation of `a` and `b` is dropped.
+    bloom_filter.add(b"d")
+    bloom_filter.add(b"e")
+    assert b"a" not in bloom_filter
+    assert b"c" in bloom_filter
+    assert b"e" in bloom_filter
+    assert bloom_filter.added == 5
+
+
+def test_rotating_bloom_filter_max_age() -> None:
+    with mock.patch("time.monotonic", return_value=0):
+        bloom_filter = RotatingBloomFilter(capacity=100, error_rate=0.001, max_age=60)
+        bloom_filter.add(b"a")
+    with mock.patch("time.monotonic", return_value=61):
+        bloom_filter.add(b"b")
+    with mock.patch("time.monotonic", return_value=122):
+        bloom_filter.add(b"c")
+    assert b"a" not in bloom_filter
+    assert b"b" in bloom_filter
+
+
+@pytest.mark.parametrize(
+    "store", [DjangoCacheEventDeduplicationStore(), RedisEventDeduplicationStore(ttl=60)]
+)
+def test_store(store) -> None:
+    event_id = uuid.uuid4().hex
+    assert not store.is_duplicate(1, event_id)
+    store.mark_processed(1, event_id)
+    assert store.is_duplicate(1, event_id)
+    assert not store.is_duplicate(2, event_id)
+
+
+@override_options(
+    {"ingest.deduplication.bloom-front.enabled": True, "ingest.deduplication.bloom-front.warmup": 2}
+)
+def test_bloom_front() -> None:
+    deduplication.reset_partitions()
+    store = DjangoCacheEventDeduplicationStore()
+    event_ids = [uuid.uuid4().hex for _ in range(4)]
+
+    with mock.patch.object(deduplication, "backend", wraps=store) as backend:
+        # The store is consulted until the filter is warm.
+        assert not deduplication.is_duplicate(1, event_ids[0], PARTITION)
+        deduplication.mark_processed(1, event_ids[0], PARTITION)
+        assert deduplication.is_duplicate(1, event_ids[0], PARTITION)
+        assert backend.is_duplicate.call_count == 2
+
+        deduplication.mark_processed(1, event_ids[1], PARTITION)
+        backend.reset_mock()
+
+        # Events the filter hasn't seen are not looked up.
+        assert not deduplication.is_duplicate(1, event_ids[2], PARTITION)
+        assert backend.is_duplicate.call_count == 0
+
+        # Events the filter may have seen are confirmed by the store.
+        assert deduplication.is_duplicate(1, event_ids[1], PARTITION)
+        assert backend.is_duplicate.call_count == 1
+
+        # Other partitions and events consumed in other processes aren't affected.
+        other_partition = Partition(Topic("ingest-events"), 1)
+        assert deduplication.is_duplicate(1, event_ids[1], other_partition)
+        assert deduplication.is_duplicate(1, event_ids[1])
+        assert backend.is_duplicate.call_count == 3
+
+        # Reassigned partitions start over.
+        deduplication.reset_partitions()
+        assert deduplication.is_duplicate(1, event_ids[1], PARTITION)
+        assert backend.is_duplicate.call_count == 4
+
+
+def test_reset_partitions() -> None:
+    deduplication.mark_processed(1, uuid.uuid4().hex, PARTITION)
+    deduplication.mark_processed(1, uuid.uuid4().hex, Partition(Topic("ingest-events"), 1))
+
+    # Filters of revoked partitions aren't kept around.
+    deduplication.reset_partitions()
+    assert not deduplication._partition_filters._filters
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import orjson
 
 from sentry.testutils.cases import APITestCase
+from sentry.testutils.helpers import override_options
 from sentry.testutils.silo import control_silo_test
 
 
@@ -55,6 +56,24 @@ class UserOrganizationIntegationTest(APITestCase):
         response = self.get_success_response(self.user.id)
         assert response.data[0]["organizationId"] == self.organization.id
 
+    def test_multiple_organizations(self):
+        integration = self.create_provider_integration(provider="github")
+        other_organization = self.create_organization(owner=self.user)
+        for organization in (self.organization, other_organization):
+            self.create_organization_integration(
+                organization_id=organization.id, integration_id=integration.id
+            )
+
+        response = self.get_success_response(self.user.id)
+        assert {item["organizationId"] for item in response.data} == {
+            self.organization.id,
+            other_organization.id,
+        }
+
+    @override_options({"hybridcloud.rpc.batch-calls": True})
+    def test_multiple_organizations_batched(self):
+        self.test_multiple_organizations()
+
     def test_billing_users_dont_see_integrations(self):
         integration = self.create_provider_integration(provider="github")
 
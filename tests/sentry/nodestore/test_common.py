@@ -4,6 +4,7 @@ Testsuite of backend-independent nodestore tests. Add your backend to the
 """
 
 from contextlib import nullcontext
+from unittest import mock
 
 import pytest
 
@@ -98,3 +99,43 @@ def test_set_subkeys(ns):
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_set_subkeys_multi(ns):
+    ns.set_subkeys("node_1", {None: {"foo": "old"}, "other": {"foo": "old"}})
+
+    ns.set_subkeys_multi(
+        {
+            "node_1": {None: {"foo": "a"}},
+            "node_2": {None: {"foo": "b"}, "other": {"foo": "c"}},
+        }
+    )
+
+    assert ns.get_multi(["node_1", "node_2"]) == {"node_1": {"foo": "a"}, "node_2": {"foo": "b"}}
+    assert ns.get("node_1", subkey="other") is None
+    assert ns.get("node_2", subkey="other") == {"foo": "c"}
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_get_multi_assembles_blobs(ns):
+    from sentry.eventstore.compressor import deduplicate_nodes
+
+    nodes = {
+        "a" * 32: {"project": 1, "modules": {f"module{i}": "1.0" for i in range(50)}},
+        "b" * 32: {"project": 1, "modules": {f"module{i}": "1.0" for i in range(50)}},
+        "c" * 32: {"project": 1, "foo": "c"},
+    }
+    items, blobs = deduplicate_nodes(
+        {id: {None: dict(data)} for id, data in nodes.items()}, lambda data: data["project"]
+    )
+    assert len(blobs) == 1
+    ns.set_subkeys_multi(blobs)
+    ns.set_subkeys_multi(items)
+    assert "modules" not in ns._decode(ns._get_bytes("a" * 32), subkey=None)
+
+    with mock.patch.object(ns, "_get_bytes_multi", wraps=ns._get_bytes_multi) as get_bytes_multi:
+        assert ns.get_multi(list(nodes)) == nodes
+    # The blob shared by both nodes is fetched once, in a single request.
+    assert get_bytes_multi.call_count == 2
+    assert ns.get("a" * 32) == nodes["a" * 32]
@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 
 from sentry.ratelimits.sliding_windows import (
+    ApproximateRedisSlidingWindowRateLimiter,
     GrantedQuota,
     Quota,
     RedisSlidingWindowRateLimiter,
@@ -71,3 +74,105 @@ def test_basic(limiter):
         )
 
         assert resp == [GrantedQuota(prefix="foo", granted=0, reached_quotas=quotas)]
+
+
+@pytest.fixture
+def approximate_limiter():
+    return ApproximateRedisSlidingWindowRateLimiter(sync_interval_ms=60_000, max_overshoot=0.5)
+
+
+def test_approximate_basic():
+    # Never forces a sync, so all usage is tracked in the local ring buffer.
+    approximate_limiter = ApproximateRedisSlidingWindowRateLimiter(
+        sync_interval_ms=60_000, max_overshoot=1.0
+    )
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=10)]
+
+    for timestamp in range(10):
+        resp = approximate_limiter.check_and_use_quotas(
+            [RequestedQuota(prefix="approx", requested=1, quotas=quotas)],
+            timestamp=TIMESTAMP_OFFSET + timestamp,
+        )
+        assert resp == [GrantedQuota(prefix="approx", granted=1, reached_quotas=[])]
+
+    resp = approximate_limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="approx", requested=1, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET + 9,
+    )
+    assert resp == [GrantedQuota(prefix="approx", granted=0, reached_quotas=quotas)]
+
+    # The window slides locally, without a sync in between.
+    resp = approximate_limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="approx", requested=1, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET + 10,
+    )
+    assert resp == [GrantedQuota(prefix="approx", granted=1, reached_quotas=[])]
+
+
+def test_approximate_syncs_to_redis(approximate_limiter, limiter):
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=10)]
+    request = RequestedQuota(prefix="approx-sync", requested=4, quotas=quotas)
+
+    # Below the overshoot threshold of 5, nothing is flushed yet.
+    approximate_limiter.check_and_use_quotas([request], timestamp=TIMESTAMP_OFFSET)
+    _, grants = limiter.check_within_quotas([request], timestamp=TIMESTAMP_OFFSET)
+    assert grants == [GrantedQuota(prefix="approx-sync", granted=4, reached_quotas=[])]
+
+    # Exceeding the overshoot threshold forces a sync.
+    approximate_limiter.check_and_use_quotas([request], timestamp=TIMESTAMP_OFFSET)
+    _, grants = limiter.check_within_quotas([request], timestamp=TIMESTAMP_OFFSET)
+    assert grants == [GrantedQuota(prefix="approx-sync", granted=2, reached_quotas=quotas)]
+
+
+def test_approximate_sees_other_processes_after_sync(approximate_limiter, limiter):
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=10)]
+
+    approximate_limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="approx-other", requested=1, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET,
+    )
+
+    # Another process consumes most of the quota directly in Redis.
+    limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="approx-other", requested=8, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET,
+    )
+
+    # Until the next sync, the local view is stale and overshoot is tolerated.
+    _, grants = approximate_limiter.check_within_quotas(
+        [RequestedQuota(prefix="approx-other", requested=5, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET,
+    )
+    assert grants == [GrantedQuota(prefix="approx-other", granted=5, reached_quotas=[])]
+
+    approximate_limiter.sync(timestamp=TIMESTAMP_OFFSET)
+
+    _, grants = approximate_limiter.check_within_quotas(
+        [RequestedQuota(prefix="approx-other", requested=5, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET,
+    )
+    assert grants == [GrantedQuota(prefix="approx-other", granted=1, reached_quotas=quotas)]
+
+
+def test_approximate_sync_without_lock(approximate_limiter):
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=10)]
+    request = RequestedQuota(prefix="approx-lock", requested=3, quotas=quotas)
+    approximate_limiter.check_and_use_quotas([request], timestamp=TIMESTAMP_OFFSET)
+
+    probe = RequestedQuota(prefix="approx-lock", requested=10, quotas=quotas)
+    observed = []
+    use_quotas = RedisSlidingWindowRateLimiter.use_quotas
+
+    def flush(self, *args, **kwargs):
+        # Other threads aren't blocked by the flush, and still see the usage being flushed.
+        observed.append(approximate_limiter._lock.locked())
+        _, grants = approximate_limiter.check_within_quotas([probe], timestamp=TIMESTAMP_OFFSET)
+        observed.append(grants[0].granted)
+        return use_quotas(self, *args, **kwargs)
+
+    with mock.patch.object(RedisSlidingWindowRateLimiter, "use_quotas", flush):
+        approximate_limiter.sync(timestamp=TIMESTAMP_OFFSET)
+
+    assert observed == [False, 7]
+    _, grants = approximate_limiter.check_within_quotas([probe], timestamp=TIMESTAMP_OFFSET)
+    assert grants == [GrantedQuota(prefix="approx-lock", granted=7, reached_quotas=quotas)]
@@ -210,6 +210,26 @@ def test_project_config_uses_filter_features(
         assert cfg_client_ips is None
 
 
+@django_db_all
+@region_silo_test
+def test_project_config_drops_repeated_filter_patterns(default_project):
+    default_project.update_option("sentry:error_messages", ["b", "a", "b"])
+    default_project.update_option("sentry:releases", ["1.2.3", "1.2.3"])
+    default_project.update_option("sentry:blacklisted_ips", ["10.0.0.1", "10.0.0.1"])
+    default_project.update_option("sentry:csp_ignored_sources_defaults", False)
+    default_project.update_option("sentry:csp_ignored_sources", ["x.com", "y.com", "x.com"])
+
+    with Feature({"projects:custom-inbound-filters": True}):
+        cfg = get_project_config(default_project).to_dict()
+
+    _validate_project_config(cfg["config"])
+    filter_settings = cfg["config"]["filterSettings"]
+    assert filter_settings["errorMessages"] == {"patterns": ["b", "a"]}
+    assert filter_settings["releases"] == {"releases": ["1.2.3"]}
+    assert filter_settings["clientIps"] == {"blacklistedIps": ["10.0.0.1"]}
+    assert filter_settings["csp"] == {"disallowedSources": ["x.com", "y.com"]}
+
+
 @django_db_all
 @region_silo_test
 @mock.patch("sentry.relay.config.EXPOSABLE_FEATURES", ["organizations:profiling"])
@@ -240,3 +240,41 @@ def test_is_valid_timestamp() -> None:
 
     assert not indexer_cache._is_valid_timestamp(str(stale_ts))
     assert indexer_cache._is_valid_timestamp(str(new_ts))
+
+
+def test_local_cache_tier(use_case_id: str) -> None:
+    tiered_cache = StringIndexerCache(
+        **{**settings.SENTRY_STRING_INDEXER_CACHE_OPTIONS, "local_cache_max_size": 10},
+        partition_key=_PARTITION_KEY,
+    )
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": True,
+            "sentry-metrics.indexer.write-new-cache-namespace": True,
+        }
+    ):
+        cache.clear()
+        namespace = "test"
+        values = {f"{use_case_id}:100:hello": 2, f"{use_case_id}:100:bye": 3}
+        tiered_cache.set_many(namespace, values)
+
+        # Served from the local tier even once the shared cache is gone.
+        cache.clear()
+        assert tiered_cache.get_many(namespace, list(values.keys())) == values
+        assert tiered_cache.get(namespace, f"{use_case_id}:100:hello") == 2
+
+        # Shared cache hits are written through to the local tier.
+        key = f"{use_case_id}:100:shared"
+        indexer_cache.set(namespace, key, 4)
+        assert tiered_cache.get_many(namespace, [key, f"{use_case_id}:100:missing"]) == {
+            key: 4,
+            f"{use_case_id}:100:missing": None,
+        }
+        cache.clear()
+        assert tiered_cache.get(namespace, key) == 4
+
+        tiered_cache.delete_many(namespace, list(values.keys()))
+        assert tiered_cache.get_many(namespace, list(values.keys())) == {
+            f"{use_case_id}:100:hello": None,
+            f"{use_case_id}:100:bye": None,
+        }
@@ -0,0 +1,81 @@
+import pytest
+
+from sentry.sentry_metrics.indexer.base import FetchType, Metadata
+from sentry.sentry_metrics.indexer.mock import MockIndexer
+from sentry.sentry_metrics.indexer.shared_table import SharedStringTable, SharedTableIndexer
+from sentry.sentry_metrics.use_case_id_registry import UseCaseID
+
+pytestmark = pytest.mark.sentry_metrics
+
+
+@pytest.fixture
+def table():
+    table = SharedStringTable.create(num_slots=64)
+    yield table
+    table.close()
+
+
+def test_get_set(table: SharedStringTable) -> None:
+    assert table.get("transactions:1:a") is None
+    assert table.set("transactions:1:a", 10)
+    assert table.get("transactions:1:a") == 10
+    assert table.get("transactions:2:a") is None
+
+    # IDs never change, so the first write wins.
+    assert table.set("transactions:1:a", 11)
+    assert table.get("transactions:1:a") == 10
+
+
+def test_attach_shares_entries(table: SharedStringTable) -> None:
+    other = SharedStringTable.attach(table.name)
+    try:
+        table.set("transactions:1:a", 10)
+        assert other.get("transactions:1:a") == 10
+
+        other.set("transactions:1:b", 11)
+        assert table.get_many(["transactions:1:a", "transactions:1:b", "missing"]) == {
+            "transactions:1:a": 10,
+            "transactions:1:b": 11,
+        }
+    finally:
+        other.close()
+
+
+def test_full_table(table: SharedStringTable) -> None:
+    dropped = table.set_many({f"transactions:1:{i}": i for i in range(100)})
+    assert dropped >= 100 - table.num_slots
+    assert len(table.get_many(f"transactions:1:{i}" for i in range(100))) == 100 - dropped
+
+
+def test_corrupted_slot_is_a_miss(table: SharedStringTable) -> None:
+    table.set("transactions:1:a", 10)
+    for offset in range(16, len(table._buf), 32):
+        if table._buf[offset : offset + 16] != b"\x00" * 16:
+            # Overwrite the ID without updating the checksum.
+            table._buf[offset + 16] = 99
+    assert table.get("transactions:1:a") is None
+
+
+def test_shared_table_indexer(table: SharedStringTable) -> None:
+    indexer = SharedTableIndexer(table, MockIndexer())
+    strings = {UseCaseID.TRANSACTIONS: {1: {"a", "b"}}}
+
+    results = indexer.bulk_record(strings)
+    ids = results[UseCaseID.TRANSACTIONS][1]
+    assert results.get_fetch_metadata()[UseCaseID.TRANSACTIONS][1] == {
+        "a": Metadata(id=ids["a"], fetch_type=FetchType.FIRST_SEEN),
+        "b": Metadata(id=ids["b"], fetch_type=FetchType.FIRST_SEEN),
+    }
+
+    # Another process attached to the same table gets the IDs without going
+    # through its own indexer.
+    other = SharedTableIndexer(SharedStringTable.attach(table.name), MockIndexer())
+    try:
+        results = other.bulk_record(strings)
+        assert results[UseCaseID.TRANSACTIONS][1] == ids
+        assert results.get_fetch_metadata()[UseCaseID.TRANSACTIONS][1] == {
+            "a": Metadata(id=ids["a"], fetch_type=FetchType.CACHE_HIT),
+            "b": Metadata(id=ids["b"], fetch_type=FetchType.CACHE_HIT),
+        }
+    finally:
+        other.table.close()
@@ -45,6 +45,44 @@ class RedisScriptMinHashIndexBackendTestCase(TestCase):
         result = self.index.export("example", [("index", 2)], timestamp=timestamp)
         assert len(result) == 1
 
+    def test_record_many(self):
+        timestamp = int(time.time())
+        # Entries are spread over several intervals of the index.
+        entries = [
+            ("1", [("index", "hello world")], timestamp - 60 * 60 * 3),
+            ("2", [("index", "yellow world"), ("index", "mellow world")], timestamp),
+            ("2", [("other", "jello")], timestamp - 60 * 60),
+            ("3", [], timestamp),
+            ("4", [("index", "")], timestamp),
+        ]
+
+        for key, items, entry_timestamp in entries:
+            self.index.record("individual", key, items, timestamp=entry_timestamp)
+        self.index.record_many("batched", entries)
+
+        def get_keys(scope):
+            client = self.index.cluster
+            return {
+                key.replace(b"{%s}" % scope.encode(), b""): client.ttl(key)
+                for key in client.keys(b"sim:{%s}:*" % scope.encode())
+            }
+
+        individual = get_keys("individual")
+        batched = get_keys("batched")
+        # The same frequencies and interval buckets, with the same expiry.
+        assert individual.keys() == batched.keys()
+        for key, ttl in individual.items():
+            assert abs(batched[key] - ttl) <= 5
+
+        items = [(idx, key) for idx in ("index", "other") for key, _, _ in entries]
+        assert [
+            msgpack.unpackb(r)[0] for r in self.index.export("individual", items, timestamp)
+        ] == [msgpack.unpackb(r)[0] for r in self.index.export("batched", items, timestamp)]
+
+        assert self.index.compare("batched", "1", [("index", 0)]) == self.index.compare(
+            "individual", "1", [("index", 0)]
+        )
+
     def test_basic(self):
         self.index.record("example", "1", [("index", "hello world")])
         self.index.record("example", "2", [("index", "hello world")])
@@ -0,0 +1,40 @@
+from unittest import mock
+
+from sentry.similarity import features
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.datetime import before_now
+
+
+class FeatureSetTestCase(TestCase):
+    def store_message(self, message, fingerprint, **kwargs):
+        return self.store_event(
+            data={
+                "message": message,
+                "fingerprint": [fingerprint],
+                "timestamp": before_now(**kwargs).isoformat(),
+            },
+            project_id=self.project.id,
+        )
+
+    def test_record_many(self):
+        events = [
+            self.store_message("This is message #1.", "group1", minutes=30),
+            self.store_message("This is message #2.", "group1", minutes=20),
+            self.store_message("This is message #3.", "group2", minutes=5),
+        ]
+
+        with mock.patch.object(features, "index") as index:
+            for event in events:
+                features.record([event])
+            features.record_many(events)
+
+        # Every event is recorded at its own timestamp, like with `record`.
+        recorded = [
+            (call.args[1], call.args[2], call.kwargs["timestamp"])
+            for call in index.record.call_args_list
+        ]
+        assert index.record_many.call_count == 1
+        assert index.record_many.call_args.args == (str(self.project.id), recorded)
+        assert [timestamp for _, _, timestamp in recorded] == [
+            int(event.datetime.timestamp()) for event in events
+        ]
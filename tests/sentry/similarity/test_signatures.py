@@ -24,3 +24,20 @@ def test_signatures() -> None:
     estimation = results[True] / float(sum(results.values()))
 
     assert similarity == pytest.approx(estimation, 0.1)
+
+
+def test_bulk_signatures() -> None:
+    get_signature = MinHashSignatureBuilder(16, 0xFFFF)
+    feature_sets = [
+        {"foo", "bar", "baz"},
+        "hello world",
+        ["foo"],
+        {"bar", "qux"},
+    ]
+    assert get_signature.bulk(feature_sets) == [
+        get_signature(features) for features in feature_sets
+    ]
+    assert get_signature.bulk([]) == []
+
+    with pytest.raises(ValueError):
+        get_signature.bulk([["foo"], []])
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 from django.test import override_settings
 
+from sentry.hybridcloud.rpc.caching.impl import _scope_items
 from sentry.silo.base import SiloLimit, SiloMode
 from sentry.tasks.base import instrumented_task, retry
 
@@ -41,6 +42,16 @@ def exclude_on_exception_task(param):
     raise Exception(param)
 
 
+@instrumented_task(name="test.tasks.test_base.scoped_task", use_silo_cache_scope=True)
+def scoped_task():
+    return _scope_items() is not None
+
+
+@instrumented_task(name="test.tasks.test_base.unscoped_task")
+def unscoped_task():
+    return _scope_items() is not None
+
+
 @override_settings(SILO_MODE=SiloMode.REGION)
 def test_task_silo_limit_call_region():
     result = region_task("hi")
@@ -115,3 +126,9 @@ def test_task_silo_limit_celery_task_methods(method_name):
     method = getattr(region_task, method_name)
     with pytest.raises(SiloLimit.AvailabilityError):
         method("hi")
+
+
+def test_task_silo_cache_scope():
+    assert scoped_task()
+    assert not unscoped_task()
+    assert _scope_items() is None
@@ -9,7 +9,7 @@ from sentry.digests.backends.redis import RedisBackend
 from sentry.digests.notifications import event_to_record
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.rule import Rule
-from sentry.tasks.digests import deliver_digest
+from sentry.tasks.digests import deliver_digest, deliver_digests
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now
 from sentry.testutils.skips import requires_snuba
@@ -77,3 +77,39 @@ class DeliverDigestTest(TestCase):
     def test_no_records(self):
         # This shouldn't error if no records are present
         deliver_digest(f"mail:p:{self.project.id}:IssueOwners:")
+
+
+class DeliverDigestsTest(TestCase):
+    def test_delivers_ready_timelines(self):
+        with mock.patch.object(sentry, "digests") as digests:
+            backend = RedisBackend()
+            digests.backend.digest_many = backend.digest_many
+
+            rule = Rule.objects.create(project=self.project, label="Test Rule", data={})
+            events = [
+                self.store_event(
+                    data={"timestamp": before_now(days=1).isoformat(), "fingerprint": [group]},
+                    project_id=self.project.id,
+                )
+                for group in ("group-1", "group-2")
+            ]
+            keys = [
+                f"mail:p:{self.project.id}:IssueOwners::AllMembers",
+                f"mail:p:{self.project.id}:Member:{self.user.id}",
+            ]
+            for key in keys:
+                for event in events:
+                    backend.add(
+                        key, event_to_record(event, [rule]), increment_delay=0, maximum_delay=0
+                    )
+
+            with self.tasks():
+                deliver_digests(keys + [f"mail:p:{self.project.id}:IssueOwners:"])
+
+        assert len(mail.outbox) == 2
+        assert all("2 new alerts since" in message.subject for message in mail.outbox)
+
+    def test_missing_project(self):
+        with mock.patch.object(sentry, "digests") as digests:
+            deliver_digests(["mail:p:0:IssueOwners:"])
+            digests.backend.delete.assert_called_once_with("mail:p:0:IssueOwners:")
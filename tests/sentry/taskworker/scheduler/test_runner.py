@@ -119,7 +119,7 @@ def test_schedulerunner_tick_one_task_spawned(
     run_storage.read_many.return_value = {
         "test:valid": datetime(2025, 1, 24, 14, 19, 55),
     }
-    run_storage.set.return_value = True
+    run_storage.set_many.return_value = {"test:valid": (True, None)}
 
     namespace = taskregistry.get("test")
     with freeze_time("2025-01-24 14:25:00"), patch.object(namespace, "send_task") as mock_send:
@@ -127,9 +127,11 @@ def test_schedulerunner_tick_one_task_spawned(
         assert sleep_time == 300
         assert mock_send.call_count == 1
 
-    assert run_storage.set.call_count == 1
-    # set() is called with the correct next_run time
-    run_storage.set.assert_called_with("test:valid", datetime(2025, 1, 24, 14, 30, 0, tzinfo=UTC))
+    assert run_storage.set_many.call_count == 1
+    # set_many() is called with the correct next_run time
+    run_storage.set_many.assert_called_with(
+        {"test:valid": datetime(2025, 1, 24, 14, 30, 0, tzinfo=UTC)}
+    )
 
 
 @pytest.mark.django_db
@@ -333,5 +335,56 @@ def test_schedulerunner_tick_fast_and_slow(
         ]
 
 
+@pytest.mark.django_db
+def test_schedulerunner_tick_batches_due_tasks(
+    taskregistry: TaskRegistry, run_storage: RunStorage
+) -> None:
+    schedule_set = ScheduleRunner(registry=taskregistry, run_storage=run_storage)
+    schedule_set.add({"task": "test:valid", "schedule": timedelta(minutes=5)})
+    schedule_set.add({"task": "test:second", "schedule": crontab(minute="*/2")})
+
+    namespace = taskregistry.get("test")
+    with (
+        patch.object(namespace, "send_task") as mock_send,
+        patch.object(run_storage, "set_many", wraps=run_storage.set_many) as mock_set_many,
+        patch.object(run_storage, "read_many", wraps=run_storage.read_many) as mock_read_many,
+    ):
+        with freeze_time("2025-01-24 14:24:00"):
+            sleep_time = schedule_set.tick()
+            assert sleep_time == 120
+
+        # Both tasks were due together, and are recorded with one call.
+        assert extract_sent_tasks(mock_send) == ["second", "valid"]
+        assert mock_set_many.call_count == 1
+        assert mock_read_many.call_count == 1
+
+        # Nothing is due, storage is not touched.
+        with freeze_time("2025-01-24 14:25:00"):
+            sleep_time = schedule_set.tick()
+            assert sleep_time == 60
+        assert mock_set_many.call_count == 1
+        assert mock_read_many.call_count == 1
+
+
+@pytest.mark.django_db
+def test_run_storage_set_many(run_storage: RunStorage) -> None:
+    with freeze_time("2025-01-24 14:25:00"):
+        assert run_storage.set("test:valid", timezone.now() + timedelta(minutes=5))
+
+    with freeze_time("2025-01-24 14:26:00"):
+        results = run_storage.set_many(
+            {
+                "test:valid": timezone.now() + timedelta(minutes=5),
+                "test:second": timezone.now() + timedelta(minutes=2),
+            }
+        )
+
+    assert results == {
+        "test:valid": (False, datetime(2025, 1, 24, 14, 25, 0, tzinfo=UTC)),
+        "test:second": (True, datetime(2025, 1, 24, 14, 26, 0, tzinfo=UTC)),
+    }
+    assert run_storage.read("test:second") == datetime(2025, 1, 24, 14, 26, 0, tzinfo=UTC)
+
+
 def extract_sent_tasks(mock: Mock) -> list[str]:
     return [call[0][0].taskname for call in mock.call_args_list]
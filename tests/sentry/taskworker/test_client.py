@@ -53,6 +53,15 @@ class MockServiceMethod:
             raise res.response
         return res.response
 
+    def future(self, *args, **kwargs):
+        """Capture calls and return the registered mock as a future"""
+        res = self.responses[0]
+        self.responses = self.responses[1:] + [res]
+
+        if isinstance(res.response, Exception):
+            return res.response
+        return MockFuture(res.response)
+
     def with_call(self, *args, **kwargs):
         res = self.responses[0]
         if res.metadata:
@@ -62,6 +71,14 @@ class MockServiceMethod:
         return (res.response, None)
 
 
+@dataclasses.dataclass
+class MockFuture:
+    response: Any
+
+    def result(self):
+        return self.response
+
+
 class MockChannel:
     def __init__(self):
         self._responses = defaultdict(list)
@@ -306,6 +323,91 @@ def test_update_task_not_found():
         assert result is None
 
 
+@django_db_all
+def test_get_tasks():
+    channel = MockChannel()
+    for task_id in ("abc123", "def456"):
+        channel.add_response(
+            "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+            GetTaskResponse(
+                task=TaskActivation(
+                    id=task_id,
+                    namespace="testing",
+                    taskname="do_thing",
+                    parameters="",
+                    headers={},
+                    processing_deadline_duration=10,
+                )
+            ),
+        )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.NOT_FOUND, "no pending task found"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        result = client.get_tasks(3)
+
+        assert [task.id for task in result] == ["abc123", "def456"]
+        assert set(client._task_id_to_host) == {"abc123", "def456"}
+
+
+@django_db_all
+def test_get_tasks_failure():
+    channel = MockChannel()
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.INTERNAL, "something bad"),
+    )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.NOT_FOUND, "no pending task found"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        with pytest.raises(grpc.RpcError):
+            client.get_tasks(2)
+
+
+@django_db_all
+def test_update_tasks():
+    channel = MockChannel()
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/SetTaskStatus", SetTaskStatusResponse()
+    )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/SetTaskStatus",
+        MockGrpcError(grpc.StatusCode.NOT_FOUND, "no pending tasks found"),
+    )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/SetTaskStatus",
+        MockGrpcError(grpc.StatusCode.UNAVAILABLE, "broker unavailable"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        client._task_id_to_host = {
+            "abc123": "localhost-0:50051",
+            "def456": "localhost-0:50051",
+            "ghi789": "localhost-0:50051",
+        }
+        errors = client.update_tasks(
+            [
+                ("abc123", TASK_ACTIVATION_STATUS_COMPLETE),
+                ("def456", TASK_ACTIVATION_STATUS_RETRY),
+                ("ghi789", TASK_ACTIVATION_STATUS_COMPLETE),
+                ("unknown", TASK_ACTIVATION_STATUS_COMPLETE),
+            ]
+        )
+
+        assert list(errors) == ["ghi789"]
+        assert errors["ghi789"].code() == grpc.StatusCode.UNAVAILABLE
+        # The failed update can be retried against the same broker.
+        assert client._task_id_to_host == {"ghi789": "localhost-0:50051"}
+
+
 @django_db_all
 def test_client_loadbalance():
     channel_0 = MockChannel()
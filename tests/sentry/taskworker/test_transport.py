@@ -0,0 +1,95 @@
+import multiprocessing
+import queue
+
+import pytest
+
+from sentry.taskworker.transport import FanInQueue, FanOutQueue, RingBuffer
+
+
+def test_ring_buffer_fifo() -> None:
+    ring = RingBuffer(64)
+    assert ring.get() is None
+
+    assert ring.put(b"hello")
+    assert ring.put(b"")
+    assert ring.put(b"world")
+    assert len(ring) == 3
+
+    assert ring.get() == b"hello"
+    assert ring.get() == b""
+    assert ring.get() == b"world"
+    assert ring.get() is None
+    assert len(ring) == 0
+
+
+def test_ring_buffer_full_and_wraparound() -> None:
+    ring = RingBuffer(32)
+    # Each record takes an 8 byte header plus its payload.
+    assert ring.put(b"a" * 12)
+    assert not ring.put(b"b" * 12)
+    assert ring.get() == b"a" * 12
+
+    # Writes now wrap around the end of the buffer.
+    for i in range(10):
+        payload = bytes([i]) * (5 + i % 7)
+        assert ring.put(payload)
+        assert ring.get() == payload
+
+    with pytest.raises(ValueError):
+        ring.put(b"c" * 32)
+
+
+def test_ring_buffer_torn_record() -> None:
+    ring = RingBuffer(64)
+    assert ring.put(b"hello")
+    # Corrupt the payload as if its write was not visible yet.
+    ring._buf[32 + 8] = ord("j")
+    assert ring.get() is None
+    ring._buf[32 + 8] = ord("h")
+    assert ring.get() == b"hello"
+
+
+def _produce(writer, count: int) -> None:
+    for i in range(count):
+        writer.put(i)
+
+
+def test_fan_in_across_processes() -> None:
+    fan_in: FanInQueue[int] = FanInQueue(
+        2, 64, lambda i: i.to_bytes(4, "little"), lambda b: int.from_bytes(b, "little")
+    )
+    context = multiprocessing.get_context("fork")
+    children = [
+        context.Process(target=_produce, args=(fan_in.writer(slot), 100)) for slot in range(2)
+    ]
+    for child in children:
+        child.start()
+
+    items = [fan_in.get(timeout=5) for _ in range(200)]
+    for child in children:
+        child.join()
+
+    assert sorted(items) == sorted(list(range(100)) * 2)
+    with pytest.raises(queue.Empty):
+        fan_in.get_nowait()
+
+    # Items put by the parent itself are returned as well.
+    fan_in.put(42)
+    assert fan_in.get_nowait() == 42
+
+
+def test_fan_out_balances_children() -> None:
+    fan_out: FanOutQueue[bytes] = FanOutQueue(2, 4, 64, bytes, bytes)
+    for payload in (b"a", b"b", b"c", b"d"):
+        fan_out.put(payload, timeout=0)
+
+    assert fan_out.full()
+    assert fan_out.qsize() == 4
+    with pytest.raises(queue.Full):
+        fan_out.put(b"e", timeout=0)
+
+    readers = [fan_out.reader(0), fan_out.reader(1)]
+    assert sorted(reader.get(timeout=0) for reader in readers) == [b"a", b"b"]
+    assert sorted(reader.get(timeout=0) for reader in readers) == [b"c", b"d"]
+    with pytest.raises(queue.Empty):
+        readers[0].get(timeout=0.01)
@@ -127,6 +127,34 @@ class TestTaskWorker(TestCase):
                 task_id=SIMPLE_TASK.id, status=TASK_ACTIVATION_STATUS_COMPLETE, fetch_next_task=None
             )
 
+    def test_run_once_shm_transport(self) -> None:
+        max_runtime = 5
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=1,
+            concurrency=2,
+            transport="shm",
+        )
+        with mock.patch.object(taskworker, "client") as mock_client:
+            mock_client.get_task.return_value = SIMPLE_TASK
+            mock_client.update_task.return_value = None
+
+            taskworker.start_result_thread()
+            start = time.time()
+            while True:
+                taskworker.run_once()
+                if mock_client.update_task.called:
+                    break
+                if time.time() - start > max_runtime:
+                    taskworker.shutdown()
+                    raise AssertionError("Timeout waiting for update_task to be called")
+
+            taskworker.shutdown()
+            mock_client.update_task.assert_called_with(
+                task_id=SIMPLE_TASK.id, status=TASK_ACTIVATION_STATUS_COMPLETE, fetch_next_task=None
+            )
+
     def test_run_once_with_next_task(self) -> None:
         # Cover the scenario where update_task returns the next task which should
         # be processed.
@@ -200,6 +228,59 @@ class TestTaskWorker(TestCase):
             assert mock_client.get_task.called
             assert mock_client.update_task.call_count == 3
 
+    def test_run_once_batched(self) -> None:
+        max_runtime = 5
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            fetch_batch_size=4,
+            result_batch_size=2,
+            result_batch_timeout=0.1,
+        )
+        with mock.patch.object(taskworker, "client") as mock_client:
+            tasks = [
+                TaskActivation(
+                    id=str(i),
+                    taskname="examples.simple_task",
+                    namespace="examples",
+                    parameters='{"args": [], "kwargs": {}}',
+                    processing_deadline_duration=2,
+                )
+                for i in range(3)
+            ]
+
+            def get_tasks_response(count, namespace):
+                if mock_client.get_tasks.call_count == 1:
+                    return tasks
+                return []
+
+            mock_client.get_tasks.side_effect = get_tasks_response
+            mock_client.update_tasks.return_value = {}
+            taskworker.start_result_thread()
+
+            # Run until all tasks have been processed
+            start = time.time()
+            while True:
+                taskworker.run_once()
+                delivered = [
+                    task_id
+                    for call in mock_client.update_tasks.call_args_list
+                    for task_id, _ in call.args[0]
+                ]
+                if len(delivered) >= 3:
+                    break
+                if time.time() - start > max_runtime:
+                    taskworker.shutdown()
+                    raise AssertionError("Timeout waiting for update_tasks to be called")
+
+            taskworker.shutdown()
+            assert not mock_client.get_task.called
+            assert not mock_client.update_task.called
+            assert sorted(delivered) == ["0", "1", "2"]
+            assert mock_client.get_tasks.call_args_list[0].args == (4, None)
+            assert all(len(call.args[0]) <= 2 for call in mock_client.update_tasks.call_args_list)
+
     def test_run_once_current_task_state(self) -> None:
         # Run a task that uses retry_task() helper
         # to raise and catch a NoRetriesRemainingError
@@ -337,3 +418,79 @@ def test_child_worker_at_most_once() -> None:
     result = processed.get(block=False)
     assert result.task_id == SIMPLE_TASK.id
     assert result.status == TASK_ACTIVATION_STATUS_COMPLETE
+
+
+@pytest.mark.django_db
+def test_child_worker_processing_deadline() -> None:
+    todo: queue.Queue[TaskActivation] = queue.Queue()
+    processed: queue.Queue[ProcessingResult] = queue.Queue()
+    shutdown = Event()
+
+    todo.put(
+        TaskActivation(
+            id="slow",
+            taskname="examples.timed",
+            namespace="examples",
+            parameters='{"args": [3], "kwargs": {}}',
+            processing_deadline_duration=1,
+        )
+    )
+    with pytest.raises(SystemExit):
+        child_worker(todo, processed, shutdown, max_task_count=1)
+
+    result = processed.get(block=False)
+    assert result.task_id == "slow"
+    assert result.status == TASK_ACTIVATION_STATUS_FAILURE
+    assert current_task() is None
+
+
+def _threaded_task(task_id: str, sleep_seconds: float, deadline: int = 2) -> TaskActivation:
+    return TaskActivation(
+        id=task_id,
+        taskname="examples.threaded_timed",
+        namespace="examples-threaded",
+        parameters=f'{{"args": [{sleep_seconds}], "kwargs": {{}}}}',
+        processing_deadline_duration=deadline,
+    )
+
+
+@pytest.mark.django_db
+def test_child_worker_threaded() -> None:
+    todo: queue.Queue[TaskActivation] = queue.Queue()
+    processed: queue.Queue[ProcessingResult] = queue.Queue()
+    shutdown = Event()
+
+    for i in range(4):
+        todo.put(_threaded_task(str(i), 0.5))
+
+    start = time.monotonic()
+    child_worker(todo, processed, shutdown, max_task_count=4)
+
+    # The activations ran concurrently.
+    assert time.monotonic() - start < 1.5
+    assert todo.empty()
+    results = [processed.get(block=False) for _ in range(4)]
+    assert sorted(result.task_id for result in results) == ["0", "1", "2", "3"]
+    assert all(result.status == TASK_ACTIVATION_STATUS_COMPLETE for result in results)
+
+
+@pytest.mark.django_db
+def test_child_worker_threaded_deadline() -> None:
+    todo: queue.Queue[TaskActivation] = queue.Queue()
+    processed: queue.Queue[ProcessingResult] = queue.Queue()
+    shutdown = Event()
+
+    todo.put(_threaded_task("slow", 2.0, deadline=1))
+    todo.put(_threaded_task("fast", 0.1))
+    child_worker(todo, processed, shutdown, max_task_count=1)
+
+    result = processed.get(block=False)
+    assert result.task_id == "fast"
+    assert result.status == TASK_ACTIVATION_STATUS_COMPLETE
+
+    # The slow activation is given up on once its deadline passes, and
+    # its late completion is not reported.
+    result = processed.get(block=False)
+    assert result.task_id == "slow"
+    assert result.status == TASK_ACTIVATION_STATUS_FAILURE
+    assert processed.empty()
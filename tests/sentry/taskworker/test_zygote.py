@@ -0,0 +1,65 @@
+import os
+import time
+from multiprocessing import get_context
+from unittest import mock
+
+from sentry.taskworker.zygote import Zygote
+
+mp_context = get_context("fork")
+
+
+def test_zygote_spawn() -> None:
+    ready = mp_context.Queue()
+
+    def target(slot: int) -> None:
+        ready.put((slot, os.getpid(), os.getppid()))
+        time.sleep(60)
+
+    zygote = Zygote(target)
+    zygote.start()
+    try:
+        children = [zygote.spawn(slot) for slot in range(2)]
+        reports = sorted(ready.get(timeout=5) for _ in children)
+
+        assert [slot for slot, _, _ in reports] == [0, 1]
+        assert {pid for _, pid, _ in reports} == {child.pid for child in children}
+        # Children are forked from the zygote, not from this process.
+        assert {ppid for _, _, ppid in reports} != {os.getpid()}
+        assert all(child.is_alive() for child in children)
+
+        children[0].terminate()
+        children[0].join(timeout=5)
+        assert not children[0].is_alive()
+        assert children[1].is_alive()
+
+        children[1].terminate()
+        children[1].join(timeout=5)
+    finally:
+        zygote.stop()
+    assert not zygote.is_alive()
+
+
+def test_zygote_child_exits() -> None:
+    zygote = Zygote(lambda slot: None)
+    zygote.start()
+    try:
+        child = zygote.spawn(0)
+        child.join(timeout=5)
+        assert not child.is_alive()
+    finally:
+        zygote.stop()
+
+
+def test_zygote_child_exit_reported() -> None:
+    zygote = Zygote(lambda slot: None)
+    zygote.start()
+    try:
+        child = zygote.spawn(0)
+        # Liveness comes from the exits the zygote reports, so a process that
+        # reused the pid isn't mistaken for the child.
+        with mock.patch("os.kill"):
+            child.join(timeout=5)
+            assert child.exited
+            assert not child.is_alive()
+    finally:
+        zygote.stop()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest import mock
 
 import pytest
 
-from sentry.stacktraces.processing import find_stacktraces_in_data, get_crash_frame_from_event_data
+from sentry.stacktraces.processing import (
+    StacktraceProcessor,
+    find_stacktraces_in_data,
+    get_crash_frame_from_event_data,
+    process_stacktraces,
+)
 from sentry.testutils.cases import TestCase
 
 
@@ -170,3 +176,128 @@ class FindStacktracesTest(TestCase):
 )
 def test_get_crash_frame(event):
     assert get_crash_frame_from_event_data(event)["marco"] == "polo"
+
+
+class UppercaseProcessor(StacktraceProcessor):
+    dedupe_frames = True
+
+    def __init__(self, data, stacktrace_infos):
+        super().__init__(data, stacktrace_infos, project=mock.Mock())
+        self.batches: list[list[str]] = []
+
+    def handles_frame(self, frame, stacktrace_info):
+        return "function" in frame
+
+    def preprocess_frame(self, processable_frame):
+        processable_frame.set_cache_key_from_values([processable_frame["function"]])
+
+    def process_frames(self, processable_frames, processing_task):
+        self.batches.append([frame["function"] for frame in processable_frames])
+        return super().process_frames(processable_frames, processing_task)
+
+    def process_frame(self, processable_frame, processing_task):
+        if processable_frame["function"] == "crash":
+            raise ValueError("crash")
+        frame = dict(processable_frame.frame, function=processable_frame["function"].upper())
+        return [frame], [processable_frame.frame], []
+
+
+@pytest.mark.parametrize("dedupe_frames", [False, True])
+def test_process_stacktraces_batched(dedupe_frames):
+    def thread(*functions):
+        return {"stacktrace": {"frames": [{"function": f, "lineno": 1} for f in functions]}}
+
+    data: dict[str, Any] = {
+        "project": 1,
+        "threads": {"values": [thread("a", "b", "a"), thread("a", "crash", "c")]},
+    }
+    # A frame with the same cache key which is not identical to the others
+    data["threads"]["values"][1]["stacktrace"]["frames"][0]["lineno"] = 2
+
+    processors = []
+
+    def make_processors(data, infos):
+        processor = UppercaseProcessor(data, infos)
+        processor.dedupe_frames = dedupe_frames
+        processors.append(processor)
+        return processors
+
+    with mock.patch("sentry.stacktraces.processing.cache") as cache:
+        cache.get_many.return_value = {}
+        assert process_stacktraces(data, make_processors=make_processors) is data
+
+    # All frames are processed in a single batch.
+    if dedupe_frames:
+        assert processors[0].batches == [["a", "b", "a", "crash", "c"]]
+    else:
+        assert processors[0].batches == [["a", "b", "a", "a", "crash", "c"]]
+
+    threads = data["threads"]["values"]
+    assert [f["function"] for f in threads[0]["stacktrace"]["frames"]] == ["A", "B", "A"]
+    assert [f["function"] for f in threads[1]["stacktrace"]["frames"]] == ["A", "crash", "C"]
+    assert threads[1]["stacktrace"]["frames"][0]["lineno"] == 2
+    # Results are copied to duplicate frames rather than shared.
+    assert threads[0]["stacktrace"]["frames"][0] is not threads[0]["stacktrace"]["frames"][2]
+    assert [f["function"] for f in threads[0]["raw_stacktrace"]["frames"]] == ["a", "b", "a"]
+
+
+def _exceptions_data():
+    return {
+        "project": 1,
+        "exception": {
+            "values": [
+                {"type": t, "stacktrace": {"frames": [{"function": t.lower()}]}} for t in ("A", "B")
+            ]
+        },
+    }
+
+
+def test_process_stacktraces_exception_then_frames():
+    calls = []
+
+    class RecordingProcessor(StacktraceProcessor):
+        def __init__(self, data, stacktrace_infos):
+            super().__init__(data, stacktrace_infos, project=mock.Mock())
+
+        def handles_frame(self, frame, stacktrace_info):
+            return True
+
+        def process_exception(self, exception):
+            calls.append(exception["type"])
+            return False
+
+        def process_frame(self, processable_frame, processing_task):
+            calls.append(processable_frame["function"])
+
+    with mock.patch("sentry.stacktraces.processing.cache") as cache:
+        cache.get_many.return_value = {}
+        process_stacktraces(
+            _exceptions_data(),
+            make_processors=lambda data, infos: [RecordingProcessor(data, infos)],
+        )
+
+    # Without batching, each exception is processed right before its frames.
+    assert calls == ["A", "a", "B", "b"]
+
+
+def test_process_stacktraces_batched_exceptions_before_frames():
+    calls = []
+
+    class RecordingProcessor(UppercaseProcessor):
+        def process_exception(self, exception):
+            calls.append(exception["type"])
+            return False
+
+        def process_frames(self, processable_frames, processing_task):
+            calls.append("frames")
+            return super().process_frames(processable_frames, processing_task)
+
+    with mock.patch("sentry.stacktraces.processing.cache") as cache:
+        cache.get_many.return_value = {}
+        process_stacktraces(
+            _exceptions_data(),
+            make_processors=lambda data, infos: [RecordingProcessor(data, infos)],
+        )
+
+    # With batching, all exceptions are processed before the frames.
+    assert calls == ["A", "B", "frames"]
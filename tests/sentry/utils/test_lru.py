@@ -0,0 +1,61 @@
+from unittest import mock
+
+import pytest
+
+from sentry.utils.lru import LRUCache
+
+
+def test_get_set():
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_max_bytes():
+    cache: LRUCache[str, str] = LRUCache(
+        max_size=10, max_bytes=10, sizeof=lambda key, value: len(value)
+    )
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+    assert cache.get("a") == "12345"
+    cache.set("c", "1")
+    assert cache.get_many(["a", "b", "c"]) == {"a": "12345", "c": "1"}
+
+    # Entries larger than the whole cache are not kept.
+    cache.set("a", "12345678901")
+    assert cache.get_many(["a", "b", "c"]) == {"c": "1"}
+
+
+def test_max_bytes_max_size():
+    cache: LRUCache[str, str] = LRUCache(
+        max_size=2, max_bytes=100, sizeof=lambda key, value: len(value)
+    )
+    cache.set("a", "1")
+    cache.set("b", "1")
+    cache.set("c", "1")
+    assert cache.get_many(["a", "b", "c"]) == {"b": "1", "c": "1"}
+
+
+def test_max_bytes_requires_sizeof():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=10, max_bytes=10)
+
+
+def test_ttl():
+    cache: LRUCache[str, int] = LRUCache(max_size=10)
+    with mock.patch("sentry.utils.lru.time.monotonic", return_value=100.0):
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2)
+
+    with mock.patch("sentry.utils.lru.time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+
+    with mock.patch("sentry.utils.lru.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
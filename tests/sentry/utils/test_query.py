@@ -12,6 +12,7 @@ from sentry.utils.query import (
     RangeQuerySetWrapperWithProgressBar,
     RangeQuerySetWrapperWithProgressBarApprox,
     bulk_delete_objects,
+    bulk_delete_objects_after,
 )
 
 
@@ -126,3 +127,28 @@ class BulkDeleteObjectsTest(TestCase):
         result = bulk_delete_objects(UserReport, id__in=[r.id for r in records], limit=5)
         assert result, "Still more work to do"
         assert len(UserReport.objects.all()) == 5
+
+    def test_keyset(self):
+        records = [
+            self.create_userreport(project=self.project, event_id=str(i) * 32) for i in range(10)
+        ]
+        ids = sorted(r.id for r in records)
+
+        deleted, last_id = bulk_delete_objects_after(
+            UserReport, project_id=self.project.id, limit=4
+        )
+        assert (deleted, last_id) == (4, ids[3])
+        assert sorted(UserReport.objects.values_list("id", flat=True)) == ids[4:]
+
+        deleted, last_id = bulk_delete_objects_after(
+            UserReport, after_id=last_id, project_id=self.project.id, limit=4
+        )
+        assert (deleted, last_id) == (4, ids[7])
+
+        deleted, last_id = bulk_delete_objects_after(
+            UserReport, after_id=ids[8], project_id=self.project.id, limit=4
+        )
+        assert (deleted, last_id) == (1, ids[9])
+        assert list(UserReport.objects.values_list("id", flat=True)) == [ids[8]]
+
+        assert bulk_delete_objects_after(UserReport, after_id=ids[9], id__in=ids) == (0, None)
@@ -20,6 +20,8 @@ from sentry.models.grouprelease import GroupRelease
 from sentry.models.release import Release
 from sentry.models.userreport import UserReport
 from sentry.similarity import _make_index_backend, features
+from sentry.similarity.backends.redis import RedisScriptMinHashIndexBackend
+from sentry.similarity.signatures import MinHashSignatureBuilder
 from sentry.tasks.merge import merge_groups
 from sentry.tasks.unmerge import (
     get_caches,
@@ -27,6 +29,7 @@ from sentry.tasks.unmerge import (
     get_fingerprint,
     get_group_backfill_attributes,
     get_group_creation_attributes,
+    repair_denormalizations,
     unmerge,
 )
 from sentry.testutils.cases import SnubaTestCase, TestCase
@@ -593,3 +596,42 @@ class UnmergeTestCase(TestCase, SnubaTestCase):
         )
         assert destination_similar_items[1][0] == source.id
         assert destination_similar_items[1][1]["message:message:character-shingles"] < 1.0
+
+    @with_feature("projects:similarity-indexing")
+    def test_repair_denormalizations_similarity(self):
+        events = [
+            self.store_event(
+                data={
+                    "message": f"This is message #{i}.",
+                    "fingerprint": ["group1"],
+                    "timestamp": before_now(minutes=minutes).isoformat(),
+                },
+                project_id=self.project.id,
+            )
+            for i, minutes in enumerate((30, 20, 5))
+        ]
+
+        client = redis.clusters.get("default").get_local_client(0)
+
+        def record(namespace, record_events):
+            # Events a few minutes apart end up in different intervals of this index.
+            index = RedisScriptMinHashIndexBackend(
+                client, namespace, MinHashSignatureBuilder(16, 0xFFFF), 8, 60, 60, 5000
+            )
+            with patch.object(features, "index", new=index):
+                record_events()
+            return {
+                key.replace(namespace.encode(), b""): client.ttl(key)
+                for key in client.keys(namespace.encode() + b":*")
+            }
+
+        individual = record("sim:individual", lambda: [features.record([e]) for e in events])
+        unmerged = record(
+            "sim:unmerged", lambda: repair_denormalizations(get_caches(), self.project, events)
+        )
+
+        # The same interval buckets as recording events one by one, with the same expiry.
+        assert individual.keys() == unmerged.keys()
+        assert len({key for key in individual if b":m:" in key}) > 1
+        for key, ttl in individual.items():
+            assert abs(unmerged[key] - ttl) <= 5